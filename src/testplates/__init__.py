@@ -3,6 +3,8 @@ __all__ = (
     "Value",
     "Boundary",
     "Validator",
+    "ErrorRecord",
+    "CacheInfo",
     "LiteralMissing",
     "LiteralAny",
     "LiteralWildcard",
@@ -11,6 +13,9 @@ __all__ = (
     "Field",
     "Structure",
     "Codec",
+    "TemplateIndex",
+    "StructureTable",
+    "StructureRow",
     "MISSING",
     "ANY",
     "WILDCARD",
@@ -18,14 +23,18 @@ __all__ = (
     "UNLIMITED",
     "struct",
     "create",
+    "compact",
     "init",
     "verify",
     "modify",
     "value_of",
     "fields",
     "items",
+    "match_many",
     "attach_codec",
     "field",
+    "create_index",
+    "create_table",
     "contains",
     "has_size",
     "has_minimum_size",
@@ -47,6 +56,13 @@ __all__ = (
     "sequence_validator",
     "mapping_validator",
     "union_validator",
+    "compile_validator",
+    "intern_validator",
+    "memoize_validator",
+    "cache_info",
+    "to_enum_member",
+    "check_data",
+    "check_paths",
     "encode",
     "decode",
     "get_codec",
@@ -57,6 +73,7 @@ __all__ = (
     "UnexpectedValueError",
     "ProhibitedValueError",
     "InvalidStructureError",
+    "CompactSubclassError",
     "MissingBoundaryError",
     "InvalidSizeError",
     "UnlimitedRangeError",
@@ -67,8 +84,14 @@ __all__ = (
     "InaccessibleCodecError",
     "AmbiguousCodecChoiceError",
     "DefaultCodecAlreadySetError",
+    "InvalidCacheSizeError",
+    "InvalidEvictionPolicyError",
+    "InvalidErrorLimitError",
+    "InvalidBatchSizeError",
+    "InvalidEnumValidatorError",
     "InvalidTypeValueError",
     "InvalidTypeError",
+    "InvalidEnumValueError",
     "ProhibitedBoolValueError",
     "InvalidMinimumValueError",
     "InvalidMaximumValueError",
@@ -84,6 +107,9 @@ __all__ = (
     "InvalidKeyError",
     "InvalidDataFormatError",
     "ChoiceValidationError",
+    "NoMatchingChoiceError",
+    "MultipleValidationError",
+    "PathValidationError",
 )
 
 # Annotations
@@ -105,10 +131,24 @@ from testplates.structure import (
     Structure,
 )
 
+from testplates.validators import (
+    ErrorRecord,
+    CacheInfo,
+)
+
 from testplates.codecs import (
     Codec,
 )
 
+from testplates.indexes import (
+    TemplateIndex,
+)
+
+from testplates.tables import (
+    StructureTable,
+    StructureRow,
+)
+
 # Concretes
 
 from testplates.value import (
@@ -122,12 +162,14 @@ from testplates.value import (
 from testplates.structure import (
     struct,
     create,
+    compact,
     init,
     verify,
     modify,
     value_of,
     fields,
     items,
+    match_many,
     attach_codec,
     field,
 )
@@ -140,6 +182,14 @@ from testplates.codecs import (
     set_default_codec,
 )
 
+from testplates.indexes import (
+    create_index,
+)
+
+from testplates.tables import (
+    create_table,
+)
+
 from testplates.constraints import (
     contains,
     has_size,
@@ -165,6 +215,13 @@ from testplates.validators import (
     sequence_validator,
     mapping_validator,
     union_validator,
+    compile_validator,
+    intern_validator,
+    memoize_validator,
+    cache_info,
+    to_enum_member,
+    check_data,
+    check_paths,
 )
 
 from testplates.exceptions import (
@@ -173,6 +230,7 @@ from testplates.exceptions import (
     UnexpectedValueError,
     ProhibitedValueError,
     InvalidStructureError,
+    CompactSubclassError,
     MissingBoundaryError,
     InvalidSizeError,
     UnlimitedRangeError,
@@ -183,8 +241,14 @@ from testplates.exceptions import (
     InaccessibleCodecError,
     AmbiguousCodecChoiceError,
     DefaultCodecAlreadySetError,
+    InvalidCacheSizeError,
+    InvalidEvictionPolicyError,
+    InvalidErrorLimitError,
+    InvalidBatchSizeError,
+    InvalidEnumValidatorError,
     InvalidTypeValueError,
     InvalidTypeError,
+    InvalidEnumValueError,
     ProhibitedBoolValueError,
     InvalidMinimumValueError,
     InvalidMaximumValueError,
@@ -200,4 +264,7 @@ from testplates.exceptions import (
     InvalidKeyError,
     InvalidDataFormatError,
     ChoiceValidationError,
+    NoMatchingChoiceError,
+    MultipleValidationError,
+    PathValidationError,
 )
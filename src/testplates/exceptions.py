@@ -3,6 +3,7 @@ __all__ = (
     "MissingValueError",
     "UnexpectedValueError",
     "InvalidStructureError",
+    "CompactSubclassError",
     "ProhibitedValueError",
     "MissingBoundaryError",
     "InvalidSizeError",
@@ -14,8 +15,14 @@ __all__ = (
     "InaccessibleCodecError",
     "AmbiguousCodecChoiceError",
     "DefaultCodecAlreadySetError",
+    "InvalidCacheSizeError",
+    "InvalidEvictionPolicyError",
+    "InvalidErrorLimitError",
+    "InvalidBatchSizeError",
+    "InvalidEnumValidatorError",
     "InvalidTypeValueError",
     "InvalidTypeError",
+    "InvalidEnumValueError",
     "ProhibitedBoolValueError",
     "InvalidMinimumValueError",
     "InvalidMaximumValueError",
@@ -31,6 +38,9 @@ __all__ = (
     "InvalidKeyError",
     "InvalidDataFormatError",
     "ChoiceValidationError",
+    "NoMatchingChoiceError",
+    "MultipleValidationError",
+    "PathValidationError",
 )
 
 from testplates.impl.exceptions import (
@@ -39,6 +49,7 @@ from testplates.impl.exceptions import (
     UnexpectedValueError,
     ProhibitedValueError,
     InvalidStructureError,
+    CompactSubclassError,
     MissingBoundaryError,
     InvalidSizeError,
     UnlimitedRangeError,
@@ -49,8 +60,14 @@ from testplates.impl.exceptions import (
     InaccessibleCodecError,
     AmbiguousCodecChoiceError,
     DefaultCodecAlreadySetError,
+    InvalidCacheSizeError,
+    InvalidEvictionPolicyError,
+    InvalidErrorLimitError,
+    InvalidBatchSizeError,
+    InvalidEnumValidatorError,
     InvalidTypeValueError,
     InvalidTypeError,
+    InvalidEnumValueError,
     ProhibitedBoolValueError,
     InvalidMinimumValueError,
     InvalidMaximumValueError,
@@ -66,4 +83,7 @@ from testplates.impl.exceptions import (
     InvalidKeyError,
     InvalidDataFormatError,
     ChoiceValidationError,
+    NoMatchingChoiceError,
+    MultipleValidationError,
+    PathValidationError,
 )
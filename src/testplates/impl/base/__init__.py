@@ -1,5 +1,6 @@
 __all__ = (
     "get_pattern",
+    "compile_pattern",
     "get_minimum_value",
     "get_maximum_value",
     "get_minimum_size",
@@ -10,17 +11,28 @@ __all__ = (
     "fits_maximum_value",
     "fits_minimum_size",
     "fits_maximum_size",
+    "get_below_minimum",
+    "get_above_maximum",
     "extract_errors",
     "extract_fields",
     "extract_values",
+    "extract_matcher",
     "extract_codecs",
+    "init_values",
+    "create_compact_type",
     "extract_codec_metadata",
     "extract_default_codec",
     "insert_default_codec",
+    "get_values",
+    "match_value",
     "Field",
     "Structure",
     "StructureMeta",
     "StructureDict",
+    "StructureMatcher",
+    "TemplateIndex",
+    "StructureTable",
+    "StructureRow",
     "Codec",
     "EncodeFunction",
     "DecodeFunction",
@@ -28,25 +40,42 @@ __all__ = (
     "SpecialValueType",
     "UnlimitedType",
     "Limit",
+    "PatternCache",
+    "PATTERN_CACHE",
 )
 
 from .structure import (
     extract_errors,
     extract_fields,
     extract_values,
+    extract_matcher,
     extract_codecs,
+    init_values,
+    create_compact_type,
     extract_codec_metadata,
     extract_default_codec,
     insert_default_codec,
+    get_values,
+    match_value,
     Field,
     Structure,
     StructureMeta,
     StructureDict,
+    StructureMatcher,
     Codec,
     EncodeFunction,
     DecodeFunction,
 )
 
+from .index import (
+    TemplateIndex,
+)
+
+from .table import (
+    StructureTable,
+    StructureRow,
+)
+
 from .value import (
     MissingType,
     SpecialValueType,
@@ -59,6 +88,9 @@ from .limit import (
 
 from .pattern import (
     get_pattern,
+    compile_pattern,
+    PatternCache,
+    PATTERN_CACHE,
 )
 
 from .boundaries import (
@@ -72,4 +104,6 @@ from .boundaries import (
     fits_maximum_value,
     fits_minimum_size,
     fits_maximum_size,
+    get_below_minimum,
+    get_above_maximum,
 )
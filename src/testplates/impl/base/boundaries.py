@@ -9,12 +9,15 @@ __all__ = (
     "fits_maximum_value",
     "fits_minimum_size",
     "fits_maximum_size",
+    "get_below_minimum",
+    "get_above_maximum",
 )
 
 import sys
 
 from typing import (
     Sized,
+    Callable,
     Tuple,
     Union,
     Optional,
@@ -396,3 +399,41 @@ def fits_maximum_size(
     """
 
     return fits_maximum_value(len(value), maximum)
+
+
+def get_below_minimum(
+    minimum: Boundary,
+) -> Optional[Callable[[int], bool]]:
+
+    """
+    Returns function that checks whether value is below the minimum
+    boundary, or None if the minimum boundary is unlimited.
+
+    :param minimum: minimum boundary
+    """
+
+    if minimum is UNLIMITED:
+        return None
+
+    limit = minimum.value
+
+    return limit.__gt__ if minimum.is_inclusive else limit.__ge__
+
+
+def get_above_maximum(
+    maximum: Boundary,
+) -> Optional[Callable[[int], bool]]:
+
+    """
+    Returns function that checks whether value is above the maximum
+    boundary, or None if the maximum boundary is unlimited.
+
+    :param maximum: maximum boundary
+    """
+
+    if maximum is UNLIMITED:
+        return None
+
+    limit = maximum.value
+
+    return limit.__lt__ if maximum.is_inclusive else limit.__le__
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+__all__ = ("TemplateIndex",)
+
+import testplates
+
+from collections import (
+    Counter,
+)
+
+from typing import (
+    Any,
+    Tuple,
+    List,
+    Dict,
+    Iterable,
+    Mapping,
+    Hashable,
+)
+
+from .structure import (
+    extract_matcher,
+    get_values,
+    Structure,
+)
+
+from .value import (
+    MISSING,
+)
+
+Item = Tuple[str, Hashable]
+
+
+class TemplateIndex:
+
+    """
+    Template index class.
+
+    Groups templates by their most discriminating concrete field value,
+    so that only a few candidate templates need to be compared with
+    the record instead of all of them. Templates without any concrete
+    hashable field value are compared with every record.
+    """
+
+    __slots__ = (
+        "_templates",
+        "_buckets",
+        "_unindexed",
+    )
+
+    def __init__(
+        self,
+        templates: Iterable[Structure],
+        /,
+    ) -> None:
+        self._templates: Tuple[Structure, ...] = tuple(templates)
+        self._buckets: Dict[str, Dict[Hashable, List[int]]] = {}
+        self._unindexed: List[int] = []
+
+        templates_items = [get_hashable_items(template) for template in self._templates]
+        counter = Counter(item for items in templates_items for item in items)
+
+        for position, items in enumerate(templates_items):
+            if not items:
+                self._unindexed.append(position)
+                continue
+
+            key, value = min(items, key=counter.__getitem__)
+            bucket = self._buckets.setdefault(key, {})
+            bucket.setdefault(value, []).append(position)
+
+    def __repr__(self) -> str:
+        return f"{testplates.__name__}.{type(self).__name__}({list(self._templates)!r})"
+
+    def __len__(self) -> int:
+        return len(self._templates)
+
+    @property
+    def templates(self) -> Tuple[Structure, ...]:
+
+        """
+        Returns indexed templates.
+        """
+
+        return self._templates
+
+    def lookup(
+        self,
+        record: Mapping[str, Any],
+        /,
+    ) -> List[Structure]:
+
+        """
+        Returns templates that match the record, in the order of indexing.
+
+        :param record: mapping to be matched against templates
+        """
+
+        templates = self._templates
+        positions = list(self._unindexed)
+        get = get_values(record).get
+
+        for key, bucket in self._buckets.items():
+            if (value := get(key, MISSING)) is MISSING:
+                continue
+
+            try:
+                positions.extend(bucket.get(value, ()))
+            except TypeError:
+                for bucket_positions in bucket.values():
+                    positions.extend(bucket_positions)
+
+        positions.sort()
+
+        return [templates[position] for position in positions if templates[position] == record]
+
+
+def get_hashable_items(
+    template: Structure,
+    /,
+) -> List[Item]:
+
+    """
+    Returns template concrete field values that are hashable.
+
+    Constraint objects are not hashable, hence they are never
+    returned together with special values which are not concrete.
+
+    :param template: template to be inspected
+    """
+
+    items: List[Item] = []
+
+    for key, value in extract_matcher(template).items:
+        try:
+            hash(value)
+        except TypeError:
+            continue
+        else:
+            items.append((key, value))
+
+    return items
@@ -8,6 +8,7 @@ __all__ = (
 )
 
 from typing import (
+    Any,
     Literal,
     Final,
 )
@@ -46,6 +47,19 @@ class Limit:
 
         return f"{prefix}{self.name}={self.value}"
 
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Limit):
+            return NotImplemented
+
+        return (
+            self.name == other.name
+            and self.value == other.value
+            and self.is_inclusive == other.is_inclusive
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.name, self.value, self.is_inclusive))
+
     @property
     def alignment(self) -> Literal[0, 1]:
 
@@ -1,13 +1,168 @@
-__all__ = ("get_pattern",)
+__all__ = (
+    "get_pattern",
+    "compile_pattern",
+    "PatternCache",
+    "PATTERN_CACHE",
+)
 
 import re
+import threading
+
+from collections import (
+    OrderedDict,
+)
 
 from typing import (
+    Any,
     AnyStr,
+    Tuple,
     Pattern,
     Optional,
+    Final,
 )
 
+from testplates.impl.exceptions import (
+    InvalidCacheSizeError,
+)
+
+PatternKey = Tuple[type, Any, int]
+
+PATTERN_CACHE_SIZE: Final[int] = 512
+
+
+class PatternCache:
+
+    """
+    Compiled pattern cache class.
+
+    Keeps at most maxsize compiled patterns keyed by pattern
+    text, pattern type and flags, evicting the least recently
+    used pattern when the cache is full. Raises error when
+    maxsize is not a positive integer.
+    """
+
+    __slots__ = (
+        "_maxsize",
+        "_patterns",
+        "_lock",
+        "_hits",
+        "_misses",
+    )
+
+    def __init__(
+        self,
+        maxsize: int = PATTERN_CACHE_SIZE,
+        /,
+    ) -> None:
+        if not isinstance(maxsize, int) or isinstance(maxsize, bool) or maxsize < 1:
+            raise InvalidCacheSizeError(maxsize)
+
+        self._maxsize = maxsize
+        self._patterns: OrderedDict[PatternKey, Pattern[Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(maxsize={self._maxsize}, size={len(self)}, "
+            f"hits={self._hits}, misses={self._misses})"
+        )
+
+    def __len__(self) -> int:
+        return len(self._patterns)
+
+    @property
+    def maxsize(self) -> int:
+
+        """
+        Returns maximum number of cached patterns.
+        """
+
+        return self._maxsize
+
+    @property
+    def hits(self) -> int:
+
+        """
+        Returns number of lookups served from the cache.
+        """
+
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+
+        """
+        Returns number of lookups that required compilation.
+        """
+
+        return self._misses
+
+    def get(
+        self,
+        pattern: AnyStr,
+        flags: int = 0,
+        /,
+    ) -> Pattern[AnyStr]:
+
+        """
+        Returns compiled pattern, compiling it only if it is not cached yet.
+
+        :param pattern: pattern text
+        :param flags: pattern flags
+        """
+
+        key: PatternKey = (type(pattern), pattern, flags)
+
+        with self._lock:
+            if (compiled := self._patterns.get(key, None)) is not None:
+                self._patterns.move_to_end(key)
+                self._hits += 1
+                return compiled
+
+            self._misses += 1
+
+        compiled = re.compile(pattern, flags)
+
+        with self._lock:
+            self._patterns[key] = compiled
+
+            while len(self._patterns) > self._maxsize:
+                self._patterns.popitem(last=False)
+
+        return compiled
+
+    def clear(self) -> None:
+
+        """
+        Removes all cached patterns and resets counters.
+        """
+
+        with self._lock:
+            self._patterns.clear()
+            self._hits = 0
+            self._misses = 0
+
+
+PATTERN_CACHE: Final[PatternCache] = PatternCache()
+
+
+def compile_pattern(
+    pattern: AnyStr,
+    flags: int = 0,
+    /,
+) -> Pattern[AnyStr]:
+
+    """
+    Returns compiled pattern shared through the process-wide pattern cache.
+
+    :param pattern: pattern text
+    :param flags: pattern flags
+    """
+
+    return PATTERN_CACHE.get(pattern, flags)
+
 
 def get_pattern(
     pattern: Optional[AnyStr],
@@ -17,4 +172,4 @@ def get_pattern(
     Returns compiled pattern if string pattern is not None, otherwise None.
     """
 
-    return re.compile(pattern) if pattern is not None else None
+    return compile_pattern(pattern) if pattern is not None else None
@@ -4,7 +4,12 @@ __all__ = (
     "extract_errors",
     "extract_fields",
     "extract_values",
+    "extract_matcher",
+    "get_values",
+    "match_value",
     "extract_codecs",
+    "init_values",
+    "create_compact_type",
     "extract_codec_metadata",
     "extract_default_codec",
     "insert_default_codec",
@@ -12,6 +17,7 @@ __all__ = (
     "Structure",
     "StructureMeta",
     "StructureDict",
+    "StructureMatcher",
     "Codec",
     "EncodeFunction",
     "DecodeFunction",
@@ -32,6 +38,7 @@ from typing import (
     Tuple,
     List,
     Dict,
+    Iterable,
     Iterator,
     Mapping,
     MutableMapping,
@@ -57,11 +64,11 @@ from testplates.impl.exceptions import (
     MissingValueError,
     UnexpectedValueError,
     ProhibitedValueError,
+    CompactSubclassError,
 )
 
 from .value import (
     is_value,
-    values_matches,
     Maybe,
     Validator,
     MISSING,
@@ -77,21 +84,45 @@ _CovariantType = TypeVar("_CovariantType", covariant=True)
 _ContravariantType = TypeVar("_ContravariantType", contravariant=True)
 
 TESTPLATES_ERRORS_ATTR: Final[str] = "_testplates_errors_"
+TESTPLATES_INSTANCE_ERRORS_ATTR: Final[str] = "_testplates_instance_errors_"
 TESTPLATES_FIELDS_ATTR: Final[str] = "_testplates_fields_"
 TESTPLATES_VALUES_ATTR: Final[str] = "_testplates_values_"
+TESTPLATES_MATCHER_ATTR: Final[str] = "_testplates_matcher_"
 TESTPLATES_CODECS_ATTR: Final[str] = "_testplates_codecs_"
 TESTPLATES_CODEC_METADATA_ATTR: Final[str] = "_testplates_codec_metadata_"
 TESTPLATES_DEFAULT_CODEC_ATTR: Final[str] = "_testplates_default_codec_"
+TESTPLATES_SLOTS_ATTR: Final[str] = "_testplates_slots_"
+
+# Prefixes of names that are mangled or used internally, hence cannot be slot names
+RESERVED_PREFIXES: Final[Tuple[str, ...]] = ("__", "_testplates_")
 
 Metadata = Mapping[Type["Structure"], _CovariantType]
 MetadataStorage = MutableMapping[Type["Structure"], _CovariantType]
 
+# name, field, validator, default, default factory, is optional
+FieldRecord = Tuple[
+    str,
+    "Field[Any]",
+    Optional[Validator],
+    Maybe[Any],
+    Maybe[Callable[[], Any]],
+    bool,
+]
+
 
 def extract_errors(
-    structure_or_structure_type: Union[Structure, Type[Structure]],
+    structure_or_structure_type: Union[Mapping[str, Any], Type[Structure]],
 ) -> List[TestplatesError]:
     errors = getattr(structure_or_structure_type, TESTPLATES_ERRORS_ATTR, [])
 
+    if isinstance(structure_or_structure_type, type):
+        return cast(List[TestplatesError], errors)
+
+    instance_errors = getattr(structure_or_structure_type, TESTPLATES_INSTANCE_ERRORS_ATTR, ())
+
+    if instance_errors:
+        return [*errors, *instance_errors]
+
     return cast(List[TestplatesError], errors)
 
 
@@ -104,13 +135,25 @@ def extract_fields(
 
 
 def extract_values(
-    structure: Structure,
+    structure: Mapping[str, Any],
 ) -> Mapping[str, Any]:
     fields = getattr(structure, TESTPLATES_VALUES_ATTR, {})
 
     return cast(Mapping[str, Any], fields)
 
 
+def extract_matcher(
+    structure: Structure,
+) -> StructureMatcher:
+    matcher = getattr(structure, TESTPLATES_MATCHER_ATTR, None)
+
+    if matcher is None:
+        matcher = StructureMatcher(structure._testplates_plan_, extract_values(structure))
+        setattr(structure, TESTPLATES_MATCHER_ATTR, matcher)
+
+    return cast(StructureMatcher, matcher)
+
+
 def extract_codecs(
     structure_or_structure_type: Union[Structure, Type[Structure]],
 ) -> List[Codec[Any]]:
@@ -345,7 +388,26 @@ class Field(Generic[_CovariantType]):
 
         return self._optional
 
-    # noinspection PyUnboundLocalVariable
+    @property
+    def record(self) -> FieldRecord:
+
+        """
+        Returns field record.
+
+        Record is a flat tuple with all field properties
+        required to validate the value, so that structure
+        initialization does not need to look them up again.
+        """
+
+        return (
+            self._name,
+            self,
+            self._validator,
+            self._default,
+            self._default_factory,
+            self._optional,
+        )
+
     def validate(
         self,
         value: Maybe[_CovariantType],
@@ -358,26 +420,65 @@ class Field(Generic[_CovariantType]):
         :param value: value to be validated
         """
 
-        validator = self.validator
-        default = self.default
-        is_optional = self.is_optional
+        error = validate_value(self, value, self.default, self.validator, self.is_optional)
 
-        if value is ANY:
-            return success(None)
+        if error is not None:
+            return failure(error)
 
-        elif value is MISSING and default is MISSING:
-            return failure(MissingValueError(self))
+        return success(None)
 
-        elif (value is ABSENT or default is ABSENT) and not is_optional:
-            return failure(ProhibitedValueError(self, value))
 
-        elif (value is WILDCARD or default is WILDCARD) and not is_optional:
-            return failure(ProhibitedValueError(self, value))
+# noinspection PyUnboundLocalVariable
+def validate_value(
+    field: Field[_GenericType],
+    value: Maybe[_GenericType],
+    default: Maybe[_GenericType],
+    validator: Optional[Validator],
+    is_optional: bool,
+    /,
+) -> Optional[TestplatesError]:
 
-        elif is_value(value) and validator is not None and not (result := validator(value)):
-            return result
+    """
+    Validates the given value against the field requirements.
 
-        return success(None)
+    Returns validation error or None if value is correct.
+
+    :param field: field to which value belongs
+    :param value: value to be validated
+    :param default: field default value
+    :param validator: field validator function or None
+    :param is_optional: indication whether field is optional or not
+    """
+
+    if value is ANY:
+        return None
+
+    elif value is MISSING and default is MISSING:
+        return MissingValueError(field)
+
+    elif (value is ABSENT or default is ABSENT) and not is_optional:
+        return ProhibitedValueError(field, value)
+
+    elif (value is WILDCARD or default is WILDCARD) and not is_optional:
+        return ProhibitedValueError(field, value)
+
+    elif is_value(value) and validator is not None and not (result := validator(value)):
+        return unwrap_failure(result)
+
+    return None
+
+
+def compile_plan(
+    fields: Mapping[str, Field[Any]],
+) -> Tuple[FieldRecord, ...]:
+
+    """
+    Compiles structure validation plan.
+
+    :param fields: structure fields
+    """
+
+    return tuple(field.record for field in fields.values())
 
 
 class StructureDict(Dict[str, Any]):
@@ -417,6 +518,7 @@ class StructureMeta(abc.ABCMeta):
 
     _testplates_errors_: List[TestplatesError]
     _testplates_fields_: Mapping[str, Field[Any]]
+    _testplates_plan_: Tuple[FieldRecord, ...]
     _testplates_codecs_: List[Codec[Any]]
     _testplates_default_codec_: Optional[Codec[Any]]
 
@@ -426,10 +528,15 @@ class StructureMeta(abc.ABCMeta):
         bases: Tuple[type, ...],
         attrs: StructureDict,
     ) -> None:
+        for base in bases:
+            if getattr(base, TESTPLATES_SLOTS_ATTR, None) is not None:
+                raise CompactSubclassError(base)
+
         super().__init__(name, bases, attrs)
 
         cls._testplates_errors_ = attrs.get(TESTPLATES_ERRORS_ATTR, [])
         cls._testplates_fields_ = attrs.fields
+        cls._testplates_plan_ = compile_plan(attrs.fields)
         cls._testplates_codecs_ = attrs.get(TESTPLATES_CODECS_ATTR, [])
         cls._testplates_default_codec_ = attrs.get(TESTPLATES_DEFAULT_CODEC_ATTR, None)
 
@@ -457,33 +564,30 @@ class Structure(Mapping[str, Any], metaclass=StructureMeta):
     Structure template base class.
     """
 
-    __slots__ = ("_testplates_values_",)
+    __slots__ = (
+        "_testplates_values_",
+        "_testplates_instance_errors_",
+        "_testplates_matcher_",
+    )
 
     _testplates_errors_: ClassVar[List[TestplatesError]]
     _testplates_fields_: ClassVar[Mapping[str, Field[Any]]]
+    _testplates_plan_: ClassVar[Tuple[FieldRecord, ...]]
     _testplates_codecs_: ClassVar[List[Codec[Any]]]
     _testplates_default_codec_: ClassVar[Optional[Codec[Any]]]
 
+    _testplates_instance_errors_: List[TestplatesError]
+
     def __init__(
         self,
         /,
         **values: Any,
     ) -> None:
-        fields = self._testplates_fields_
-        errors = self._testplates_errors_
-
-        for key, value in values.items():
-            if key not in fields.keys():
-                errors.append(UnexpectedValueError(key, value))
-
-        for key, field in fields.items():
-            if not (result := field.validate(values.get(key, MISSING))):
-                errors.append(unwrap_failure(result))
-
-            if (default := field.default) is not MISSING:
-                values.setdefault(key, default)
+        if errors := init_values(self, values):
+            self._testplates_instance_errors_ = errors
 
         self._testplates_values_: Mapping[str, Any] = values
+        self._testplates_matcher_: Optional[StructureMatcher] = None
 
     def __init_subclass__(cls, **kwargs: Any) -> None:
         pass
@@ -501,11 +605,342 @@ class Structure(Mapping[str, Any], metaclass=StructureMeta):
         return len(self._testplates_values_)
 
     def __eq__(self, other: Any) -> bool:
-        for key, field in self._testplates_fields_.items():
-            self_value: Maybe[Any] = self.get(key, MISSING)
-            other_value: Maybe[Any] = other.get(key, MISSING)
+        if (matcher := self._testplates_matcher_) is None:
+            matcher = extract_matcher(self)
+
+        return matcher.matches(other)
+
+
+def init_values(
+    structure_or_structure_type: Union[Structure, Type[Structure]],
+    values: Dict[str, Any],
+    /,
+) -> List[TestplatesError]:
+
+    """
+    Validates structure values and sets default values in place.
+
+    Returns list of errors, empty if all values are correct.
+
+    :param structure_or_structure_type: structure being initialized or its type
+    :param values: structure initialization values
+    """
+
+    fields = structure_or_structure_type._testplates_fields_
+    plan = structure_or_structure_type._testplates_plan_
+    errors: List[TestplatesError] = []
+
+    if not values.keys() <= fields.keys():
+        for key, value in values.items():
+            if key not in fields:
+                errors.append(UnexpectedValueError(key, value))
+
+    for key, field, validator, default, default_factory, is_optional in plan:
+        if default_factory is not MISSING:
+            default = default_factory()
+
+        value = values.get(key, MISSING)
+
+        if value is not ANY:
+            error = validate_value(field, value, default, validator, is_optional)
+
+            if error is not None:
+                errors.append(error)
+
+        if default is not MISSING:
+            values.setdefault(key, default)
+
+    return errors
 
-            if not values_matches(self_value, other_value):
+
+def create_compact_type(
+    structure_type: Type[_Structure],
+    /,
+) -> Type[_Structure]:
+
+    """
+    Creates compact structure type.
+
+    Compact structure type is a subclass of the given structure
+    type that stores values in slots (one slot per field) instead
+    of the values dict. Fields with names that are identifiers are
+    stored in slots of the same name, which replace field descriptors,
+    so that reading field value is a direct slot access. Items, keys
+    and length are read from slots as well, values dict is built
+    on demand, only when all values are requested at once.
+
+    :param structure_type: structure type to be compacted
+    """
+
+    if structure_type.__dict__.get("__init__", None) is init_compact_structure:
+        return structure_type
+
+    name = structure_type.__name__
+    bases = (structure_type,)
+    fields = extract_fields(structure_type)
+
+    attrs = StructureMeta.__prepare__(name, bases)
+    attrs["__module__"] = structure_type.__module__
+    attrs["__qualname__"] = structure_type.__qualname__
+    attrs["__init__"] = init_compact_structure
+    attrs["__getitem__"] = get_compact_item
+    attrs["__iter__"] = iter_compact_keys
+    attrs["__len__"] = count_compact_values
+    attrs[TESTPLATES_VALUES_ATTR] = property(extract_compact_values)
+
+    slots: Dict[str, str] = {}
+
+    for index, key in enumerate(fields):
+        if key.isidentifier() and not key.startswith(RESERVED_PREFIXES) and key not in attrs:
+            slots[key] = key
+        else:
+            slots[key] = f"_testplates_slot_{index}_"
+
+    attrs["__slots__"] = tuple(slots.values())
+    attrs[TESTPLATES_SLOTS_ATTR] = slots
+    attrs.fields.update(fields)
+
+    return cast(Type[_Structure], StructureMeta(name, bases, attrs))
+
+
+def init_compact_structure(
+    self: Structure,
+    /,
+    **values: Any,
+) -> None:
+    errors = init_values(self, values)
+
+    for key, slot in getattr(self, TESTPLATES_SLOTS_ATTR).items():
+        if (value := values.get(key, MISSING)) is not MISSING:
+            setattr(self, slot, value)
+
+    if errors:
+        self._testplates_instance_errors_ = errors
+
+    self._testplates_matcher_ = None
+
+
+def extract_compact_values(
+    self: Structure,
+    /,
+) -> Mapping[str, Any]:
+    values: Dict[str, Any] = {}
+
+    for key, slot in getattr(self, TESTPLATES_SLOTS_ATTR).items():
+        if (value := getattr(self, slot, MISSING)) is not MISSING:
+            values[key] = value
+
+    return values
+
+
+def get_compact_item(
+    self: Structure,
+    item: str,
+    /,
+) -> object:
+    if (value := getattr(self, getattr(self, TESTPLATES_SLOTS_ATTR)[item], MISSING)) is MISSING:
+        raise KeyError(item)
+
+    return value
+
+
+def iter_compact_keys(
+    self: Structure,
+    /,
+) -> Iterator[str]:
+    for key, slot in getattr(self, TESTPLATES_SLOTS_ATTR).items():
+        if hasattr(self, slot):
+            yield key
+
+
+def count_compact_values(
+    self: Structure,
+    /,
+) -> int:
+    return sum(hasattr(self, slot) for slot in getattr(self, TESTPLATES_SLOTS_ATTR).values())
+
+
+class StructureMatcher:
+
+    """
+    Structure matcher class.
+
+    Classifies structure values once, so that matching
+    against other mapping only performs the comparisons
+    that are actually required. Fields with wildcard value
+    are skipped entirely, fields with any value only require
+    other value to be present, fields with absent value only
+    require other value to be either missing or absent, and
+    fields with missing value require other value to be missing.
+    """
+
+    __slots__ = (
+        "present_keys",
+        "absent_keys",
+        "missing_keys",
+        "items",
+    )
+
+    def __init__(
+        self,
+        plan: Tuple[FieldRecord, ...],
+        values: Mapping[str, Any],
+        /,
+    ) -> None:
+        present_keys: List[str] = []
+        absent_keys: List[str] = []
+        missing_keys: List[str] = []
+        items: List[Tuple[str, Any]] = []
+
+        for key, *_ in plan:
+            value = values.get(key, MISSING)
+
+            if value is WILDCARD:
+                continue
+
+            elif value is ANY:
+                present_keys.append(key)
+
+            elif value is ABSENT:
+                absent_keys.append(key)
+
+            elif value is MISSING:
+                missing_keys.append(key)
+
+            else:
+                items.append((key, value))
+
+        self.present_keys: Tuple[str, ...] = tuple(present_keys)
+        self.absent_keys: Tuple[str, ...] = tuple(absent_keys)
+        self.missing_keys: Tuple[str, ...] = tuple(missing_keys)
+        self.items: Tuple[Tuple[str, Any], ...] = tuple(items)
+
+    def matches(
+        self,
+        other: Mapping[str, Any],
+        /,
+    ) -> bool:
+
+        """
+        Returns True if other mapping matches the structure, otherwise False.
+
+        :param other: mapping to be matched against the structure
+        """
+
+        get = get_values(other).get
+
+        for key in self.present_keys:
+            if get(key, MISSING) is MISSING:
+                return False
+
+        for key in self.absent_keys:
+            if not is_absent(get(key, MISSING)):
+                return False
+
+        for key in self.missing_keys:
+            if get(key, MISSING) is not MISSING:
+                return False
+
+        for key, value in self.items:
+            if not value == get(key, MISSING):
                 return False
 
         return True
+
+    def matches_many(
+        self,
+        others: Iterable[Mapping[str, Any]],
+        /,
+    ) -> List[int]:
+
+        """
+        Returns indices of other mappings that match the structure.
+
+        Mappings are matched column by column, i.e. each field is checked
+        against all remaining candidates before moving to the next field,
+        and candidates are dropped as soon as any of their fields mismatch.
+
+        :param others: mappings to be matched against the structure
+        """
+
+        getters = [get_values(other).get for other in others]
+        indices = list(range(len(getters)))
+
+        for key in self.present_keys:
+            indices = [index for index in indices if getters[index](key, MISSING) is not MISSING]
+
+        for key in self.absent_keys:
+            indices = [index for index in indices if is_absent(getters[index](key, MISSING))]
+
+        for key in self.missing_keys:
+            indices = [index for index in indices if getters[index](key, MISSING) is MISSING]
+
+        for key, value in self.items:
+            indices = [index for index in indices if value == getters[index](key, MISSING)]
+
+        return indices
+
+
+def is_absent(
+    value: Any,
+    /,
+) -> bool:
+
+    """
+    Returns True if value is either missing or absent, otherwise False.
+
+    :param value: value to be checked
+    """
+
+    return value is MISSING or value is ABSENT
+
+
+def match_value(
+    value: Any,
+    other_value: Any,
+    /,
+) -> bool:
+
+    """
+    Returns True if other value matches the structure value, otherwise False.
+
+    Classifies structure value the same way as :class:`StructureMatcher`,
+    for matching values that are not kept as structure values dict.
+
+    :param value: structure value or MISSING if value was not set
+    :param other_value: other value or MISSING if value was not set
+    """
+
+    if value is WILDCARD:
+        return True
+
+    if value is ANY:
+        return other_value is not MISSING
+
+    if value is ABSENT:
+        return is_absent(other_value)
+
+    if value is MISSING:
+        return other_value is MISSING
+
+    return bool(value == other_value)
+
+
+def get_values(
+    other: Mapping[str, Any],
+    /,
+) -> Mapping[str, Any]:
+
+    """
+    Returns mapping that gives the fastest access to other values.
+
+    Plain dict is returned as it is, structure is replaced with
+    its values dict to avoid the overhead of Mapping mixin methods.
+
+    :param other: mapping to be accessed
+    """
+
+    if type(other) is not dict and isinstance(other, Structure):
+        return other._testplates_values_
+
+    return other
@@ -0,0 +1,301 @@
+from __future__ import annotations
+
+__all__ = (
+    "StructureTable",
+    "StructureRow",
+)
+
+import array
+import testplates
+
+from typing import (
+    overload,
+    Any,
+    Type,
+    Union,
+    List,
+    Dict,
+    Iterable,
+    Iterator,
+    Mapping,
+    MutableSequence,
+    Optional,
+    Final,
+)
+
+from resultful import (
+    success,
+    failure,
+    Result,
+)
+
+from testplates.impl.utils import (
+    format_like_dict,
+)
+
+from testplates.impl.exceptions import (
+    TestplatesError,
+    InvalidStructureError,
+)
+
+from .structure import (
+    init_values,
+    extract_fields,
+    get_values,
+    match_value,
+    Structure,
+)
+
+from .value import (
+    MISSING,
+)
+
+Column = Union[List[Any], "array.array[Any]"]
+
+# Typecodes of arrays used as columns of values of given type
+ARRAY_TYPECODES: Final[Dict[type, str]] = {
+    int: "q",
+    float: "d",
+}
+
+
+class StructureTable:
+
+    """
+    Structure table class.
+
+    Stores values of many structures of the same structure type
+    in columns, one column per field. Column is kept as an array
+    as long as all of its values are integers (or all of them are
+    floats) that fit into the array, otherwise it is kept as a list.
+    Rows are accessed as lightweight views over the columns.
+    """
+
+    __slots__ = (
+        "_structure_type",
+        "_columns",
+        "_length",
+    )
+
+    def __init__(
+        self,
+        structure_type: Type[Structure],
+        /,
+    ) -> None:
+        self._structure_type = structure_type
+        self._columns: Dict[str, Column] = {key: [] for key in extract_fields(structure_type)}
+        self._length = 0
+
+    def __repr__(self) -> str:
+        parameters = f"{self._structure_type.__name__}, rows={self._length}"
+
+        return f"{testplates.__name__}.{type(self).__name__}({parameters})"
+
+    def __len__(self) -> int:
+        return self._length
+
+    @overload
+    def __getitem__(self, index: int) -> StructureRow:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[StructureRow]:
+        ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[StructureRow, List[StructureRow]]:
+        if isinstance(indices := range(self._length)[index], range):
+            return [StructureRow(self, row_index) for row_index in indices]
+
+        return StructureRow(self, indices)
+
+    def __iter__(self) -> Iterator[StructureRow]:
+        for index in range(self._length):
+            yield StructureRow(self, index)
+
+    @property
+    def structure_type(self) -> Type[Structure]:
+
+        """
+        Returns structure type of the table rows.
+        """
+
+        return self._structure_type
+
+    @property
+    def columns(self) -> Mapping[str, MutableSequence[Any]]:
+
+        """
+        Returns table columns keyed by field name.
+        """
+
+        return self._columns
+
+    def append(
+        self,
+        /,
+        **values: Any,
+    ) -> Result[None, TestplatesError]:
+
+        """
+        Validates values and appends them to the table as a new row.
+
+        :param values: structure initialization values
+        """
+
+        if errors := init_values(self._structure_type, values):
+            return failure(InvalidStructureError(errors))
+
+        columns = self._columns
+
+        for key, column in columns.items():
+            value = values.get(key, MISSING)
+
+            if (new_column := append_value(column, value, self._length)) is not None:
+                columns[key] = new_column
+
+        self._length += 1
+
+        return success(None)
+
+    def extend(
+        self,
+        rows: Iterable[Mapping[str, Any]],
+        /,
+    ) -> Result[None, TestplatesError]:
+
+        """
+        Validates rows and appends them to the table.
+
+        Stops at the first invalid row, keeping the rows
+        that were appended before that row in the table.
+
+        :param rows: structure initialization values of each row
+        """
+
+        append = self.append
+
+        for row in rows:
+            if not (result := append(**row)):
+                return result
+
+        return success(None)
+
+
+def append_value(
+    column: Column,
+    value: Any,
+    length: int,
+    /,
+) -> Optional[Column]:
+
+    """
+    Appends value to the column.
+
+    Returns new column if the column had to be replaced
+    (in order to change column type), otherwise None.
+
+    :param column: column of values
+    :param value: value to be appended
+    :param length: number of values in the column
+    """
+
+    if isinstance(column, array.array):
+        if type(value) is type(column[0]):
+            try:
+                column.append(value)
+            except OverflowError:
+                pass
+            else:
+                return None
+
+        new_column = column.tolist()
+        new_column.append(value)
+
+        return new_column
+
+    if not length and (typecode := ARRAY_TYPECODES.get(type(value), None)) is not None:
+        try:
+            return array.array(typecode, (value,))
+        except OverflowError:
+            pass
+
+    column.append(value)
+
+    return None
+
+
+class StructureRow(Mapping[str, Any]):
+
+    """
+    Structure table row class.
+
+    Lightweight view over the values of the single table row,
+    which behaves like a structure of the table structure type.
+    """
+
+    __slots__ = (
+        "_table",
+        "_index",
+    )
+
+    def __init__(
+        self,
+        table: StructureTable,
+        index: int,
+        /,
+    ) -> None:
+        self._table = table
+        self._index = index
+
+    def __repr__(self) -> str:
+        name = self._table.structure_type.__name__
+
+        return f"{name}({format_like_dict(self._testplates_values_)})"
+
+    def __getitem__(self, item: str) -> Any:
+        if (value := self._table.columns[item][self._index]) is MISSING:
+            raise KeyError(item)
+
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        index = self._index
+
+        for key, column in self._table.columns.items():
+            if column[index] is not MISSING:
+                yield key
+
+    def __len__(self) -> int:
+        index = self._index
+
+        return sum(column[index] is not MISSING for column in self._table.columns.values())
+
+    def __eq__(self, other: Any) -> bool:
+        index = self._index
+        get = get_values(other).get
+
+        for key, column in self._table.columns.items():
+            if not match_value(column[index], get(key, MISSING)):
+                return False
+
+        return True
+
+    @property
+    def index(self) -> int:
+
+        """
+        Returns index of the row in the table.
+        """
+
+        return self._index
+
+    @property
+    def _testplates_values_(self) -> Mapping[str, Any]:
+        index = self._index
+        values: Dict[str, Any] = {}
+
+        for key, column in self._table.columns.items():
+            if (value := column[index]) is not MISSING:
+                values[key] = value
+
+        return values
@@ -24,6 +24,7 @@ from typing import (
     TypeVar,
     Union,
     Callable,
+    FrozenSet,
     Literal,
     Final,
 )
@@ -45,10 +46,13 @@ def is_value(
     Returns True if value is not missing
     or a special value, otherwise False.
 
+    Special values are detected by their type only,
+    so that value's own __eq__ method is never called.
+
     :param value: template value
     """
 
-    return value not in [MISSING, ANY, ABSENT, WILDCARD]
+    return type(value) not in SPECIAL_VALUE_TYPES
 
 
 def values_matches(
@@ -157,3 +161,5 @@ ANY: Final[Literal[SpecialValueType.ANY]] = SpecialValueType.ANY
 WILDCARD: Final[Literal[SpecialValueType.WILDCARD]] = SpecialValueType.WILDCARD
 ABSENT: Final[Literal[SpecialValueType.ABSENT]] = SpecialValueType.ABSENT
 UNLIMITED: Final[Literal[UnlimitedType.UNLIMITED]] = UnlimitedType.UNLIMITED
+
+SPECIAL_VALUE_TYPES: Final[FrozenSet[type]] = frozenset((MissingType, SpecialValueType))
@@ -7,6 +7,7 @@ from typing import (
     TypeVar,
     Generic,
     Container,
+    Final,
 )
 
 from testplates.impl.utils import (
@@ -15,12 +16,17 @@ from testplates.impl.utils import (
 
 _GenericType = TypeVar("_GenericType")
 
+# Minimal number of values for which building a set out of
+# the container is cheaper than scanning container for each value
+SET_THRESHOLD: Final[int] = 4
+
 
 class Contains(Generic[_GenericType]):
 
     __slots__ = (
         "name",
         "values",
+        "use_set",
     )
 
     def __init__(
@@ -31,6 +37,7 @@ class Contains(Generic[_GenericType]):
     ) -> None:
         self.name = name
         self.values = values
+        self.use_set = len(values) >= SET_THRESHOLD and is_hashable(values)
 
     def __repr__(self) -> str:
         return f"{testplates.__name__}.{self.name}({format_like_tuple(self.values)})"
@@ -39,8 +46,33 @@ class Contains(Generic[_GenericType]):
         if not isinstance(other, Container):
             return False
 
+        if self.use_set and isinstance(other, (list, tuple)):
+            try:
+                other = set(other)
+            except TypeError:
+                pass
+
         for value in self.values:
             if value not in other:
                 return False
 
         return True
+
+
+def is_hashable(
+    values: Any,
+    /,
+) -> bool:
+
+    """
+    Returns True if values are hashable, otherwise False.
+
+    :param values: values to be checked
+    """
+
+    try:
+        hash(values)
+    except TypeError:
+        return False
+    else:
+        return True
@@ -6,6 +6,8 @@ from typing import (
     Any,
     TypeVar,
     Generic,
+    FrozenSet,
+    Optional,
 )
 
 from testplates.impl.utils import (
@@ -20,6 +22,7 @@ class IsOneOf(Generic[_GenericType]):
     __slots__ = (
         "name",
         "values",
+        "values_set",
     )
 
     def __init__(
@@ -30,9 +33,21 @@ class IsOneOf(Generic[_GenericType]):
     ) -> None:
         self.name = name
         self.values = values
+        self.values_set: Optional[FrozenSet[_GenericType]] = None
+
+        try:
+            self.values_set = frozenset(values)
+        except TypeError:
+            pass
 
     def __repr__(self) -> str:
         return f"{testplates.__name__}.{self.name}({format_like_tuple(self.values)})"
 
     def __eq__(self, other: Any) -> bool:
+        if (values_set := self.values_set) is not None:
+            try:
+                return other in values_set
+            except TypeError:
+                pass
+
         return other in self.values
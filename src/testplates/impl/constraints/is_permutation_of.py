@@ -2,11 +2,17 @@ __all__ = ("IsPermutationOf",)
 
 import testplates
 
+from collections import (
+    Counter,
+)
+
 from typing import (
     Any,
     TypeVar,
     Generic,
     List,
+    Iterable,
+    Optional,
     Collection,
 )
 
@@ -18,6 +24,8 @@ class IsPermutationOf(Generic[_GenericType]):
     __slots__ = (
         "name",
         "values",
+        "counter",
+        "sorted_values",
     )
 
     def __init__(
@@ -28,6 +36,13 @@ class IsPermutationOf(Generic[_GenericType]):
     ) -> None:
         self.name = name
         self.values = values
+        self.counter: Optional[Counter[_GenericType]] = None
+        self.sorted_values: Optional[List[_GenericType]] = None
+
+        try:
+            self.counter = Counter(values)
+        except TypeError:
+            self.sorted_values = get_sorted_values(values)
 
     def __repr__(self) -> str:
         return f"{testplates.__name__}.{self.name}({self.values!r})"
@@ -39,6 +54,16 @@ class IsPermutationOf(Generic[_GenericType]):
         if len(other) != len(self.values):
             return False
 
+        if (counter := self.counter) is not None:
+            try:
+                return Counter(other) == counter
+            except TypeError:
+                pass
+
+        if (sorted_values := self.sorted_values) is not None:
+            if (other_sorted_values := get_sorted_values(other)) is not None:
+                return other_sorted_values == sorted_values
+
         values = self.values.copy()
 
         for value in other:
@@ -50,3 +75,31 @@ class IsPermutationOf(Generic[_GenericType]):
                 values.pop(index)
 
         return True
+
+
+def get_sorted_values(
+    values: Iterable[Any],
+    /,
+) -> Optional[List[Any]]:
+
+    """
+    Returns sorted values if they are totally ordered, otherwise None.
+
+    Sorted values of two collections are equal if and only if one of
+    the collections is a permutation of the other, but only when each
+    pair of adjacent values is comparable, as partially ordered values
+    (e.g. sets) do not have a single sorted order.
+
+    :param values: values to be sorted
+    """
+
+    try:
+        sorted_values = sorted(values)
+    except TypeError:
+        return None
+
+    for value, next_value in zip(sorted_values, sorted_values[1:]):
+        if not (value < next_value or value == next_value):
+            return None
+
+    return sorted_values
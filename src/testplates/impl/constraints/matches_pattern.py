@@ -1,6 +1,5 @@
 __all__ = ("MatchesPattern",)
 
-import re
 import abc
 import testplates
 
@@ -12,6 +11,10 @@ from typing import (
     Pattern,
 )
 
+from testplates.impl.base import (
+    compile_pattern,
+)
+
 
 class MatchesPattern(Generic[AnyStr], abc.ABC):
 
@@ -28,7 +31,7 @@ class MatchesPattern(Generic[AnyStr], abc.ABC):
         /,
     ) -> None:
         self.name = name
-        self.pattern: Pattern[AnyStr] = re.compile(value)
+        self.pattern: Pattern[AnyStr] = compile_pattern(value)
         self.pattern_type: Type[AnyStr] = type(value)
 
     def __repr__(self) -> str:
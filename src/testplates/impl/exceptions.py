@@ -4,6 +4,7 @@ __all__ = (
     "UnexpectedValueError",
     "ProhibitedValueError",
     "InvalidStructureError",
+    "CompactSubclassError",
     "MissingBoundaryError",
     "InvalidSizeError",
     "UnlimitedRangeError",
@@ -14,8 +15,14 @@ __all__ = (
     "InaccessibleCodecError",
     "AmbiguousCodecChoiceError",
     "DefaultCodecAlreadySetError",
+    "InvalidCacheSizeError",
+    "InvalidEvictionPolicyError",
+    "InvalidErrorLimitError",
+    "InvalidBatchSizeError",
+    "InvalidEnumValidatorError",
     "InvalidTypeValueError",
     "InvalidTypeError",
+    "InvalidEnumValueError",
     "ProhibitedBoolValueError",
     "InvalidMinimumValueError",
     "InvalidMaximumValueError",
@@ -31,8 +38,14 @@ __all__ = (
     "ItemValidationError",
     "FieldValidationError",
     "ChoiceValidationError",
+    "NoMatchingChoiceError",
+    "MultipleValidationError",
+    "PathValidationError",
 )
 
+import reprlib
+import itertools
+
 from enum import (
     Enum,
     EnumMeta,
@@ -44,24 +57,102 @@ from typing import (
     Tuple,
     Union,
     List,
+    Dict,
     Sized,
     Pattern,
+    Optional,
+    Final,
 )
 
 _GenericType = TypeVar("_GenericType")
 
+MAX_REPR_ITEMS: Final[int] = 32
+MAX_REPR_LENGTH: Final[int] = 256
+
+
+class DataRepr(reprlib.Repr):
+
+    """
+    Data repr class.
+
+    Produces reprs of the data embedded in error messages,
+    limited to MAX_REPR_ITEMS items of each container and
+    MAX_REPR_LENGTH characters of each string and other
+    object repr, so that rendering the message does not
+    depend on the size of the data. Unlike reprlib.Repr,
+    keeps dictionary items in their insertion order.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+
+        self.maxtuple = MAX_REPR_ITEMS
+        self.maxlist = MAX_REPR_ITEMS
+        self.maxarray = MAX_REPR_ITEMS
+        self.maxdict = MAX_REPR_ITEMS
+        self.maxset = MAX_REPR_ITEMS
+        self.maxfrozenset = MAX_REPR_ITEMS
+        self.maxdeque = MAX_REPR_ITEMS
+        self.maxstring = MAX_REPR_LENGTH
+        self.maxlong = MAX_REPR_LENGTH
+        self.maxother = MAX_REPR_LENGTH
+
+    def repr_dict(self, x: Dict[Any, Any], level: int) -> str:
+        if not x:
+            return "{}"
+
+        if level <= 0:
+            return "{...}"
+
+        pieces = [
+            f"{self.repr1(key, level - 1)}: {self.repr1(value, level - 1)}"
+            for key, value in itertools.islice(x.items(), self.maxdict)
+        ]
+
+        if len(x) > self.maxdict:
+            pieces.append("...")
+
+        return f"{{{', '.join(pieces)}}}"
+
+
+DATA_REPR: Final[DataRepr] = DataRepr()
+
+
+def truncated_repr(data: Any, /) -> str:
+
+    """
+    Returns repr of the data truncated to the reasonable size.
+
+    :param data: data to be represented
+    """
+
+    return DATA_REPR.repr(data)
+
 
 class TestplatesError(Exception):
 
     """
     Base testplates error.
+
+    Error message is either passed directly or rendered
+    with render() method on the first access, so that
+    errors that are never displayed are created without
+    formatting (potentially large) data they refer to.
     """
 
     def __init__(
         self,
         *message: str,
     ):
-        super().__init__(" ".join(message))
+        super().__init__()
+
+        self._message = " ".join(message) if message else None
+
+    def __str__(self) -> str:
+        return self.message
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.message!r})"
 
     @property
     def message(self) -> str:
@@ -70,7 +161,18 @@ class TestplatesError(Exception):
         Returns error message.
         """
 
-        return "".join(self.args)
+        if self._message is None:
+            self._message = self.render()
+
+        return self._message
+
+    def render(self) -> str:
+
+        """
+        Returns error message rendered from error attributes.
+        """
+
+        return ""
 
 
 class MissingValueError(TestplatesError):
@@ -156,6 +258,27 @@ class InvalidStructureError(TestplatesError):
         )
 
 
+class CompactSubclassError(TestplatesError):
+
+    """
+    Error indicating subclassing of compact structure type.
+
+    Raised when user creates structure type that is
+    a subclass of compact structure type, since values
+    of its fields would have no slots to be stored in.
+    """
+
+    def __init__(
+        self,
+        structure_type: Any,
+    ) -> None:
+        self.structure_type = structure_type
+
+        super().__init__(
+            f"Compact structure type {structure_type.__name__!r} cannot be subclassed",
+        )
+
+
 class MissingBoundaryError(TestplatesError):
 
     """
@@ -376,6 +499,106 @@ class DefaultCodecAlreadySetError(TestplatesError):
         )
 
 
+class InvalidCacheSizeError(TestplatesError):
+
+    """
+    Error indicating invalid cache size value.
+
+    Raised when user sets cache size with
+    value that is not a positive integer.
+    """
+
+    def __init__(
+        self,
+        size: Any,
+    ) -> None:
+        self.size = size
+
+        super().__init__(
+            f"Invalid value for cache size {size!r}",
+        )
+
+
+class InvalidEvictionPolicyError(TestplatesError):
+
+    """
+    Error indicating invalid eviction policy value.
+
+    Raised when user sets cache eviction policy
+    with value that is not a supported policy.
+    """
+
+    def __init__(
+        self,
+        policy: Any,
+    ) -> None:
+        self.policy = policy
+
+        super().__init__(
+            f"Invalid value for eviction policy {policy!r}",
+        )
+
+
+class InvalidErrorLimitError(TestplatesError):
+
+    """
+    Error indicating invalid error limit value.
+
+    Raised when user sets limit of collected
+    errors with value that is not a positive integer.
+    """
+
+    def __init__(
+        self,
+        limit: Any,
+    ) -> None:
+        self.limit = limit
+
+        super().__init__(
+            f"Invalid value for error limit {limit!r}",
+        )
+
+
+class InvalidBatchSizeError(TestplatesError):
+
+    """
+    Error indicating invalid batch size value.
+
+    Raised when user sets size of the batch of
+    candidates with value that is not a positive integer.
+    """
+
+    def __init__(
+        self,
+        size: Any,
+    ) -> None:
+        self.size = size
+
+        super().__init__(
+            f"Invalid value for batch size {size!r}",
+        )
+
+
+class InvalidEnumValidatorError(TestplatesError):
+
+    """
+    Error indicating invalid enum validator.
+
+    Raised when user passed validator which is not
+    an enum validator where enum validator is required.
+    """
+
+    def __init__(
+        self,
+        validator: Any,
+    ) -> None:
+        self.validator = validator
+
+        super().__init__(
+            f"Given validator {validator!r} is not an enum validator",
+        )
+
+
 class InvalidTypeValueError(TestplatesError):
 
     """
@@ -414,11 +637,40 @@ class InvalidTypeError(TestplatesError):
         self.data = data
         self.allowed_types = allowed_types
 
-        super().__init__(
-            f"Invalid type {type(data)!r} of data {data!r} (allowed types: {allowed_types!r})",
+        super().__init__()
+
+    def render(self) -> str:
+        data = truncated_repr(self.data)
+        allowed_types = self.allowed_types
+
+        return (
+            f"Invalid type {type(self.data)!r} of data {data} (allowed types: {allowed_types!r})"
         )
 
 
+class InvalidEnumValueError(TestplatesError):
+
+    """
+    Error indicating invalid enum value.
+
+    Raised when user passes data that is neither
+    a member nor a value of a member of the enum.
+    """
+
+    def __init__(
+        self,
+        data: Any,
+        enum_type: EnumMeta,
+    ) -> None:
+        self.data = data
+        self.enum_type = enum_type
+
+        super().__init__()
+
+    def render(self) -> str:
+        return f"Invalid value {truncated_repr(self.data)} for enum {self.enum_type!r}"
+
+
 class ProhibitedBoolValueError(TestplatesError):
 
     """
@@ -434,9 +686,10 @@ class ProhibitedBoolValueError(TestplatesError):
     ) -> None:
         self.data = data
 
-        super().__init__(
-            f"Prohibited type {bool!r} of data {data!r}",
-        )
+        super().__init__()
+
+    def render(self) -> str:
+        return f"Prohibited type {bool!r} of data {self.data!r}"
 
 
 class InvalidMinimumValueError(TestplatesError):
@@ -456,8 +709,11 @@ class InvalidMinimumValueError(TestplatesError):
         self.data = data
         self.minimum = minimum
 
-        super().__init__(
-            f"Invalid value {data!r} (minimum allowed value: {minimum!r})",
+        super().__init__()
+
+    def render(self) -> str:
+        return (
+            f"Invalid value {truncated_repr(self.data)} (minimum allowed value: {self.minimum!r})"
         )
 
 
@@ -478,8 +734,11 @@ class InvalidMaximumValueError(TestplatesError):
         self.data = data
         self.maximum = maximum
 
-        super().__init__(
-            f"Invalid value {data!r} (maximum allowed value: {maximum!r})",
+        super().__init__()
+
+    def render(self) -> str:
+        return (
+            f"Invalid value {truncated_repr(self.data)} (maximum allowed value: {self.maximum!r})"
         )
 
 
@@ -500,9 +759,13 @@ class InvalidMinimumSizeError(TestplatesError):
         self.data = data
         self.minimum = minimum
 
-        super().__init__(
-            f"Invalid size {len(data)!r} of data {data!r} (minimum allowed size: {minimum!r})",
-        )
+        super().__init__()
+
+    def render(self) -> str:
+        data = truncated_repr(self.data)
+        size = len(self.data)
+
+        return f"Invalid size {size!r} of data {data} (minimum allowed size: {self.minimum!r})"
 
 
 class InvalidMaximumSizeError(TestplatesError):
@@ -522,9 +785,13 @@ class InvalidMaximumSizeError(TestplatesError):
         self.data = data
         self.maximum = maximum
 
-        super().__init__(
-            f"Invalid size {len(data)!r} of data {data!r} (maximum allowed size: {maximum!r})",
-        )
+        super().__init__()
+
+    def render(self) -> str:
+        data = truncated_repr(self.data)
+        size = len(self.data)
+
+        return f"Invalid size {size!r} of data {data} (maximum allowed size: {self.maximum!r})"
 
 
 class InvalidFormatError(TestplatesError):
@@ -544,9 +811,12 @@ class InvalidFormatError(TestplatesError):
         self.data = data
         self.pattern = pattern
 
-        super().__init__(
-            f"Invalid format of data {data!r} (allowed format: {pattern!r})",
-        )
+        super().__init__()
+
+    def render(self) -> str:
+        data = truncated_repr(self.data)
+
+        return f"Invalid format of data {data} (allowed format: {self.pattern!r})"
 
 
 class UniquenessError(TestplatesError):
@@ -565,9 +835,10 @@ class UniquenessError(TestplatesError):
     ) -> None:
         self.data = data
 
-        super().__init__(
-            f"Data {data!r} does not contain unique elements",
-        )
+        super().__init__()
+
+    def render(self) -> str:
+        return f"Data {truncated_repr(self.data)} does not contain unique elements"
 
 
 class InvalidKeyError(TestplatesError):
@@ -587,9 +858,10 @@ class InvalidKeyError(TestplatesError):
         self.key = key
         self.data = data
 
-        super().__init__(
-            f"Invalid key {key!r} found in data {data!r}",
-        )
+        super().__init__()
+
+    def render(self) -> str:
+        return f"Invalid key {truncated_repr(self.key)} found in data {truncated_repr(self.data)}"
 
 
 class InvalidDataFormatError(TestplatesError):
@@ -607,9 +879,10 @@ class InvalidDataFormatError(TestplatesError):
     ) -> None:
         self.data = data
 
-        super().__init__(
-            f"Invalid data format found in data {data!r}",
-        )
+        super().__init__()
+
+    def render(self) -> str:
+        return f"Invalid data format found in data {truncated_repr(self.data)}"
 
 
 class RequiredKeyMissingError(TestplatesError):
@@ -632,9 +905,12 @@ class RequiredKeyMissingError(TestplatesError):
         self.key = key
         self.field = field
 
-        super().__init__(
-            f"Mandatory key {key!r} ({field!r}) missing in data {data!r}",
-        )
+        super().__init__()
+
+    def render(self) -> str:
+        data = truncated_repr(self.data)
+
+        return f"Mandatory key {self.key!r} ({self.field!r}) missing in data {data}"
 
 
 class UnknownFieldError(TestplatesError):
@@ -656,9 +932,13 @@ class UnknownFieldError(TestplatesError):
         self.structure_type = structure_type
         self.key = key
 
-        super().__init__(
-            f"Unknown key {key!r} for structure type {structure_type!r} in {data!r}",
-        )
+        super().__init__()
+
+    def render(self) -> str:
+        key = truncated_repr(self.key)
+        data = truncated_repr(self.data)
+
+        return f"Unknown key {key} for structure type {self.structure_type!r} in {data}"
 
 
 class MemberValidationError(TestplatesError):
@@ -681,9 +961,13 @@ class MemberValidationError(TestplatesError):
         self.member = member
         self.error = error
 
-        super().__init__(
-            f"Member {member!r} validation failure in {enum_type!r}: {error!r}",
-        )
+        super().__init__()
+
+    def render(self) -> str:
+        member = self.member
+        enum_type = self.enum_type
+
+        return f"Member {member!r} validation failure in {enum_type!r}: {self.error!r}"
 
 
 class ItemValidationError(TestplatesError):
@@ -701,14 +985,21 @@ class ItemValidationError(TestplatesError):
         data: Any,
         item: Any,
         error: TestplatesError,
+        *,
+        index: Optional[int] = None,
     ) -> None:
         self.data = data
         self.item = item
         self.error = error
+        self.index = index
 
-        super().__init__(
-            f"Item {item!r} validation failure in {data!r}: {error!r}",
-        )
+        super().__init__()
+
+    def render(self) -> str:
+        item = truncated_repr(self.item)
+        data = truncated_repr(self.data)
+
+        return f"Item {item} validation failure in {data}: {self.error!r}"
 
 
 class FieldValidationError(TestplatesError):
@@ -731,9 +1022,12 @@ class FieldValidationError(TestplatesError):
         self.field = field
         self.error = error
 
-        super().__init__(
-            f"Field {field!r} validation failure in {data!r}: {error!r}",
-        )
+        super().__init__()
+
+    def render(self) -> str:
+        data = truncated_repr(self.data)
+
+        return f"Field {self.field!r} validation failure in {data}: {self.error!r}"
 
 
 class ChoiceValidationError(TestplatesError):
@@ -756,6 +1050,82 @@ class ChoiceValidationError(TestplatesError):
         self.validator = validator
         self.error = error
 
-        super().__init__(
-            f"Choice {validator!r} validation failure in {data!r}: {error!r}",
-        )
+        super().__init__()
+
+    def render(self) -> str:
+        data = truncated_repr(self.data)
+
+        return f"Choice {self.validator!r} validation failure in {data}: {self.error!r}"
+
+
+class NoMatchingChoiceError(TestplatesError):
+
+    """
+    Error indicating that no choice matches the data.
+
+    Raised when untagged union data is not accepted
+    by any of the choices. This exception wraps the
+    data and errors of all choices keyed by choice.
+    """
+
+    def __init__(
+        self,
+        data: Any,
+        errors: Dict[str, TestplatesError],
+    ) -> None:
+        self.data = data
+        self.errors = errors
+
+        super().__init__()
+
+    def render(self) -> str:
+        return f"No choice matches data {truncated_repr(self.data)}: {self.errors!r}"
+
+
+class MultipleValidationError(TestplatesError):
+
+    """
+    Error indicating multiple validation failures.
+
+    Raised when validator collects all errors
+    instead of stopping at the first one. This
+    exception wraps the data and all the errors.
+    """
+
+    def __init__(
+        self,
+        data: Any,
+        errors: List[TestplatesError],
+    ) -> None:
+        self.data = data
+        self.errors = errors
+
+        super().__init__()
+
+    def render(self) -> str:
+        return f"Multiple validation failures in {truncated_repr(self.data)}: {self.errors!r}"
+
+
+class PathValidationError(TestplatesError):
+
+    """
+    Error indicating validation failure at given path.
+
+    Flat counterpart of nested item, field and choice
+    validation errors. This exception wraps only the path
+    of indexes and keys leading from the validated data to
+    the invalid value and the error of that value.
+    """
+
+    def __init__(
+        self,
+        path: Tuple[Any, ...],
+        error: TestplatesError,
+    ) -> None:
+        self.path = path
+        self.error = error
+
+        super().__init__()
+
+    def render(self) -> str:
+        return f"Validation failure at path {self.path!r}: {self.error!r}"
@@ -1,5 +1,9 @@
 __all__ = (
     "is_classinfo",
+    "is_error_limit",
+    "get_check",
+    "compile_validator",
+    "intern_validator",
     "PassthroughValidator",
     "TypeValidator",
     "BooleanValidator",
@@ -10,7 +14,14 @@ __all__ = (
     "SequenceValidator",
     "MappingValidator",
     "UnionValidator",
+    "MemoizedValidator",
+    "CacheInfo",
+    "ErrorRecord",
     "Validator",
+    "ValidatorRegistry",
+    "VALIDATOR_REGISTRY",
+    "EvictionPolicy",
+    "EVICTION_POLICIES",
 )
 
 from .passthrough import (
@@ -50,7 +61,30 @@ from .union import (
     UnionValidator,
 )
 
+from .memo import (
+    MemoizedValidator,
+    CacheInfo,
+    EvictionPolicy,
+    EVICTION_POLICIES,
+)
+
+from .records import (
+    ErrorRecord,
+)
+
 from .utils import (
     is_classinfo,
+    is_error_limit,
+    get_check,
     Validator,
 )
+
+from .compiler import (
+    compile_validator,
+)
+
+from .registry import (
+    intern_validator,
+    ValidatorRegistry,
+    VALIDATOR_REGISTRY,
+)
@@ -0,0 +1,149 @@
+__all__ = ("find_invalid_index",)
+
+import array
+import itertools
+
+from typing import (
+    Any,
+    List,
+    Sequence,
+    FrozenSet,
+    Callable,
+    Optional,
+    Final,
+)
+
+from .utils import (
+    Validator,
+)
+
+from .integer import (
+    IntegerValidator,
+)
+
+from .strings import (
+    TextValidator,
+    StringValidator,
+    BytesValidator,
+)
+
+Predicate = Callable[[int], bool]
+
+INTEGER_FORMATS: Final[FrozenSet[str]] = frozenset("bBhHiIlLqQnN")
+
+INTEGER_TYPES: Final[FrozenSet[type]] = frozenset((int,))
+INTEGER_OR_BOOL_TYPES: Final[FrozenSet[type]] = frozenset((int, bool))
+STRING_TYPES: Final[FrozenSet[type]] = frozenset((str,))
+BYTES_TYPES: Final[FrozenSet[type]] = frozenset((bytes,))
+
+
+def find_invalid_index(
+    data: Sequence[Any],
+    validator: Validator,
+    /,
+) -> Optional[int]:
+
+    """
+    Returns index of the first item that is not known to be accepted
+    by the validator, or None if all items are accepted.
+
+    Bulk checks are available for integer, string and bytes (without
+    pattern) validators. Item types are checked all at once (or taken
+    from typecode of array.array and format of memoryview) and values
+    (or sizes) are compared with boundaries by builtin functions.
+    For other validators 0 is returned, in which case all items
+    have to be validated one by one.
+
+    :param data: sequence of items to be checked
+    :param validator: items validator
+    """
+
+    if type(validator) is IntegerValidator:
+        return find_invalid_integer_index(data, validator)
+
+    if type(validator) is StringValidator:
+        return find_invalid_sized_index(data, validator, STRING_TYPES)
+
+    if type(validator) is BytesValidator:
+        return find_invalid_sized_index(data, validator, BYTES_TYPES)
+
+    return 0
+
+
+def find_invalid_integer_index(
+    data: Sequence[Any],
+    validator: IntegerValidator,
+    /,
+) -> Optional[int]:
+    if not data:
+        return None
+
+    allowed_types = INTEGER_OR_BOOL_TYPES if validator.allow_bool else INTEGER_TYPES
+
+    if isinstance(data, array.array):
+        if data.typecode not in INTEGER_FORMATS:
+            return 0
+
+    elif isinstance(data, memoryview):
+        if data.ndim != 1 or data.format not in INTEGER_FORMATS:
+            return 0
+
+    elif not set(map(type, data)) <= allowed_types:
+        return 0
+
+    return find_out_of_bounds_index(data, validator.below_minimum, validator.above_maximum)
+
+
+def find_invalid_sized_index(
+    data: Sequence[Any],
+    validator: TextValidator,
+    allowed_types: FrozenSet[type],
+    /,
+) -> Optional[int]:
+    if validator.pattern is not None:
+        return 0
+
+    if not data:
+        return None
+
+    if not set(map(type, data)) <= allowed_types:
+        return 0
+
+    sizes = list(map(len, data))
+
+    return find_out_of_bounds_index(sizes, validator.below_minimum, validator.above_maximum)
+
+
+def find_out_of_bounds_index(
+    values: Sequence[int],
+    below_minimum: Optional[Predicate],
+    above_maximum: Optional[Predicate],
+    /,
+) -> Optional[int]:
+
+    """
+    Returns index of the first value that does not fit
+    boundaries, or None if all values fit boundaries.
+
+    :param values: non-empty sequence of integer values
+    :param below_minimum: minimum boundary check or None if unlimited
+    :param above_maximum: maximum boundary check or None if unlimited
+    """
+
+    indexes: List[int] = []
+
+    if below_minimum is not None and below_minimum(min(values)):
+        indexes.append(find_index(values, below_minimum))
+
+    if above_maximum is not None and above_maximum(max(values)):
+        indexes.append(find_index(values, above_maximum))
+
+    return min(indexes, default=None)
+
+
+def find_index(
+    values: Sequence[int],
+    predicate: Predicate,
+    /,
+) -> int:
+    return next(itertools.compress(itertools.count(), map(predicate, values)), 0)
@@ -4,34 +4,32 @@ import testplates
 
 from typing import (
     Any,
+    Tuple,
+    Optional,
     Final,
 )
 
-from resultful import (
-    Result,
-)
-
-from testplates.impl.exceptions import (
-    TestplatesError,
-)
-
 from .utils import (
-    Validator,
+    BaseValidator,
 )
 
-from .type import (
-    TypeValidator,
+from .records import (
+    ErrorRecord,
+    INVALID_TYPE,
 )
 
-boolean_type_validator: Final[Validator] = TypeValidator(bool)
+BOOLEAN_TYPES: Final[Tuple[type, ...]] = (bool,)
 
 
-class BooleanValidator:
+class BooleanValidator(BaseValidator):
 
     __slots__ = ()
 
     def __repr__(self) -> str:
         return f"{testplates.__name__}.boolean_validator()"
 
-    def __call__(self, data: Any, /) -> Result[None, TestplatesError]:
-        return boolean_type_validator(data)
+    def check(self, data: Any, /) -> Optional[ErrorRecord]:
+        if not isinstance(data, bool):
+            return ErrorRecord(INVALID_TYPE, data, BOOLEAN_TYPES)
+
+        return None
@@ -0,0 +1,58 @@
+__all__ = ("compile_validator",)
+
+from typing import (
+    Any,
+)
+
+from resultful import (
+    failure,
+    Result,
+)
+
+from testplates.impl.exceptions import (
+    TestplatesError,
+)
+
+from .utils import (
+    BaseValidator,
+    Validator,
+    SUCCESS,
+    TESTPLATES_CHECK_ATTR,
+)
+
+
+def compile_validator(
+    validator: Validator,
+    /,
+) -> Validator:
+
+    """
+    Compiles validator into function that calls its check directly.
+
+    This is only a shortcut for the validator call dispatch:
+    compiled function binds the check of the validator once
+    and returns the shared success result when validation
+    passes, the check itself is neither specialized nor fused
+    with checks of the nested validators. Compiled function
+    exposes the check, so that it still yields error records
+    with full paths when nested within other validators.
+    Validators that are not known to the compiler
+    (e.g. plain functions) are returned as is.
+
+    :param validator: validator to be compiled
+    """
+
+    if not isinstance(validator, BaseValidator):
+        return validator
+
+    check = validator.check
+
+    def validate(data: Any, /) -> Result[None, TestplatesError]:
+        if (record := check(data)) is None:
+            return SUCCESS
+
+        return failure(record.to_error())
+
+    setattr(validate, TESTPLATES_CHECK_ATTR, check)
+
+    return validate
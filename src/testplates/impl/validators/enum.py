@@ -3,14 +3,22 @@ __all__ = ("EnumValidator",)
 import testplates
 
 from enum import (
+    Enum,
     EnumMeta,
 )
 
 from typing import (
+    cast,
     Any,
+    Tuple,
+    List,
+    Dict,
+    Optional,
 )
 
 from resultful import (
+    success,
+    failure,
     Result,
 )
 
@@ -19,16 +27,36 @@ from testplates.impl.exceptions import (
 )
 
 from .utils import (
+    get_check,
+    BaseValidator,
     Validator,
 )
 
+from .records import (
+    ErrorRecord,
+    INVALID_ENUM_VALUE,
+)
+
+
+class EnumValidator(BaseValidator):
 
-class EnumValidator:
+    """
+    Enum validator class.
+
+    Accepts enum members and, when raw values are accepted,
+    values of enum members as well. Raw values are looked up
+    in the value to member dictionary built upfront instead
+    of being passed through the enum type call.
+    """
 
     __slots__ = (
         "enum_type",
         "enum_type_validator",
         "enum_member_validator",
+        "accept_values",
+        "check_type",
+        "members_by_value",
+        "unhashable_members",
     )
 
     def __init__(
@@ -37,15 +65,74 @@ class EnumValidator:
         *,
         enum_type_validator: Validator,
         enum_member_validator: Validator,
+        accept_values: bool,
     ) -> None:
         self.enum_type = enum_type
         self.enum_type_validator = enum_type_validator
         self.enum_member_validator = enum_member_validator
+        self.accept_values = accept_values
+        self.check_type = get_check(enum_type_validator)
+        self.members_by_value: Dict[Any, Enum] = {}
+        self.unhashable_members: List[Enum] = []
+
+        member: Enum
+
+        for member in enum_type.__members__.values():
+            try:
+                self.members_by_value.setdefault(member.value, member)
+            except TypeError:
+                self.unhashable_members.append(member)
 
     def __repr__(self) -> str:
         parameters = f"{self.enum_type}, {self.enum_member_validator}"
 
         return f"{testplates.__name__}.enum_validator({parameters})"
 
-    def __call__(self, data: Any, /) -> Result[None, TestplatesError]:
-        return self.enum_type_validator(data)
+    @property
+    def key(self) -> Tuple[Any, ...]:
+        return (self.enum_type, self.enum_member_validator, self.accept_values)
+
+    def check(self, data: Any, /) -> Optional[ErrorRecord]:
+        if not self.accept_values:
+            return self.check_type(data)
+
+        if isinstance(data, self.enum_type) or self.get_member(data) is not None:
+            return None
+
+        return ErrorRecord(INVALID_ENUM_VALUE, data, self.enum_type)
+
+    def get_member(self, value: Any, /) -> Optional[Enum]:
+
+        """
+        Returns enum member with given value or None if there is no such member.
+
+        :param value: raw value of the enum member
+        """
+
+        try:
+            return self.members_by_value.get(value, None)
+        except TypeError:
+            pass
+
+        for member in self.unhashable_members:
+            if member.value == value:
+                return member
+
+        return None
+
+    def to_member(self, data: Any, /) -> Result[Enum, TestplatesError]:
+
+        """
+        Returns enum member, converting raw value to the
+        enum member if raw values are accepted by the validator.
+
+        :param data: enum member or raw value of the enum member
+        """
+
+        if isinstance(data, self.enum_type):
+            return success(data)
+
+        if (record := self.check(data)) is not None:
+            return failure(record.to_error())
+
+        return success(cast(Enum, self.get_member(data)))
@@ -5,44 +5,51 @@ import testplates
 from typing import (
     Any,
     Union,
+    Tuple,
+    Optional,
     Final,
 )
 
-from resultful import (
-    success,
-    failure,
-    Result,
-)
-
 from testplates.impl.base import (
-    fits_minimum_value,
-    fits_maximum_value,
+    get_below_minimum,
+    get_above_maximum,
     Limit,
     UnlimitedType,
 )
 
-from testplates.impl.exceptions import (
-    TestplatesError,
-    InvalidMinimumValueError,
-    InvalidMaximumValueError,
-    ProhibitedBoolValueError,
+from .utils import (
+    BaseValidator,
 )
 
-from .type import (
-    TypeValidator,
+from .records import (
+    ErrorRecord,
+    INVALID_TYPE,
+    PROHIBITED_BOOL_VALUE,
+    INVALID_MINIMUM_VALUE,
+    INVALID_MAXIMUM_VALUE,
 )
 
 Boundary = Union[Limit, UnlimitedType]
 
-validate_integer_type: Final = TypeValidator(int)
+INTEGER_TYPES: Final[Tuple[type, ...]] = (int,)
+
 
+class IntegerValidator(BaseValidator):
 
-class IntegerValidator:
+    """
+    Integer validator class.
+
+    Boundaries are turned upfront into comparison functions
+    (or None when unlimited), so that validation performs
+    type check, bool check and boundaries comparisons inline.
+    """
 
     __slots__ = (
         "minimum_value",
         "maximum_value",
         "allow_bool",
+        "below_minimum",
+        "above_maximum",
     )
 
     def __init__(
@@ -55,44 +62,27 @@ class IntegerValidator:
         self.minimum_value = minimum_value
         self.maximum_value = maximum_value
         self.allow_bool = allow_bool
+        self.below_minimum = get_below_minimum(minimum_value)
+        self.above_maximum = get_above_maximum(maximum_value)
 
     def __repr__(self) -> str:
         return f"{testplates.__name__}.integer_validator()"
 
-    def __call__(self, data: Any, /) -> Result[None, TestplatesError]:
-        if not (result := validate_integer_type(data)):
-            return failure(result)
-
-        if not (result := validate_bool_type(data, self.allow_bool)):
-            return failure(result)
-
-        if not (result := validate_boundaries(data, self.minimum_value, self.maximum_value)):
-            return failure(result)
-
-        return success(None)
-
-
-def validate_bool_type(
-    data: int,
-    allow_bool: bool,
-    /,
-) -> Result[None, TestplatesError]:
-    if not allow_bool and isinstance(data, bool):
-        return failure(ProhibitedBoolValueError(data))
+    @property
+    def key(self) -> Tuple[Any, ...]:
+        return (self.minimum_value, self.maximum_value, self.allow_bool)
 
-    return success(None)
+    def check(self, data: Any, /) -> Optional[ErrorRecord]:
+        if not isinstance(data, int):
+            return ErrorRecord(INVALID_TYPE, data, INTEGER_TYPES)
 
+        if not self.allow_bool and isinstance(data, bool):
+            return ErrorRecord(PROHIBITED_BOOL_VALUE, data)
 
-def validate_boundaries(
-    data: int,
-    minimum_value: Boundary,
-    maximum_value: Boundary,
-    /,
-) -> Result[None, TestplatesError]:
-    if not fits_minimum_value(data, minimum_value):
-        return failure(InvalidMinimumValueError(data, minimum_value))
+        if (below_minimum := self.below_minimum) is not None and below_minimum(data):
+            return ErrorRecord(INVALID_MINIMUM_VALUE, data, self.minimum_value)
 
-    if not fits_maximum_value(data, maximum_value):
-        return failure(InvalidMaximumValueError(data, maximum_value))
+        if (above_maximum := self.above_maximum) is not None and above_maximum(data):
+            return ErrorRecord(INVALID_MAXIMUM_VALUE, data, self.maximum_value)
 
-    return success(None)
+        return None
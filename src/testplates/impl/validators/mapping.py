@@ -1,78 +1,147 @@
 __all__ = ("MappingValidator",)
 
 import typing
+import itertools
 import testplates
 
 from typing import (
     Any,
     Type,
+    Tuple,
+    Dict,
+    Iterator,
+    Optional,
     Final,
 )
 
-from resultful import (
-    success,
-    failure,
-    unwrap_failure,
-    Result,
-)
-
 from testplates.impl.base import (
     extract_fields,
+    Field,
     Structure,
 )
 
-from testplates.impl.exceptions import (
-    TestplatesError,
-    RequiredKeyMissingError,
-    UnknownFieldError,
-    FieldValidationError,
-)
-
 from .utils import (
-    Validator,
+    get_check,
+    BaseValidator,
+    Check,
 )
 
-from .type import (
-    TypeValidator,
+from .records import (
+    ErrorRecord,
+    INVALID_TYPE,
+    REQUIRED_KEY_MISSING,
+    UNKNOWN_FIELD,
+    FIELD_VALIDATION,
+    MULTIPLE_VALIDATION,
 )
 
-mapping_type_validator: Final[Validator] = TypeValidator(typing.Mapping)
+MAPPING_TYPES: Final[Tuple[type, ...]] = (typing.Mapping,)
 
 
-class MappingValidator:
+class MappingValidator(BaseValidator):
 
-    __slots__ = ("structure_type",)
+    __slots__ = (
+        "structure_type",
+        "required_fields",
+        "required_keys",
+        "known_keys",
+        "fields_checks",
+        "collect_all",
+        "max_errors",
+    )
 
     def __init__(
         self,
         structure_type: Type[Structure],
         /,
+        *,
+        collect_all: bool,
+        max_errors: Optional[int],
     ) -> None:
+        fields = extract_fields(structure_type)
+
         self.structure_type = structure_type
+        self.required_fields: Tuple[Tuple[str, Field[Any]], ...] = tuple(
+            (key, field) for key, field in fields.items() if not field.is_optional
+        )
+        self.required_keys = frozenset(key for key, _ in self.required_fields)
+        self.known_keys = frozenset(fields.keys())
+        self.fields_checks: Dict[str, Tuple[Field[Any], Check]] = {
+            key: (field, get_check(field.validator))
+            for key, field in fields.items()
+            if field.validator is not None
+        }
+        self.collect_all = collect_all
+        self.max_errors = max_errors
 
     def __repr__(self) -> str:
         return f"{testplates.__name__}.mapping_validator({self.structure_type})"
 
-    def __call__(self, data: Any, /) -> Result[None, TestplatesError]:
-        if not (result := mapping_type_validator(data)):
-            return failure(result)
+    @property
+    def key(self) -> Tuple[Any, ...]:
+        return (self.structure_type, self.collect_all, self.max_errors)
+
+    def check(self, data: Any, /) -> Optional[ErrorRecord]:
+        if not isinstance(data, typing.Mapping):
+            return ErrorRecord(INVALID_TYPE, data, MAPPING_TYPES)
+
+        if self.collect_all:
+            records = list(itertools.islice(self.iter_errors(data), self.max_errors))
+
+            return ErrorRecord(MULTIPLE_VALIDATION, data, records) if records else None
+
+        keys = data.keys()
+
+        if not keys >= self.required_keys:
+            for key, field in self.required_fields:
+                if key not in keys:
+                    return ErrorRecord(REQUIRED_KEY_MISSING, data, key, field, path=(key,))
 
-        structure = self.structure_type
-        fields = extract_fields(structure)
+        if not (known_keys := self.known_keys).issuperset(keys):
+            for key in keys:
+                if key not in known_keys:
+                    return ErrorRecord(UNKNOWN_FIELD, data, self.structure_type, key, path=(key,))
 
-        for field in fields.values():
-            if not field.is_optional and field.name not in data.keys():
-                return failure(RequiredKeyMissingError(data, field.name, field))
+        fields_checks = self.fields_checks
 
         for key, value in data.items():
-            field_object = fields.get(key, None)
+            if (field_check := fields_checks.get(key, None)) is None:
+                continue
 
-            if field_object is None:
-                return failure(UnknownFieldError(data, structure, key))
+            field, check = field_check
 
-            validator = field_object.validator
+            if (record := check(value)) is not None:
+                return ErrorRecord(FIELD_VALIDATION, data, field, record, path=(key, *record.path))
+
+        return None
+
+    def iter_errors(self, data: typing.Mapping[Any, Any], /) -> Iterator[ErrorRecord]:
+
+        """
+        Yields error records of all missing keys, unknown keys and invalid fields.
+
+        :param data: mapping to be validated
+        """
+
+        keys = data.keys()
+
+        if not keys >= self.required_keys:
+            for key, field in self.required_fields:
+                if key not in keys:
+                    yield ErrorRecord(REQUIRED_KEY_MISSING, data, key, field, path=(key,))
+
+        if not (known_keys := self.known_keys).issuperset(keys):
+            for key in keys:
+                if key not in known_keys:
+                    yield ErrorRecord(UNKNOWN_FIELD, data, self.structure_type, key, path=(key,))
+
+        fields_checks = self.fields_checks
+
+        for key, value in data.items():
+            if (field_check := fields_checks.get(key, None)) is None:
+                continue
 
-            if validator is not None and not (result := validator(value)):
-                return failure(FieldValidationError(data, field_object, unwrap_failure(result)))
+            field, check = field_check
 
-        return success(None)
+            if (record := check(value)) is not None:
+                yield ErrorRecord(FIELD_VALIDATION, data, field, record, path=(key, *record.path))
@@ -0,0 +1,187 @@
+__all__ = (
+    "MemoizedValidator",
+    "CacheInfo",
+    "EvictionPolicy",
+    "LRU_POLICY",
+    "FIFO_POLICY",
+    "EVICTION_POLICIES",
+)
+
+import threading
+import testplates
+
+from enum import (
+    Enum,
+)
+
+from collections import (
+    OrderedDict,
+)
+
+from typing import (
+    Any,
+    Tuple,
+    FrozenSet,
+    Literal,
+    NamedTuple,
+    Optional,
+    Final,
+)
+
+from .utils import (
+    get_check,
+    BaseValidator,
+    Validator,
+)
+
+from .records import (
+    ErrorRecord,
+)
+
+EvictionPolicy = Literal["lru", "fifo"]
+
+LRU_POLICY: Final[Literal["lru"]] = "lru"
+FIFO_POLICY: Final[Literal["fifo"]] = "fifo"
+
+EVICTION_POLICIES: Final[FrozenSet[str]] = frozenset((LRU_POLICY, FIFO_POLICY))
+MEMOIZABLE_TYPES: Final[FrozenSet[type]] = frozenset((str, bytes, int, bool))
+
+
+class CacheInfo(NamedTuple):
+
+    """
+    Memoized validator cache statistics.
+    """
+
+    hits: int
+    misses: int
+    maxsize: int
+    size: int
+
+
+class MemoizedValidator(BaseValidator):
+
+    """
+    Memoized validator class.
+
+    Remembers outcomes of the wrapped validator for immutable
+    hashable values (strings, bytes, integers and enum members)
+    keyed by value type and value itself. Cache holds at most
+    maxsize outcomes and evicts either the least recently used
+    (lru policy) or the oldest (fifo policy) outcome when full.
+    Other values are always passed to the wrapped validator.
+    """
+
+    __slots__ = (
+        "validator",
+        "maxsize",
+        "policy",
+        "_check",
+        "_cache",
+        "_lock",
+        "_hits",
+        "_misses",
+    )
+
+    def __init__(
+        self,
+        validator: Validator,
+        /,
+        *,
+        maxsize: int,
+        policy: EvictionPolicy,
+    ) -> None:
+        self.validator = validator
+        self.maxsize = maxsize
+        self.policy = policy
+        self._check = get_check(validator)
+        self._cache: OrderedDict[Tuple[type, Any], Optional[ErrorRecord]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def __repr__(self) -> str:
+        parameters = f"{self.validator!r}, maxsize={self.maxsize}, policy={self.policy!r}"
+
+        return f"{testplates.__name__}.memoize_validator({parameters})"
+
+    @property
+    def key(self) -> Tuple[Any, ...]:
+        return (self.validator, self.maxsize, self.policy)
+
+    @property
+    def hits(self) -> int:
+
+        """
+        Returns number of outcomes served from the cache.
+        """
+
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+
+        """
+        Returns number of memoizable values passed to the wrapped validator.
+        """
+
+        return self._misses
+
+    @property
+    def size(self) -> int:
+
+        """
+        Returns number of cached outcomes.
+        """
+
+        return len(self._cache)
+
+    @property
+    def info(self) -> CacheInfo:
+
+        """
+        Returns cache statistics.
+        """
+
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self.maxsize, len(self._cache))
+
+    def clear(self) -> None:
+
+        """
+        Removes all cached outcomes and resets counters.
+        """
+
+        with self._lock:
+            self._cache.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def check(self, data: Any, /) -> Optional[ErrorRecord]:
+        data_type = type(data)
+
+        if data_type not in MEMOIZABLE_TYPES and not isinstance(data, Enum):
+            return self._check(data)
+
+        key = (data_type, data)
+        cache = self._cache
+
+        with self._lock:
+            if key in cache:
+                if self.policy == LRU_POLICY:
+                    cache.move_to_end(key)
+
+                self._hits += 1
+                return cache[key]
+
+            self._misses += 1
+
+        record = self._check(data)
+
+        with self._lock:
+            cache[key] = record
+
+            while len(cache) > self.maxsize:
+                cache.popitem(last=False)
+
+        return record
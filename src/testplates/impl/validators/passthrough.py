@@ -4,24 +4,24 @@ import testplates
 
 from typing import (
     Any,
+    Optional,
 )
 
-from resultful import (
-    success,
-    Result,
+from .utils import (
+    BaseValidator,
 )
 
-from testplates.impl.exceptions import (
-    TestplatesError,
+from .records import (
+    ErrorRecord,
 )
 
 
-class PassthroughValidator:
+class PassthroughValidator(BaseValidator):
 
     __slots__ = ()
 
     def __repr__(self) -> str:
         return f"{testplates.__name__}.passthrough_validator()"
 
-    def __call__(self, data: Any, /) -> Result[None, TestplatesError]:
-        return success(None)
+    def check(self, data: Any, /) -> Optional[ErrorRecord]:
+        return None
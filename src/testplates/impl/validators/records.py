@@ -0,0 +1,251 @@
+__all__ = (
+    "ErrorRecord",
+    "Path",
+    "ERROR_TYPES",
+    "ERROR",
+    "INVALID_TYPE",
+    "INVALID_ENUM_VALUE",
+    "PROHIBITED_BOOL_VALUE",
+    "INVALID_MINIMUM_VALUE",
+    "INVALID_MAXIMUM_VALUE",
+    "INVALID_MINIMUM_SIZE",
+    "INVALID_MAXIMUM_SIZE",
+    "INVALID_FORMAT",
+    "UNIQUENESS",
+    "INVALID_KEY",
+    "INVALID_DATA_FORMAT",
+    "REQUIRED_KEY_MISSING",
+    "UNKNOWN_FIELD",
+    "ITEM_VALIDATION",
+    "FIELD_VALIDATION",
+    "CHOICE_VALIDATION",
+    "NO_MATCHING_CHOICE",
+    "MULTIPLE_VALIDATION",
+)
+
+from typing import (
+    cast,
+    Any,
+    Type,
+    Tuple,
+    List,
+    Iterator,
+    FrozenSet,
+    Final,
+)
+
+from testplates.impl.base import (
+    MissingType,
+)
+
+from testplates.impl.exceptions import (
+    TestplatesError,
+    InvalidTypeError,
+    InvalidEnumValueError,
+    ProhibitedBoolValueError,
+    InvalidMinimumValueError,
+    InvalidMaximumValueError,
+    InvalidMinimumSizeError,
+    InvalidMaximumSizeError,
+    InvalidFormatError,
+    UniquenessError,
+    InvalidKeyError,
+    InvalidDataFormatError,
+    RequiredKeyMissingError,
+    UnknownFieldError,
+    ItemValidationError,
+    FieldValidationError,
+    ChoiceValidationError,
+    NoMatchingChoiceError,
+    MultipleValidationError,
+    PathValidationError,
+)
+
+Path = Tuple[Any, ...]
+
+ERROR: Final[int] = 0
+INVALID_TYPE: Final[int] = 1
+INVALID_ENUM_VALUE: Final[int] = 2
+PROHIBITED_BOOL_VALUE: Final[int] = 3
+INVALID_MINIMUM_VALUE: Final[int] = 4
+INVALID_MAXIMUM_VALUE: Final[int] = 5
+INVALID_MINIMUM_SIZE: Final[int] = 6
+INVALID_MAXIMUM_SIZE: Final[int] = 7
+INVALID_FORMAT: Final[int] = 8
+UNIQUENESS: Final[int] = 9
+INVALID_KEY: Final[int] = 10
+INVALID_DATA_FORMAT: Final[int] = 11
+REQUIRED_KEY_MISSING: Final[int] = 12
+UNKNOWN_FIELD: Final[int] = 13
+ITEM_VALIDATION: Final[int] = 14
+FIELD_VALIDATION: Final[int] = 15
+CHOICE_VALIDATION: Final[int] = 16
+NO_MATCHING_CHOICE: Final[int] = 17
+MULTIPLE_VALIDATION: Final[int] = 18
+
+# Error types indexed by error record codes
+ERROR_TYPES: Final[Tuple[Type[TestplatesError], ...]] = (
+    TestplatesError,
+    InvalidTypeError,
+    InvalidEnumValueError,
+    ProhibitedBoolValueError,
+    InvalidMinimumValueError,
+    InvalidMaximumValueError,
+    InvalidMinimumSizeError,
+    InvalidMaximumSizeError,
+    InvalidFormatError,
+    UniquenessError,
+    InvalidKeyError,
+    InvalidDataFormatError,
+    RequiredKeyMissingError,
+    UnknownFieldError,
+    ItemValidationError,
+    FieldValidationError,
+    ChoiceValidationError,
+    NoMatchingChoiceError,
+    MultipleValidationError,
+)
+
+# Codes of records that wrap the record of the nested data as the last payload item
+NESTED_CODES: Final[FrozenSet[int]] = frozenset(
+    (ITEM_VALIDATION, FIELD_VALIDATION, CHOICE_VALIDATION)
+)
+
+EMPTY_PATH: Final[Path] = ()
+
+
+class ErrorRecord:
+
+    """
+    Validation error record class.
+
+    Lightweight representation of validation error that
+    is created on the validation path instead of the error
+    itself. Record consists of the numeric code of the error
+    type, the path of keys and indexes leading to the data
+    that failed validation and the payload holding arguments
+    of the error (with nested errors kept as records). Error
+    is created only when it is requested with :meth:`to_error`.
+    """
+
+    __slots__ = (
+        "code",
+        "path",
+        "payload",
+    )
+
+    def __init__(
+        self,
+        code: int,
+        /,
+        *payload: Any,
+        path: Path = EMPTY_PATH,
+    ) -> None:
+        self.code = code
+        self.path = path
+        self.payload = payload
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.error_type.__name__}, path={self.path!r})"
+
+    @property
+    def error_type(self) -> Type[TestplatesError]:
+
+        """
+        Returns type of the error represented by the record.
+        """
+
+        if self.code == ERROR:
+            return type(self.payload[0])
+
+        return ERROR_TYPES[self.code]
+
+    def to_error(self) -> TestplatesError:
+
+        """
+        Returns error represented by the record.
+        """
+
+        code = self.code
+        payload = self.payload
+
+        if code == ERROR:
+            return cast(TestplatesError, payload[0])
+
+        if code == ITEM_VALIDATION:
+            data, item, record = payload
+            return ItemValidationError(data, item, record.to_error(), index=self.path[0])
+
+        if code == FIELD_VALIDATION or code == CHOICE_VALIDATION:
+            data, context, record = payload
+            return ERROR_TYPES[code](data, context, record.to_error())
+
+        if code == NO_MATCHING_CHOICE:
+            data, records = payload
+            return NoMatchingChoiceError(
+                data, {key: record.to_error() for key, record in records.items()}
+            )
+
+        if code == MULTIPLE_VALIDATION:
+            data, records = payload
+            return MultipleValidationError(data, [record.to_error() for record in records])
+
+        return ERROR_TYPES[code](*payload)
+
+    def to_leaf_error(self) -> TestplatesError:
+
+        """
+        Returns error represented by the record of the leaf value.
+
+        Errors of missing and unknown keys keep only the value
+        at the key (missing value or value of the unknown key)
+        instead of the whole mapping that contains the key.
+        """
+
+        code = self.code
+
+        if code == REQUIRED_KEY_MISSING:
+            _, key, field = self.payload
+            return RequiredKeyMissingError(MissingType.MISSING, key, field)
+
+        if code == UNKNOWN_FIELD:
+            data, structure_type, key = self.payload
+            return UnknownFieldError(data[key], structure_type, key)
+
+        return self.to_error()
+
+    def iter_leaves(self, prefix: Path = EMPTY_PATH, /) -> Iterator[Tuple[Path, "ErrorRecord"]]:
+
+        """
+        Yields full paths and records of all errors that do not wrap
+        errors of the nested data, expanding collected errors.
+
+        :param prefix: path leading to the data validated by this record
+        """
+
+        path = prefix + self.path
+        record = self
+
+        while record.code in NESTED_CODES:
+            record = record.payload[-1]
+
+        if record.code != MULTIPLE_VALIDATION:
+            yield path, record
+            return
+
+        for nested_record in record.payload[1]:
+            yield from nested_record.iter_leaves(path)
+
+    def to_path_errors(self) -> List[PathValidationError]:
+
+        """
+        Returns flat errors represented by the record.
+
+        Each error keeps only path to the invalid value and
+        the error of that value, without the enclosing data.
+        """
+
+        return [
+            PathValidationError(path, record.to_leaf_error())
+            for path, record in self.iter_leaves()
+        ]
@@ -0,0 +1,87 @@
+__all__ = (
+    "intern_validator",
+    "ValidatorRegistry",
+    "VALIDATOR_REGISTRY",
+)
+
+from weakref import (
+    WeakValueDictionary,
+)
+
+from typing import (
+    Any,
+    Final,
+)
+
+from .utils import (
+    BaseValidator,
+    Validator,
+)
+
+
+class ValidatorRegistry:
+
+    """
+    Validator interning registry class.
+
+    Maps validators to the first equal validator registered,
+    so that equal validators are shared instead of duplicated.
+    Registry does not keep validators alive on its own.
+    """
+
+    __slots__ = ("_validators",)
+
+    def __init__(self) -> None:
+        self._validators: WeakValueDictionary[Any, Validator] = WeakValueDictionary()
+
+    def __len__(self) -> int:
+        return len(self._validators)
+
+    def intern(
+        self,
+        validator: Validator,
+        /,
+    ) -> Validator:
+
+        """
+        Returns registered validator equal to the given one,
+        registering the given validator if there is none.
+
+        Validators that cannot be compared by value
+        (e.g. plain functions) are returned as is.
+
+        :param validator: validator to be interned
+        """
+
+        if not isinstance(validator, BaseValidator):
+            return validator
+
+        try:
+            return self._validators.setdefault((type(validator), validator.key), validator)
+        except TypeError:
+            return validator
+
+    def clear(self) -> None:
+
+        """
+        Removes all registered validators.
+        """
+
+        self._validators.clear()
+
+
+VALIDATOR_REGISTRY: Final[ValidatorRegistry] = ValidatorRegistry()
+
+
+def intern_validator(
+    validator: Validator,
+    /,
+) -> Validator:
+
+    """
+    Returns validator interned in the process-wide validator registry.
+
+    :param validator: validator to be interned
+    """
+
+    return VALIDATOR_REGISTRY.intern(validator)
@@ -1,57 +1,67 @@
 __all__ = ("SequenceValidator",)
 
 import typing
+import itertools
 import testplates
 
 from typing import (
     Any,
     Union,
+    Tuple,
+    Iterator,
+    Optional,
     Final,
 )
 
-from resultful import (
-    success,
-    failure,
-    unwrap_failure,
-    Result,
-)
-
 from testplates.impl.base import (
-    fits_minimum_size,
-    fits_maximum_size,
+    get_below_minimum,
+    get_above_maximum,
     Limit,
     UnlimitedType,
 )
 
-from testplates.impl.exceptions import (
-    TestplatesError,
-    ItemValidationError,
-    InvalidMinimumSizeError,
-    InvalidMaximumSizeError,
-    UniquenessError,
+from .utils import (
+    get_check,
+    BaseValidator,
+    Validator,
 )
 
-from .utils import (
+from .records import (
+    ErrorRecord,
+    INVALID_TYPE,
+    INVALID_MINIMUM_SIZE,
+    INVALID_MAXIMUM_SIZE,
+    UNIQUENESS,
+    ITEM_VALIDATION,
+    MULTIPLE_VALIDATION,
+)
+
+from .uniqueness import (
     has_unique_items,
-    Validator,
+    UniquenessTracker,
 )
 
-from .type import (
-    TypeValidator,
+from .batch import (
+    find_invalid_index,
 )
 
 Boundary = Union[UnlimitedType, Limit]
 
-sequence_type_validator: Final[Validator] = TypeValidator(typing.Sequence)
+SEQUENCE_TYPES: Final[Tuple[type, ...]] = (typing.Sequence,)
 
 
-class SequenceValidator:
+class SequenceValidator(BaseValidator):
 
     __slots__ = (
         "item_validator",
         "minimum_size",
         "maximum_size",
         "unique_items",
+        "collect_all",
+        "max_errors",
+        "check_item",
+        "below_minimum",
+        "above_maximum",
     )
 
     def __init__(
@@ -62,32 +72,105 @@ class SequenceValidator:
         minimum_size: Boundary,
         maximum_size: Boundary,
         unique_items: bool,
+        collect_all: bool,
+        max_errors: Optional[int],
     ) -> None:
         self.item_validator = item_validator
         self.minimum_size = minimum_size
         self.maximum_size = maximum_size
         self.unique_items = unique_items
+        self.collect_all = collect_all
+        self.max_errors = max_errors
+        self.check_item = get_check(item_validator)
+        self.below_minimum = get_below_minimum(minimum_size)
+        self.above_maximum = get_above_maximum(maximum_size)
 
     def __repr__(self) -> str:
         return f"{testplates.__name__}.sequence_validator()"
 
-    def __call__(self, data: Any, /) -> Result[None, TestplatesError]:
-        if not (result := sequence_type_validator(data)):
-            return failure(result)
+    @property
+    def key(self) -> Tuple[Any, ...]:
+        return (
+            self.item_validator,
+            self.minimum_size,
+            self.maximum_size,
+            self.unique_items,
+            self.collect_all,
+            self.max_errors,
+        )
+
+    def check(self, data: Any, /) -> Optional[ErrorRecord]:
+        if not isinstance(data, typing.Sequence):
+            return ErrorRecord(INVALID_TYPE, data, SEQUENCE_TYPES)
+
+        if (below_minimum := self.below_minimum) is not None and below_minimum(len(data)):
+            return ErrorRecord(INVALID_MINIMUM_SIZE, data, self.minimum_size)
+
+        if (above_maximum := self.above_maximum) is not None and above_maximum(len(data)):
+            return ErrorRecord(INVALID_MAXIMUM_SIZE, data, self.maximum_size)
+
+        if self.collect_all:
+            records = list(itertools.islice(self.iter_errors(data), self.max_errors))
+
+            return ErrorRecord(MULTIPLE_VALIDATION, data, records) if records else None
+
+        unique_items = self.unique_items
+
+        if (start := find_invalid_index(data, self.item_validator)) is None:
+            if unique_items and not has_unique_items(data):
+                return ErrorRecord(UNIQUENESS, data)
+
+            return None
+
+        check_item = self.check_item
+        tracker = UniquenessTracker() if unique_items else None
+
+        if tracker is not None:
+            for item in itertools.islice(data, start):
+                tracker.add(item)
+
+        for index, item in enumerate(itertools.islice(data, start, None), start):
+            if (record := check_item(item)) is not None:
+                return ErrorRecord(ITEM_VALIDATION, data, item, record, path=(index, *record.path))
+
+            if tracker is not None:
+                tracker.add(item)
+
+        if tracker is not None and not tracker.is_unique():
+            return ErrorRecord(UNIQUENESS, data)
+
+        return None
+
+    def iter_errors(self, data: typing.Sequence[Any], /) -> Iterator[ErrorRecord]:
+
+        """
+        Yields error records of all invalid items followed by uniqueness error record.
+
+        :param data: sequence of correct type and size
+        """
+
+        unique_items = self.unique_items
+
+        if (start := find_invalid_index(data, self.item_validator)) is None:
+            if unique_items and not has_unique_items(data):
+                yield ErrorRecord(UNIQUENESS, data)
+
+            return
 
-        item_validator = self.item_validator
+        tracker = UniquenessTracker() if unique_items else None
 
-        for item in data:
-            if not (result := item_validator(item)):
-                return failure(ItemValidationError(data, item, unwrap_failure(result)))
+        if tracker is not None:
+            for item in itertools.islice(data, start):
+                tracker.add(item)
 
-        if not fits_minimum_size(data, self.minimum_size):
-            return failure(InvalidMinimumSizeError(data, self.minimum_size))
+        check_item = self.check_item
 
-        if not fits_maximum_size(data, self.maximum_size):
-            return failure(InvalidMaximumSizeError(data, self.maximum_size))
+        for index, item in enumerate(itertools.islice(data, start, None), start):
+            if (record := check_item(item)) is not None:
+                yield ErrorRecord(ITEM_VALIDATION, data, item, record, path=(index, *record.path))
 
-        if self.unique_items and not has_unique_items(data):
-            return failure(UniquenessError(data))
+            if tracker is not None:
+                tracker.add(item)
 
-        return success(None)
+        if tracker is not None and not tracker.is_unique():
+            yield ErrorRecord(UNIQUENESS, data)
@@ -1,4 +1,5 @@
 __all__ = (
+    "TextValidator",
     "StringValidator",
     "BytesValidator",
 )
@@ -7,135 +8,105 @@ import testplates
 
 from typing import (
     Any,
-    AnyStr,
+    Type,
     Union,
     Pattern,
+    Tuple,
+    Sized,
+    ClassVar,
     Optional,
-    Final,
-)
-
-from resultful import (
-    success,
-    failure,
-    Result,
 )
 
 from testplates.impl.base import (
-    fits_minimum_size,
-    fits_maximum_size,
+    get_below_minimum,
+    get_above_maximum,
     Limit,
     UnlimitedType,
 )
 
-from testplates.impl.exceptions import (
-    TestplatesError,
-    InvalidMinimumSizeError,
-    InvalidMaximumSizeError,
-    InvalidFormatError,
+from .utils import (
+    BaseValidator,
 )
 
-from .type import (
-    TypeValidator,
+from .records import (
+    ErrorRecord,
+    INVALID_TYPE,
+    INVALID_MINIMUM_SIZE,
+    INVALID_MAXIMUM_SIZE,
+    INVALID_FORMAT,
 )
 
 Boundary = Union[Limit, UnlimitedType]
 
-string_type_validator: Final = TypeValidator(str)
-bytes_type_validator: Final = TypeValidator(bytes)
 
+class TextValidator(BaseValidator):
 
-class StringValidator:
+    """
+    Text validator base class.
+
+    Size boundaries are turned upfront into comparison functions
+    (or None when unlimited), so that validation performs type check,
+    size comparisons and pattern match inline.
+    """
 
     __slots__ = (
         "minimum_size",
         "maximum_size",
         "pattern",
+        "below_minimum",
+        "above_maximum",
     )
 
+    allowed_types: ClassVar[Tuple[Type[Sized], ...]]
+
     def __init__(
         self,
         *,
         minimum_size: Boundary,
         maximum_size: Boundary,
-        pattern: Optional[Pattern[str]],
+        pattern: Optional[Pattern[Any]],
     ) -> None:
         self.minimum_size = minimum_size
         self.maximum_size = maximum_size
         self.pattern = pattern
+        self.below_minimum = get_below_minimum(minimum_size)
+        self.above_maximum = get_above_maximum(maximum_size)
 
-    def __repr__(self) -> str:
-        return f"{testplates.__name__}.string_validator()"
+    @property
+    def key(self) -> Tuple[Any, ...]:
+        return (self.minimum_size, self.maximum_size, self.pattern)
 
-    def __call__(self, data: Any, /) -> Result[None, TestplatesError]:
-        if not (result := string_type_validator(data)):
-            return failure(result)
+    def check(self, data: Any, /) -> Optional[ErrorRecord]:
+        if not isinstance(data, (allowed_types := self.allowed_types)):
+            return ErrorRecord(INVALID_TYPE, data, allowed_types)
 
-        if not (result := validate_size(data, self.minimum_size, self.maximum_size)):
-            return failure(result)
+        if (below_minimum := self.below_minimum) is not None and below_minimum(len(data)):
+            return ErrorRecord(INVALID_MINIMUM_SIZE, data, self.minimum_size)
 
-        if not (result := validate_pattern(data, self.pattern)):
-            return failure(result)
+        if (above_maximum := self.above_maximum) is not None and above_maximum(len(data)):
+            return ErrorRecord(INVALID_MAXIMUM_SIZE, data, self.maximum_size)
 
-        return success(None)
+        if (pattern := self.pattern) is not None and not pattern.match(data):
+            return ErrorRecord(INVALID_FORMAT, data, pattern)
 
+        return None
 
-class BytesValidator:
 
-    __slots__ = (
-        "minimum_size",
-        "maximum_size",
-        "pattern",
-    )
+class StringValidator(TextValidator):
 
-    def __init__(
-        self,
-        *,
-        minimum_size: Boundary,
-        maximum_size: Boundary,
-        pattern: Optional[Pattern[bytes]],
-    ) -> None:
-        self.minimum_size = minimum_size
-        self.maximum_size = maximum_size
-        self.pattern = pattern
-
-    def __repr__(self) -> str:
-        return f"{testplates.__name__}.bytes_validator()"
-
-    def __call__(self, data: Any) -> Result[None, TestplatesError]:
-        if not (result := bytes_type_validator(data)):
-            return failure(result)
+    __slots__ = ()
 
-        if not (result := validate_size(data, self.minimum_size, self.maximum_size)):
-            return failure(result)
+    allowed_types = (str,)
 
-        if not (result := validate_pattern(data, self.pattern)):
-            return failure(result)
-
-        return success(None)
-
-
-def validate_size(
-    data: AnyStr,
-    minimum_size: Boundary,
-    maximum_size: Boundary,
-    /,
-) -> Result[None, TestplatesError]:
-    if not fits_minimum_size(data, minimum_size):
-        return failure(InvalidMinimumSizeError(data, minimum_size))
+    def __repr__(self) -> str:
+        return f"{testplates.__name__}.string_validator()"
 
-    if not fits_maximum_size(data, maximum_size):
-        return failure(InvalidMaximumSizeError(data, maximum_size))
 
-    return success(None)
+class BytesValidator(TextValidator):
 
+    __slots__ = ()
 
-def validate_pattern(
-    data: AnyStr,
-    pattern: Optional[Pattern[AnyStr]],
-    /,
-) -> Result[None, TestplatesError]:
-    if pattern is not None:
-        if not pattern.match(data):
-            return failure(InvalidFormatError(data, pattern))
+    allowed_types = (bytes,)
 
-    return success(None)
+    def __repr__(self) -> str:
+        return f"{testplates.__name__}.bytes_validator()"
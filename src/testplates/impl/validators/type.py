@@ -4,22 +4,25 @@ import testplates
 
 from typing import (
     Any,
+    Tuple,
+    Optional,
 )
 
-from resultful import (
-    success,
-    failure,
-    Result,
+from .records import (
+    ErrorRecord,
+    INVALID_TYPE,
 )
 
-from testplates.impl.exceptions import TestplatesError, InvalidTypeError
-
 from testplates.impl.utils import (
     format_like_tuple,
 )
 
+from .utils import (
+    BaseValidator,
+)
+
 
-class TypeValidator:
+class TypeValidator(BaseValidator):
 
     __slots__ = ("allowed_types",)
 
@@ -34,10 +37,14 @@ class TypeValidator:
 
         return f"{testplates.__name__}.type_validator({allowed_types})"
 
-    def __call__(self, data: Any, /) -> Result[None, TestplatesError]:
+    @property
+    def key(self) -> Tuple[Any, ...]:
+        return self.allowed_types
+
+    def check(self, data: Any, /) -> Optional[ErrorRecord]:
         allowed_types = self.allowed_types
 
         if not isinstance(data, allowed_types):
-            return failure(InvalidTypeError(data, allowed_types))
+            return ErrorRecord(INVALID_TYPE, data, allowed_types)
 
-        return success(None)
+        return None
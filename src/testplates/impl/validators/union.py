@@ -1,67 +1,156 @@
 __all__ = ("UnionValidator",)
 
+import typing
 import testplates
 
 from typing import (
     Any,
     Mapping,
+    Tuple,
+    Dict,
+    Optional,
     Final,
 )
 
-from resultful import (
-    success,
-    failure,
-    unwrap_failure,
-    Result,
-)
-
-from testplates.impl.exceptions import (
-    TestplatesError,
-    InvalidKeyError,
-    InvalidDataFormatError,
-    ChoiceValidationError,
-)
-
 from .utils import (
+    get_check,
+    BaseValidator,
     Validator,
+    Check,
 )
 
-from .type import (
-    TypeValidator,
+from .records import (
+    ErrorRecord,
+    INVALID_TYPE,
+    INVALID_KEY,
+    INVALID_DATA_FORMAT,
+    CHOICE_VALIDATION,
+    NO_MATCHING_CHOICE,
 )
 
-union_type_validator: Final[Validator] = TypeValidator(tuple)
+TAGGED_TYPES: Final[Tuple[type, ...]] = (tuple,)
+SEQUENCE_TYPES: Final[Tuple[type, ...]] = (typing.Sequence,)
+TEXT_TYPES: Final[Tuple[type, ...]] = (str, bytes, bytearray)
+
+
+class UnionValidator(BaseValidator):
 
+    """
+    Union validator class.
 
-class UnionValidator:
+    Tagged union data is a (key, value) tuple (or any
+    two-element sequence other than string when sequences
+    are accepted) and value is validated with the choice
+    looked up by key in the dispatch table. Untagged union
+    data is validated with all choices until one of them
+    accepts it. Choices are tried in the order of their
+    hit frequency learned from the previously validated data.
+    """
 
-    __slots__ = ("choices",)
+    __slots__ = (
+        "choices",
+        "accept_sequences",
+        "untagged",
+        "dispatch",
+        "order",
+        "hits",
+    )
 
     def __init__(
         self,
         choices: Mapping[str, Validator],
         /,
+        *,
+        accept_sequences: bool,
+        untagged: bool,
     ) -> None:
         self.choices = choices
+        self.accept_sequences = accept_sequences
+        self.untagged = untagged
+        self.dispatch: Dict[str, Tuple[Validator, Check]] = {
+            key: (choice, get_check(choice)) for key, choice in choices.items()
+        }
+        self.order: Tuple[str, ...] = tuple(choices.keys())
+        self.hits: Dict[str, int] = dict.fromkeys(choices.keys(), 0)
 
     def __repr__(self) -> str:
         return f"{testplates.__name__}.union_validator({self.choices})"
 
-    def __call__(self, data: Any, /) -> Result[None, TestplatesError]:
-        if not (result := union_type_validator(data)):
-            return failure(result)
+    @property
+    def key(self) -> Tuple[Any, ...]:
+        return (tuple(self.choices.items()), self.accept_sequences, self.untagged)
+
+    def check(self, data: Any, /) -> Optional[ErrorRecord]:
+        if self.untagged:
+            return self.check_untagged(data)
+
+        if not isinstance(data, tuple):
+            if not self.accept_sequences:
+                return ErrorRecord(INVALID_TYPE, data, TAGGED_TYPES)
+
+            if not isinstance(data, typing.Sequence) or isinstance(data, TEXT_TYPES):
+                return ErrorRecord(INVALID_TYPE, data, SEQUENCE_TYPES)
+
+        if len(data) != 2:
+            return ErrorRecord(INVALID_DATA_FORMAT, data)
+
+        key, value = data
 
         try:
-            key, value = data
-        except ValueError:
-            return failure(InvalidDataFormatError(data))
+            entry = self.dispatch.get(key, None)
+        except TypeError:
+            entry = None
+
+        if entry is None:
+            return ErrorRecord(INVALID_KEY, key, data)
+
+        choice_validator, check = entry
+
+        if (record := check(value)) is not None:
+            return ErrorRecord(
+                CHOICE_VALIDATION, data, choice_validator, record, path=(key, *record.path)
+            )
+
+        return None
+
+    def check_untagged(self, data: Any, /) -> Optional[ErrorRecord]:
+
+        """
+        Validates data with choices in the learned order
+        and returns error record or None if any choice accepts data.
+
+        :param data: data to be validated
+        """
+
+        order = self.order
+        dispatch = self.dispatch
+        records: Dict[str, ErrorRecord] = {}
+
+        for position, key in enumerate(order):
+            if (record := dispatch[key][1](data)) is None:
+                self.learn(order, position)
+                return None
+
+            records[key] = record
+
+        return ErrorRecord(NO_MATCHING_CHOICE, data, records)
+
+    def learn(self, order: Tuple[str, ...], position: int, /) -> None:
 
-        choice_validator = self.choices.get(key, None)
+        """
+        Counts choice hit and moves choice one position forward
+        if it has been hit more often than its predecessor.
 
-        if choice_validator is None:
-            return failure(InvalidKeyError(key, data))
+        :param order: order in which choices were tried
+        :param position: position of the choice that was hit
+        """
 
-        if not (result := choice_validator(value)):
-            return failure(ChoiceValidationError(data, choice_validator, unwrap_failure(result)))
+        hits = self.hits
+        key = order[position]
+        hits[key] += 1
 
-        return success(None)
+        if position and hits[key] > hits[(previous := order[position - 1])]:
+            new_order = list(order)
+            new_order[position - 1] = key
+            new_order[position] = previous
+            self.order = tuple(new_order)
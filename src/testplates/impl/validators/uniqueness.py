@@ -0,0 +1,226 @@
+__all__ = (
+    "has_unique_items",
+    "get_frozen_key",
+    "UniquenessTracker",
+)
+
+import itertools
+import collections.abc
+
+from typing import (
+    cast,
+    Any,
+    Set,
+    List,
+    Iterable,
+    Mapping,
+    Sequence,
+    Hashable,
+    FrozenSet,
+    Optional,
+    Final,
+)
+
+# Tags distinguishing frozen keys of different kinds of containers,
+# so that e.g. a list is never considered equal to a tuple
+MAPPING_TAG: Final[object] = object()
+LIST_TAG: Final[object] = object()
+TUPLE_TAG: Final[object] = object()
+
+# Frozen key of None, since None itself indicates that there is no frozen key
+NONE_KEY: Final[object] = object()
+
+SCALAR_TYPES: Final[FrozenSet[type]] = frozenset((bool, int, float, str, bytes))
+
+
+class UniquenessTracker:
+
+    """
+    Uniqueness tracker class.
+
+    Tracks items one by one and detects duplicates among them.
+    Hashable items are tracked directly, unhashable mappings,
+    lists, tuples and sets are tracked by their frozen keys.
+    Remaining items are compared after sorting (or, when
+    they are not orderable, with each other) at the end.
+    """
+
+    __slots__ = (
+        "visited",
+        "unkeyed",
+        "has_duplicates",
+    )
+
+    def __init__(self) -> None:
+        self.visited: Set[Any] = set()
+        self.unkeyed: List[Any] = []
+        self.has_duplicates = False
+
+    def add(self, item: Any, /) -> None:
+
+        """
+        Adds item to tracked items.
+
+        :param item: item to be tracked
+        """
+
+        try:
+            if item in self.visited:
+                self.has_duplicates = True
+            else:
+                self.visited.add(item)
+        except TypeError:
+            if (key := get_frozen_key(item)) is None:
+                self.unkeyed.append(item)
+            elif key in self.visited:
+                self.has_duplicates = True
+            else:
+                self.visited.add(key)
+
+    def is_unique(self) -> bool:
+
+        """
+        Returns True if all tracked items are unique, otherwise False.
+        """
+
+        return not self.has_duplicates and has_unique_unkeyed_items(self.unkeyed)
+
+
+def has_unique_items(
+    items: Iterable[Any],
+) -> bool:
+
+    """
+    Returns True if all items are unique, otherwise False.
+
+    :param items: items to be checked
+    """
+
+    tracker = UniquenessTracker()
+
+    for item in items:
+        tracker.add(item)
+
+        if tracker.has_duplicates:
+            return False
+
+    return tracker.is_unique()
+
+
+def get_frozen_key(
+    item: Any,
+    /,
+) -> Optional[Hashable]:
+
+    """
+    Returns hashable key that is equal to the other item's key
+    only if both items are equal, or None if there is no such key.
+
+    :param item: item to be frozen
+    """
+
+    if item is None:
+        return NONE_KEY
+
+    item_type = type(item)
+
+    if item_type in SCALAR_TYPES:
+        return cast(Hashable, item)
+
+    if item_type is dict:
+        return get_mapping_key(item)
+
+    if item_type is list:
+        return get_sequence_key(item, LIST_TAG)
+
+    try:
+        hash(item)
+    except TypeError:
+        pass
+    else:
+        return cast(Hashable, item)
+
+    if isinstance(item, collections.abc.Mapping):
+        return get_mapping_key(item)
+
+    if isinstance(item, collections.abc.Set):
+        return frozenset(item)
+
+    if isinstance(item, list):
+        return get_sequence_key(item, LIST_TAG)
+
+    if isinstance(item, tuple):
+        return get_sequence_key(item, TUPLE_TAG)
+
+    return None
+
+
+def get_mapping_key(
+    item: Mapping[Any, Any],
+    /,
+) -> Optional[Hashable]:
+    if (values := get_frozen_keys(item.values())) is None:
+        return None
+
+    return MAPPING_TAG, frozenset(zip(item.keys(), values))
+
+
+def get_sequence_key(
+    item: Sequence[Any],
+    tag: object,
+    /,
+) -> Optional[Hashable]:
+    if (values := get_frozen_keys(item)) is None:
+        return None
+
+    return tag, tuple(values)
+
+
+def get_frozen_keys(
+    items: Iterable[Any],
+    /,
+) -> Optional[List[Hashable]]:
+
+    """
+    Returns frozen keys of all items, or None if any item has no frozen key.
+
+    :param items: items to be frozen
+    """
+
+    keys = []
+
+    for item in items:
+        if (key := get_frozen_key(item)) is None:
+            return None
+
+        keys.append(key)
+
+    return keys
+
+
+def has_unique_unkeyed_items(
+    items: List[Any],
+    /,
+) -> bool:
+
+    """
+    Returns True if all items are unique, otherwise False.
+
+    Items are sorted and adjacent items are compared whenever
+    items are orderable. Otherwise all items are compared with
+    each other, which is quadratic, but only items that are
+    neither hashable nor frozen end up here, and there are
+    usually only a few of them.
+
+    :param items: unhashable items to be checked
+    """
+
+    if len(items) < 2:
+        return True
+
+    try:
+        ordered = sorted(items)
+    except TypeError:
+        return not any(first == second for first, second in itertools.combinations(items, 2))
+
+    return not any(first == second for first, second in zip(ordered, ordered[1:]))
@@ -1,17 +1,29 @@
 __all__ = (
     "is_classinfo",
-    "has_unique_items",
+    "is_error_limit",
+    "get_check",
+    "BaseValidator",
     "Validator",
+    "Check",
+    "SUCCESS",
+    "TESTPLATES_CHECK_ATTR",
 )
 
+import abc
+
 from typing import (
+    cast,
     Any,
-    Iterable,
-    Hashable,
+    Tuple,
     Callable,
+    Optional,
+    Final,
 )
 
 from resultful import (
+    success,
+    failure,
+    unwrap_failure,
     Result,
 )
 
@@ -19,7 +31,96 @@ from testplates.impl.exceptions import (
     TestplatesError,
 )
 
+from .records import (
+    ErrorRecord,
+    ERROR,
+)
+
 Validator = Callable[[Any], Result[None, TestplatesError]]
+Check = Callable[[Any], Optional[ErrorRecord]]
+
+SUCCESS: Final[Result[None, TestplatesError]] = success(None)
+
+TESTPLATES_CHECK_ATTR: Final[str] = "_testplates_check_"
+
+
+class BaseValidator(abc.ABC):
+
+    """
+    Validator base class.
+
+    Validators implement :meth:`check` which returns None when
+    validation passes and allocates an error record only upon
+    failure. Calling validator converts the record into the error
+    wrapped into the result, returning the shared success result
+    when validation passes.
+
+    Validators of the same type with equal :attr:`key` are equal
+    and share the same hash, hence they can be interned.
+    """
+
+    __slots__ = ("__weakref__",)
+
+    def __eq__(self, other: Any) -> bool:
+        if type(self) is not type(other):
+            return NotImplemented
+
+        return bool(self.key == other.key)
+
+    def __hash__(self) -> int:
+        return hash((type(self), self.key))
+
+    @property
+    def key(self) -> Tuple[Any, ...]:
+
+        """
+        Returns values that fully determine validator behaviour.
+        """
+
+        return ()
+
+    def __call__(self, data: Any, /) -> Result[None, TestplatesError]:
+        if (record := self.check(data)) is None:
+            return SUCCESS
+
+        return failure(record.to_error())
+
+    @abc.abstractmethod
+    def check(self, data: Any, /) -> Optional[ErrorRecord]:
+
+        """
+        Validates data and returns error record or None if data is correct.
+
+        :param data: data to be validated
+        """
+
+
+def get_check(
+    validator: Validator,
+    /,
+) -> Check:
+
+    """
+    Returns function that validates data and returns
+    error record or None, without allocating success results
+    (and errors) whenever validator supports such protocol.
+
+    :param validator: validator function
+    """
+
+    if isinstance(validator, BaseValidator):
+        return validator.check
+
+    if (validator_check := getattr(validator, TESTPLATES_CHECK_ATTR, None)) is not None:
+        return cast(Check, validator_check)
+
+    def check(data: Any, /) -> Optional[ErrorRecord]:
+        if result := validator(data):
+            return None
+
+        return ErrorRecord(ERROR, unwrap_failure(result))
+
+    return check
 
 
 def is_classinfo(
@@ -34,15 +135,8 @@ def is_classinfo(
         return True
 
 
-def has_unique_items(
-    items: Iterable[Hashable],
+def is_error_limit(
+    value: Optional[int],
+    /,
 ) -> bool:
-    visited = set()
-
-    for item in items:
-        if item in visited:
-            return False
-        else:
-            visited.add(item)
-
-    return True
+    return value is None or (isinstance(value, int) and not isinstance(value, bool) and value > 0)
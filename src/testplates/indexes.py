@@ -0,0 +1,32 @@
+__all__ = (
+    "create_index",
+    "TemplateIndex",
+)
+
+from typing import (
+    Union,
+)
+
+from testplates.impl.base import (
+    Structure,
+    TemplateIndex as TemplateIndexImpl,
+)
+
+TemplateIndex = Union[TemplateIndexImpl]
+
+
+def create_index(
+    *templates: Structure,
+) -> TemplateIndex:
+
+    """
+    Creates index for finding templates that match given record.
+
+    Index groups templates by their concrete field values,
+    so that looking up the record compares it only with
+    templates that have a chance to match it.
+
+    :param templates: templates to be indexed
+    """
+
+    return TemplateIndex(templates)
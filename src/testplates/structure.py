@@ -1,18 +1,22 @@
 __all__ = (
     "struct",
     "create",
+    "compact",
     "init",
     "verify",
     "modify",
     "value_of",
     "fields",
     "items",
+    "match_many",
     "attach_codec",
     "field",
     "Field",
     "Structure",
 )
 
+import itertools
+
 from typing import (
     cast,
     overload,
@@ -21,6 +25,8 @@ from typing import (
     TypeVar,
     Tuple,
     Union,
+    List,
+    Iterable,
     Iterator,
     Mapping,
     Dict,
@@ -41,10 +47,13 @@ from testplates.impl.base import (
     extract_errors,
     extract_fields,
     extract_values,
+    extract_matcher,
     extract_codecs,
     extract_codec_metadata,
+    create_compact_type,
     Field as FieldImpl,
     Structure as StructureImpl,
+    StructureRow,
     StructureMeta,
     StructureDict,
     Codec as CodecImpl,
@@ -67,6 +76,7 @@ from .validators import (
 from .exceptions import (
     TestplatesError,
     InvalidStructureError,
+    InvalidBatchSizeError,
 )
 
 _GenericType = TypeVar("_GenericType")
@@ -78,6 +88,8 @@ Structure = Union[StructureImpl]
 
 passthrough_validator_singleton: Final[Validator] = PassthroughValidator()
 
+MATCH_MANY_BATCH_SIZE: Final[int] = 1024
+
 
 def struct(
     cls: Type[_GenericType],
@@ -127,6 +139,36 @@ def create(
     return cast(Type[Structure], instance)
 
 
+def compact(
+    structure_type: Type[_StructureType],
+    /,
+) -> Type[_StructureType]:
+
+    """
+    Creates compact version of the structure type.
+
+    Compact structure stores values in slots instead of the
+    values dict, which reduces memory used by each structure
+    and makes reading field values a direct slot access.
+    Compact structure type is a subclass of given structure
+    type with the same fields, but it is a separate structure
+    type, hence codecs have to be attached to it separately.
+
+    Fields stored in slots of the same name are replaced with
+    slot descriptors, hence accessing such field on the compact
+    structure type returns the slot descriptor instead of the
+    field (use :func:`fields` to get the fields). Accessing
+    value of the optional field that was not set raises
+    AttributeError instead of KeyError, as with any unset slot.
+    Compact structure type cannot be subclassed (subclass
+    the given structure type and compact the subclass).
+
+    :param structure_type: structure type to be compacted
+    """
+
+    return create_compact_type(structure_type)
+
+
 def init(
     structure_type: Type[_StructureType],
     /,
@@ -189,7 +231,7 @@ def modify(
 
 
 def value_of(
-    structure: Structure,
+    structure: Union[Structure, StructureRow],
 ) -> Result[Mapping[str, Any], TestplatesError]:
 
     """
@@ -248,6 +290,45 @@ def items(
     return success(iterator())
 
 
+def match_many(
+    structure: Structure,
+    candidates: Iterable[Mapping[str, Any]],
+    /,
+    *,
+    batch_size: int = MATCH_MANY_BATCH_SIZE,
+) -> Result[List[bool], TestplatesError]:
+
+    """
+    Matches structure against many candidates at once.
+
+    Returns list of booleans where each boolean indicates
+    whether corresponding candidate matches the structure.
+    Gives the same results as comparing the structure with
+    each candidate using equality operator, but candidates
+    are processed field by field in batches of given size.
+
+    :param structure: structure instance
+    :param candidates: mappings to be matched against structure
+    :param batch_size: number of candidates processed at once
+    """
+
+    if not isinstance(batch_size, int) or isinstance(batch_size, bool) or batch_size < 1:
+        return failure(InvalidBatchSizeError(batch_size))
+
+    matcher = extract_matcher(structure)
+    iterator = iter(candidates)
+    outcome: List[bool] = []
+
+    while batch := list(itertools.islice(iterator, batch_size)):
+        offset = len(outcome)
+        outcome.extend(itertools.repeat(False, len(batch)))
+
+        for index in matcher.matches_many(batch):
+            outcome[offset + index] = True
+
+    return success(outcome)
+
+
 def attach_codec(
     structure_type: Type[Structure],
     *,
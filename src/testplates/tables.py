@@ -0,0 +1,63 @@
+__all__ = (
+    "create_table",
+    "StructureTable",
+    "StructureRow",
+)
+
+from typing import (
+    Any,
+    Type,
+    Union,
+    Iterable,
+    Mapping,
+)
+
+from resultful import (
+    success,
+    failure,
+    Result,
+)
+
+from testplates.impl.base import (
+    extract_errors,
+    Structure,
+    StructureTable as StructureTableImpl,
+    StructureRow as StructureRowImpl,
+)
+
+from .exceptions import (
+    TestplatesError,
+    InvalidStructureError,
+)
+
+StructureTable = Union[StructureTableImpl]
+StructureRow = Union[StructureRowImpl]
+
+
+def create_table(
+    structure_type: Type[Structure],
+    rows: Iterable[Mapping[str, Any]] = (),
+    /,
+) -> Result[StructureTable, TestplatesError]:
+
+    """
+    Creates table storing many structures of the same type.
+
+    Table stores values of each field in a separate column
+    (an array for integer and float values, otherwise a list),
+    which takes only a fraction of memory used by structures.
+    Rows of the table are views that behave like structures.
+
+    :param structure_type: structure type of the table rows
+    :param rows: structure initialization values of each row
+    """
+
+    if errors := extract_errors(structure_type):
+        return failure(InvalidStructureError(errors))
+
+    table = StructureTable(structure_type)
+
+    if not (result := table.extend(rows)):
+        return result
+
+    return success(table)
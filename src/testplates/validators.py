@@ -9,6 +9,15 @@ __all__ = (
     "sequence_validator",
     "mapping_validator",
     "union_validator",
+    "compile_validator",
+    "intern_validator",
+    "memoize_validator",
+    "cache_info",
+    "to_enum_member",
+    "check_data",
+    "check_paths",
+    "ErrorRecord",
+    "CacheInfo",
 )
 
 from enum import (
@@ -18,8 +27,10 @@ from enum import (
 
 from typing import (
     overload,
+    Any,
     Type,
     Dict,
+    List,
     Iterable,
     Mapping,
     Optional,
@@ -45,6 +56,14 @@ from testplates.impl.base import (
 
 from testplates.impl.validators import (
     is_classinfo,
+    is_error_limit,
+    get_check,
+    compile_validator as compile_validator_impl,
+    intern_validator as intern_validator_impl,
+    MemoizedValidator,
+    CacheInfo,
+    EvictionPolicy,
+    EVICTION_POLICIES,
     TypeValidator,
     PassthroughValidator,
     BooleanValidator,
@@ -55,6 +74,7 @@ from testplates.impl.validators import (
     SequenceValidator,
     MappingValidator,
     UnionValidator,
+    ErrorRecord,
 )
 
 from .value import (
@@ -66,11 +86,18 @@ from .value import (
 from .exceptions import (
     TestplatesError,
     InvalidTypeValueError,
+    InvalidCacheSizeError,
+    InvalidEvictionPolicyError,
+    InvalidErrorLimitError,
+    InvalidEnumValidatorError,
     MemberValidationError,
+    PathValidationError,
 )
 
 passthrough_validator_singleton: Final[Validator] = PassthroughValidator()
 
+MEMO_CACHE_SIZE: Final[int] = 1024
+
 
 def passthrough_validator() -> AlwaysSuccess[Validator]:
 
@@ -359,6 +386,8 @@ def enum_validator(
     enum_type: EnumMeta,
     enum_member_validator: Result[Validator, TestplatesError] = passthrough_validator(),
     /,
+    *,
+    accept_values: bool = False,
 ) -> Result[Validator, TestplatesError]:
 
     """
@@ -366,6 +395,7 @@ def enum_validator(
 
     :param enum_type: ...
     :param enum_member_validator: ...
+    :param accept_values: ...
     """
 
     if not enum_member_validator:
@@ -388,6 +418,7 @@ def enum_validator(
             enum_type,
             enum_type_validator=enum_type_validator,
             enum_member_validator=member_validator,
+            accept_values=accept_values,
         )
     )
 
@@ -399,6 +430,8 @@ def sequence_validator(
     minimum_size: Boundary[int] = UNLIMITED,
     maximum_size: Boundary[int] = UNLIMITED,
     unique_items: bool = False,
+    collect_all: bool = False,
+    max_errors: Optional[int] = None,
 ) -> Result[Validator, TestplatesError]:
 
     """
@@ -408,11 +441,16 @@ def sequence_validator(
     :param minimum_size: ...
     :param maximum_size: ...
     :param unique_items: ...
+    :param collect_all: ...
+    :param max_errors: ...
     """
 
     if not item_validator:
         return item_validator
 
+    if not is_error_limit(max_errors):
+        return failure(InvalidErrorLimitError(max_errors))
+
     result = get_size_boundaries(inclusive_minimum=minimum_size, inclusive_maximum=maximum_size)
 
     if not result:
@@ -426,6 +464,8 @@ def sequence_validator(
             minimum_size=minimum_size_boundary,
             maximum_size=maximum_size_boundary,
             unique_items=unique_items,
+            collect_all=collect_all,
+            max_errors=max_errors,
         )
     )
 
@@ -433,26 +473,45 @@ def sequence_validator(
 def mapping_validator(
     structure_type: Type[Structure],
     /,
+    *,
+    collect_all: bool = False,
+    max_errors: Optional[int] = None,
 ) -> Result[Validator, TestplatesError]:
 
     """
     ...
 
     :param structure_type: ...
+    :param collect_all: ...
+    :param max_errors: ...
     """
 
-    return success(MappingValidator(structure_type))
+    if not is_error_limit(max_errors):
+        return failure(InvalidErrorLimitError(max_errors))
+
+    return success(
+        MappingValidator(
+            structure_type,
+            collect_all=collect_all,
+            max_errors=max_errors,
+        )
+    )
 
 
 def union_validator(
     choices: Mapping[str, Result[Validator, TestplatesError]],
     /,
+    *,
+    accept_sequences: bool = False,
+    untagged: bool = False,
 ) -> Result[Validator, TestplatesError]:
 
     """
     ...
 
     :param choices: ...
+    :param accept_sequences: ...
+    :param untagged: ...
     """
 
     union_choices: Dict[str, Validator] = {}
@@ -463,4 +522,171 @@ def union_validator(
         else:
             union_choices[key] = unwrap_success(choice)
 
-    return success(UnionValidator(union_choices))
+    return success(
+        UnionValidator(
+            union_choices,
+            accept_sequences=accept_sequences,
+            untagged=untagged,
+        )
+    )
+
+
+def compile_validator(
+    validator: Result[Validator, TestplatesError],
+    /,
+) -> Result[Validator, TestplatesError]:
+
+    """
+    Compiles validator into function that calls its check directly.
+
+    Compiled validator gives the same results as the original
+    one, but skips the validator call dispatch, which mostly
+    speeds up validators of scalar values. Nested validators
+    are not specialized, hence compiling validators of
+    sequences and mappings gives no measurable speedup.
+
+    :param validator: validator to be compiled
+    """
+
+    if not validator:
+        return validator
+
+    return success(compile_validator_impl(unwrap_success(validator)))
+
+
+def intern_validator(
+    validator: Result[Validator, TestplatesError],
+    /,
+) -> Result[Validator, TestplatesError]:
+
+    """
+    Interns validator in the process-wide validator registry.
+
+    Equal validators (created with the same arguments)
+    are interned into the single shared validator object.
+
+    :param validator: validator to be interned
+    """
+
+    if not validator:
+        return validator
+
+    return success(intern_validator_impl(unwrap_success(validator)))
+
+
+def memoize_validator(
+    validator: Result[Validator, TestplatesError],
+    /,
+    *,
+    maxsize: int = MEMO_CACHE_SIZE,
+    policy: EvictionPolicy = "lru",
+) -> Result[Validator, TestplatesError]:
+
+    """
+    Memoizes validator outcomes for immutable hashable values.
+
+    Outcomes for strings, bytes, integers and enum members are
+    cached by value type and value, so that the same value is
+    validated only once while it stays in the cache.
+
+    :param validator: validator to be memoized
+    :param maxsize: maximum number of cached outcomes
+    :param policy: eviction policy, either "lru" or "fifo"
+    """
+
+    if not validator:
+        return validator
+
+    if not isinstance(maxsize, int) or isinstance(maxsize, bool) or maxsize < 1:
+        return failure(InvalidCacheSizeError(maxsize))
+
+    if policy not in EVICTION_POLICIES:
+        return failure(InvalidEvictionPolicyError(policy))
+
+    return success(MemoizedValidator(unwrap_success(validator), maxsize=maxsize, policy=policy))
+
+
+def cache_info(
+    validator: Validator,
+    /,
+) -> Optional[CacheInfo]:
+
+    """
+    Returns cache statistics of the memoized validator
+    or None if validator is not memoized.
+
+    Statistics consist of the number of outcomes served from
+    the cache (hits), the number of values passed to the memoized
+    validator (misses), the maximum and the current number of
+    cached outcomes.
+
+    :param validator: memoized validator
+    """
+
+    if not isinstance(validator, MemoizedValidator):
+        return None
+
+    return validator.info
+
+
+def to_enum_member(
+    validator: Validator,
+    data: Any,
+    /,
+) -> Result[Enum, TestplatesError]:
+
+    """
+    Returns enum member of the data validated with the enum validator,
+    converting raw value to the enum member if raw values are accepted.
+
+    :param validator: enum validator
+    :param data: enum member or raw value of the enum member
+    """
+
+    if not isinstance(validator, EnumValidator):
+        return failure(InvalidEnumValidatorError(validator))
+
+    return validator.to_member(data)
+
+
+def check_data(
+    validator: Validator,
+    data: Any,
+    /,
+) -> Optional[ErrorRecord]:
+
+    """
+    Validates data and returns error record or None if data is correct.
+
+    Unlike calling the validator, only the lightweight
+    error record is created when validation fails. Error
+    itself can be obtained with :meth:`ErrorRecord.to_error`.
+
+    :param validator: validator to validate data with
+    :param data: data to be validated
+    """
+
+    return get_check(validator)(data)
+
+
+def check_paths(
+    validator: Validator,
+    data: Any,
+    /,
+) -> List[PathValidationError]:
+
+    """
+    Validates data and returns flat errors or empty list if data is correct.
+
+    Each error holds the path of indexes and keys leading to
+    the invalid value, such as ("orders", 17, "price"), and the
+    error of that value, without references to the enclosing data.
+
+    :param validator: validator to validate data with
+    :param data: data to be validated
+    """
+
+    if (record := get_check(validator)(data)) is None:
+        return []
+
+    return record.to_path_errors()
@@ -123,6 +123,29 @@ def test_validator_is_not_called_on_special_value_for_optional_field(
     assert init(template_type, **{key: ABSENT})
 
 
+# noinspection PyTypeChecker
+@given(name=st_name(), key=st.text())
+def test_value_equality_is_not_used_for_special_value_detection(
+    name: str,
+    key: str,
+) -> None:
+    class Incomparable:
+        def __eq__(self, other: object) -> bool:
+            assert False, other
+
+    value = Incomparable()
+    calls: List[Incomparable] = []
+
+    def validator(this_value: Incomparable, /) -> Result[None, TestplatesError]:
+        calls.append(this_value)
+        return success(None)
+
+    field_object = field(success(validator))
+    template_type = create(name, **{key: field_object})
+    assert init(template_type, **{key: value})
+    assert len(calls) == 1 and calls[0] is value
+
+
 # noinspection PyTypeChecker
 @given(name=st_name(), key=st.text(), value=st_anything_comparable(), message=st.text())
 def test_validator_failure(
@@ -160,3 +183,21 @@ def test_default_for_mutable_objects() -> None:
 def test_default_factory_for_mutable_objects() -> None:
     field_object = field(default_factory=list)
     assert field_object.default is not field_object.default
+
+
+# noinspection PyTypeChecker
+@given(name=st_name(), key=st.text())
+def test_default_factory_is_called_once_per_initialization(
+    name: str,
+    key: str,
+) -> None:
+    calls: List[None] = []
+
+    def default_factory() -> List[int]:
+        calls.append(None)
+        return list()
+
+    field_object = field(default_factory=default_factory)
+    template_type = create(name, **{key: field_object})
+    assert init(template_type)
+    assert len(calls) == 1
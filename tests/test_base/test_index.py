@@ -0,0 +1,88 @@
+from typing import (
+    Any,
+    List,
+    Dict,
+)
+
+from resultful import (
+    unwrap_success,
+)
+
+from hypothesis import (
+    given,
+    assume,
+    strategies as st,
+)
+
+from testplates import (
+    create,
+    init,
+    field,
+    create_index,
+    has_minimum_value,
+    ANY,
+    WILDCARD,
+    ABSENT,
+    Structure,
+)
+
+STRUCTURE_NAME: str = "Structure"
+
+
+def test_repr() -> None:
+    index = create_index()
+
+    assert repr(index) == "testplates.TemplateIndex([])"
+
+
+# noinspection PyTypeChecker
+@given(key=st.text(), values=st.lists(st.integers(), min_size=1, unique=True))
+def test_lookup_by_concrete_value(key: str, values: List[int]) -> None:
+    template_type = create(STRUCTURE_NAME, **{key: field()})
+    templates: List[Structure] = []
+
+    for value in values:
+        assert (result := init(template_type, **{key: value}))
+        templates.append(unwrap_success(result))
+
+    index = create_index(*templates)
+    assert len(index) == len(templates)
+    assert index.templates == tuple(templates)
+
+    for template, value in zip(templates, values):
+        assert index.lookup({key: value}) == [template]
+
+
+# noinspection PyTypeChecker
+@given(key=st.text(), other_key=st.text(), value=st.integers(), other_value=st.integers())
+def test_lookup_with_special_values_and_constraints(
+    key: str,
+    other_key: str,
+    value: int,
+    other_value: int,
+) -> None:
+    assume(key != other_key)
+    assume(value != other_value)
+
+    template_type = create(STRUCTURE_NAME, **{key: field(), other_key: field(optional=True)})
+    constraint = unwrap_success(has_minimum_value(minimum=value))
+
+    def template(**values: Any) -> Any:
+        return unwrap_success(init(template_type, **values))
+
+    first = template(**{key: value, other_key: ABSENT})
+    second = template(**{key: value, other_key: ANY})
+    third = template(**{key: ANY, other_key: WILDCARD})
+    fourth = template(**{key: constraint, other_key: other_value})
+
+    index = create_index(first, second, third, fourth)
+    records: List[Dict[str, Any]] = [
+        {key: value},
+        {key: value, other_key: other_value},
+        {key: other_value},
+        {key: [value]},
+    ]
+
+    for record in records:
+        expected = [item for item in (first, second, third, fourth) if item == record]
+        assert index.lookup(record) == expected
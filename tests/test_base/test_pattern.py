@@ -0,0 +1,116 @@
+import re
+
+from typing import (
+    Any,
+)
+
+from resultful import unwrap_success
+
+from hypothesis import (
+    given,
+    strategies as st,
+)
+
+from testplates import (
+    matches_pattern,
+    string_validator,
+    bytes_validator,
+    InvalidCacheSizeError,
+)
+
+from testplates.impl.base import (
+    compile_pattern,
+    PatternCache,
+    PATTERN_CACHE,
+)
+
+
+def test_repr() -> None:
+    fmt = "PatternCache(maxsize=2, size=1, hits=1, misses=1)"
+
+    cache = PatternCache(2)
+    cache.get("a")
+    cache.get("a")
+
+    assert repr(cache) == fmt
+
+
+def test_pattern_is_cached() -> None:
+    cache = PatternCache()
+
+    pattern = cache.get("[a-z]+")
+
+    assert cache.get("[a-z]+") is pattern
+    assert cache.hits == 1
+    assert cache.misses == 1
+    assert len(cache) == 1
+
+
+def test_pattern_is_cached_by_type_and_flags() -> None:
+    cache = PatternCache()
+
+    string_pattern = cache.get("a")
+    bytes_pattern = cache.get(b"a")
+    ignore_case_pattern = cache.get("a", re.IGNORECASE)
+
+    assert string_pattern.pattern == "a"
+    assert bytes_pattern.pattern == b"a"
+    assert ignore_case_pattern.flags & re.IGNORECASE
+    assert cache.hits == 0
+    assert cache.misses == 3
+    assert len(cache) == 3
+
+
+def test_least_recently_used_pattern_is_evicted() -> None:
+    cache = PatternCache(2)
+
+    first = cache.get("a")
+    cache.get("b")
+    cache.get("a")
+    cache.get("c")
+
+    assert len(cache) == cache.maxsize
+    assert cache.get("a") is first
+    assert cache.misses == 3
+
+    cache.get("b")
+
+    assert cache.misses == 4
+
+
+def test_clear() -> None:
+    cache = PatternCache()
+    cache.get("a")
+    cache.get("a")
+
+    cache.clear()
+
+    assert len(cache) == 0
+    assert cache.hits == 0
+    assert cache.misses == 0
+
+
+def test_pattern_is_shared() -> None:
+    pattern = compile_pattern("[0-9]+-shared")
+
+    assert (constraint_result := matches_pattern("[0-9]+-shared"))
+    assert (string_result := string_validator(pattern="[0-9]+-shared"))
+    assert (bytes_result := bytes_validator(pattern=b"[0-9]+-shared"))
+
+    string_validator_object: Any = unwrap_success(string_result)
+    bytes_validator_object: Any = unwrap_success(bytes_result)
+
+    assert unwrap_success(constraint_result).pattern is pattern
+    assert string_validator_object.pattern is pattern
+    assert bytes_validator_object.pattern is PATTERN_CACHE.get(b"[0-9]+-shared")
+
+
+# noinspection PyTypeChecker
+@given(maxsize=st.integers(max_value=0))
+def test_invalid_cache_size_error(maxsize: int) -> None:
+    try:
+        PatternCache(maxsize)
+    except InvalidCacheSizeError as error:
+        assert error.size == maxsize
+    else:
+        assert False, "Invalid cache size was accepted"
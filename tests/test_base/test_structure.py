@@ -1,6 +1,7 @@
 from typing import (
     Any,
     Dict,
+    List,
 )
 
 from string import (
@@ -21,13 +22,16 @@ from hypothesis import (
 
 from testplates import (
     create,
+    compact,
     init,
     verify,
     modify,
     value_of,
     fields,
     items,
+    match_many,
     field,
+    integer_validator,
     ANY,
     WILDCARD,
     ABSENT,
@@ -35,7 +39,10 @@ from testplates import (
     MissingValueError,
     UnexpectedValueError,
     ProhibitedValueError,
+    InvalidTypeError,
     InvalidStructureError,
+    InvalidBatchSizeError,
+    CompactSubclassError,
 )
 
 from tests.strategies import Draw
@@ -89,6 +96,30 @@ def test_equality(
     assert template == Storage(**{key: value})
 
 
+# noinspection PyTypeChecker
+@given(name=st_name(), key=st.text(), other_key=st.text(), value=st.integers())
+def test_equality_with_dict_and_structure(
+    name: str,
+    key: str,
+    other_key: str,
+    value: int,
+) -> None:
+    assume(key != other_key)
+
+    template_type = create(name, **{key: field(), other_key: field(optional=True)})
+    assert (result := init(template_type, **{key: value, other_key: WILDCARD}))
+    assert (other_result := init(template_type, **{key: value, other_key: ABSENT}))
+
+    template = unwrap_success(result)
+    other_template = unwrap_success(other_result)
+    assert template == {key: value}
+    assert template == {key: value, other_key: value}
+    assert template != {other_key: value}
+    assert template == other_template
+    assert other_template == {key: value}
+    assert other_template != {key: value, other_key: value}
+
+
 # noinspection PyTypeChecker
 @given(name=st_name(), key=st.text(), other_key=st.text(), value=st.integers())
 def test_inequality_due_to_unequal_key(
@@ -252,6 +283,27 @@ def test_absent_value_mismatches_any_value_in_optional_field(
     assert template != Storage(**{key: value})
 
 
+# noinspection PyTypeChecker
+@given(name=st_name(), key=st.text(), other_key=st.text(), value=st.integers())
+def test_absent_value_matches_absent_value_in_optional_field(
+    name: str,
+    key: str,
+    other_key: str,
+    value: int,
+) -> None:
+    assume(key != other_key)
+
+    template_type = create(name, **{key: field(), other_key: field(optional=True)})
+    assert (result := init(template_type, **{key: value, other_key: ABSENT}))
+    assert (other_result := init(template_type, **{key: value, other_key: ABSENT}))
+
+    template = unwrap_success(result)
+    other_template = unwrap_success(other_result)
+    assert template == template
+    assert template == other_template
+    assert other_template == template
+
+
 # noinspection PyTypeChecker
 @given(name=st_name(), key=st.text())
 def test_absent_value_error_in_required_field(
@@ -314,6 +366,24 @@ def test_missing_value_in_required_field_value_error(
     assert inner_error.field == field_object
 
 
+# noinspection PyTypeChecker
+@given(name=st_name(), key=st.text(), value=st.integers())
+def test_instance_errors_do_not_leak_into_other_instances(
+    name: str,
+    key: str,
+    value: int,
+) -> None:
+    field_object = field()
+    template_type = create(name, **{key: field_object})
+    assert not init(template_type)
+    assert (result := init(template_type, **{key: value}))
+    assert (verify_result := verify(template_type))
+
+    template = unwrap_success(result)
+    assert unwrap_success(verify_result) is None
+    assert template == Storage(**{key: value})
+
+
 # noinspection PyTypeChecker
 @given(name=st_name(), key=st.text())
 def test_missing_value_in_optional_field_value_error(
@@ -565,3 +635,186 @@ def test_items_failure(
     error = unwrap_failure(result)
     assert isinstance(error, InvalidStructureError)
     assert error.errors == [field_error]
+
+
+# noinspection PyTypeChecker
+@given(
+    name=st_name(),
+    key=st.text(),
+    values=st.lists(st.integers()),
+    value=st.integers(),
+    batch_size=st.integers(min_value=1, max_value=8),
+)
+def test_match_many(
+    name: str,
+    key: str,
+    values: List[int],
+    value: int,
+    batch_size: int,
+) -> None:
+    field_object = field()
+    template_type = create(name, **{key: field_object})
+    assert (result := init(template_type, **{key: value}))
+
+    template = unwrap_success(result)
+    candidates = [Storage(**{key: candidate_value}) for candidate_value in values]
+    assert (outcome_result := match_many(template, candidates, batch_size=batch_size))
+
+    outcome = unwrap_success(outcome_result)
+    assert outcome == [template == candidate for candidate in candidates]
+
+
+# noinspection PyTypeChecker
+@given(name=st_name(), key=st.text(), other_key=st.text(), value=st.integers())
+def test_match_many_with_special_values(
+    name: str,
+    key: str,
+    other_key: str,
+    value: int,
+) -> None:
+    assume(key != other_key)
+
+    template_type = create(name, **{key: field(), other_key: field(optional=True)})
+    assert (result := init(template_type, **{key: ANY, other_key: ABSENT}))
+
+    template = unwrap_success(result)
+    candidates = [
+        {key: value},
+        {key: value, other_key: value},
+        {other_key: value},
+        {},
+    ]
+
+    assert (outcome_result := match_many(template, candidates))
+    assert unwrap_success(outcome_result) == [True, False, False, False]
+
+
+# noinspection PyTypeChecker
+@given(name=st_name(), key=st.text(), value=st.integers(), batch_size=st.integers(max_value=0))
+def test_match_many_failure(
+    name: str,
+    key: str,
+    value: int,
+    batch_size: int,
+) -> None:
+    template_type = create(name, **{key: field()})
+    assert (result := init(template_type, **{key: value}))
+
+    template = unwrap_success(result)
+    assert not (outcome_result := match_many(template, [{key: value}], batch_size=batch_size))
+
+    error = unwrap_failure(outcome_result)
+    assert isinstance(error, InvalidBatchSizeError)
+    assert error.size == batch_size
+
+
+# noinspection PyTypeChecker
+@given(
+    name=st_name(),
+    key=st.text(),
+    other_key=st.text(),
+    value=st.integers(),
+    default=st.integers(),
+)
+def test_compact(
+    name: str,
+    key: str,
+    other_key: str,
+    value: int,
+    default: int,
+) -> None:
+    assume(key != other_key)
+
+    template_type = create(name, **{key: field(), other_key: field(default=default)})
+    compact_type = compact(template_type)
+    assert compact(compact_type) is compact_type
+    assert issubclass(compact_type, template_type)
+
+    assert (result := init(template_type, **{key: value}))
+    assert (compact_result := init(compact_type, **{key: value}))
+
+    template = unwrap_success(result)
+    compact_template = unwrap_success(compact_result)
+    assert dict(compact_template) == dict(template) == {key: value, other_key: default}
+    assert getattr(compact_template, key) == value
+    assert getattr(compact_template, other_key) == default
+    assert compact_template == template
+    assert template == compact_template
+    assert repr(compact_template) == f"{name}({key}={value!r}, {other_key}={default!r})"
+    assert unwrap_success(value_of(compact_template)) == {key: value, other_key: default}
+
+    assert (modify_result := modify(compact_template, **{other_key: value}))
+    assert type(modified_template := unwrap_success(modify_result)) is compact_type
+    assert dict(modified_template) == {key: value, other_key: value}
+
+
+def test_compact_slots() -> None:
+    template_type = create("Template", a=field(), b=field(optional=True), **{"c d": field()})
+    compact_type = compact(template_type)
+    assert compact_type.__slots__ == ("a", "b", "_testplates_slot_2_")  # type: ignore
+
+    template = compact_type(a=1, **{"c d": 2})
+    assert template.a == 1  # type: ignore
+    assert getattr(template, "c d") == 2
+    assert "b" not in template
+    assert dict(template) == {"a": 1, "c d": 2}
+    assert template["c d"] == 2
+    assert list(template) == ["a", "c d"]
+    assert len(template) == 2
+    assert template.get("b") is None
+
+
+def test_compact_unset_values() -> None:
+    template_type = create("Template", a=field(optional=True))
+    compact_type = compact(template_type)
+    template = compact_type()
+
+    for key in ("a", "b"):
+        try:
+            template[key]
+        except KeyError:
+            pass
+        else:
+            assert False, f"{key!r} must not be found"
+
+    try:
+        template.a  # type: ignore
+    except AttributeError:
+        pass
+    else:
+        assert False, "unset slot must not be readable"
+
+    assert (fields_result := fields(compact_type))
+    assert unwrap_success(fields_result)["a"] is template_type.a  # type: ignore
+    assert compact_type.a is not template_type.a  # type: ignore
+
+
+def test_compact_subclass_failure() -> None:
+    compact_type = compact(create("Template", a=field()))
+
+    try:
+
+        class Subclass(compact_type):  # type: ignore
+
+            d = field()
+
+    except CompactSubclassError as error:
+        assert error.structure_type is compact_type
+    else:
+        assert False, "compact structure type must not be subclassed"
+
+
+# noinspection PyTypeChecker
+@given(value=st.text())
+def test_compact_failure(value: str) -> None:
+    template_type = create("Template", a=field(integer_validator()))
+    compact_type = compact(template_type)
+
+    assert not (result := init(compact_type, a=value, b=value))
+
+    error = unwrap_failure(result)
+    assert isinstance(error, InvalidStructureError)
+    assert [type(inner_error) for inner_error in error.errors] == [
+        UnexpectedValueError,
+        InvalidTypeError,
+    ]
@@ -0,0 +1,153 @@
+import array
+
+from typing import (
+    Any,
+    List,
+    Final,
+)
+
+from resultful import (
+    unwrap_success,
+    unwrap_failure,
+)
+
+from hypothesis import (
+    given,
+    strategies as st,
+)
+
+from testplates import (
+    create,
+    init,
+    field,
+    value_of,
+    create_table,
+    integer_validator,
+    ANY,
+    WILDCARD,
+    ABSENT,
+    InvalidStructureError,
+    InvalidTypeError,
+    MissingValueError,
+)
+
+STRUCTURE_NAME: Final[str] = "Structure"
+
+STRUCTURE_TYPE: Final = create(
+    STRUCTURE_NAME,
+    a=field(integer_validator()),
+    b=field(),
+    c=field(default="c", optional=True),
+)
+
+
+def test_repr() -> None:
+    assert (table_result := create_table(STRUCTURE_TYPE, [dict(a=1, b=2)]))
+
+    table = unwrap_success(table_result)
+
+    assert repr(table) == f"testplates.StructureTable({STRUCTURE_NAME}, rows=1)"
+    assert repr(table[0]) == f"{STRUCTURE_NAME}(a=1, b=2, c='c')"
+
+
+# noinspection PyTypeChecker
+@given(values=st.lists(st.integers(), min_size=1))
+def test_rows(values: List[int]) -> None:
+    rows = [dict(a=value, b=value) for value in values]
+    assert (table_result := create_table(STRUCTURE_TYPE, rows))
+
+    table = unwrap_success(table_result)
+    assert len(table) == len(values)
+
+    for index, row in enumerate(table):
+        assert row.index == index
+        assert len(row) == 3
+        assert dict(row) == dict(a=values[index], b=values[index], c="c")
+        assert row["a"] == values[index]
+        assert unwrap_success(value_of(row)) == dict(row)
+        assert row == unwrap_success(init(STRUCTURE_TYPE, **rows[index]))
+        assert unwrap_success(init(STRUCTURE_TYPE, **rows[index])) == row
+
+    assert table[-1] == dict(a=values[-1], b=values[-1], c="c")
+    assert [row.index for row in table[1:]] == list(range(1, len(values)))
+    assert table[::-1] == list(reversed(list(table)))
+
+
+def test_invalid_index() -> None:
+    assert (table_result := create_table(STRUCTURE_TYPE, [dict(a=1, b=2)]))
+
+    table = unwrap_success(table_result)
+
+    for index in (1, -2):
+        try:
+            table[index]
+        except IndexError:
+            pass
+        else:
+            assert False, f"row {index!r} must not be found"
+
+    try:
+        table["a"]  # type: ignore
+    except TypeError:
+        pass
+    else:
+        assert False, "row must not be found by key"
+
+
+def test_columns() -> None:
+    assert (table_result := create_table(STRUCTURE_TYPE, [dict(a=1, b=1.0), dict(a=2, b=2.0)]))
+
+    table = unwrap_success(table_result)
+    columns = table.columns
+
+    assert isinstance(columns["a"], array.array)
+    assert isinstance(columns["b"], array.array)
+    assert isinstance(columns["c"], list)
+
+    assert table.append(a=2**64, b=True)
+    assert table.append(a=3, b=ANY, c=ABSENT)
+
+    assert columns["a"] == [1, 2, 2**64, 3]
+    assert columns["b"] == [1.0, 2.0, True, ANY]
+    assert isinstance(columns["a"], list)
+    assert isinstance(columns["b"], list)
+    assert type(table[2]["b"]) is bool
+    assert dict(table[3]) == dict(a=3, b=ANY, c=ABSENT)
+
+
+# noinspection PyTypeChecker
+@given(value=st.integers())
+def test_match_with_special_values(value: int) -> None:
+    rows = [dict(a=ANY, b=value, c=ABSENT), dict(a=value, b=value, c=WILDCARD)]
+    assert (table_result := create_table(STRUCTURE_TYPE, rows))
+
+    table = unwrap_success(table_result)
+    row, other_row = table
+
+    assert row == dict(a=value, b=value)
+    assert row != dict(a=value, b=value, c="c")
+    assert row != dict(b=value)
+
+    assert other_row == dict(a=value, b=value)
+    assert other_row == dict(a=value, b=value, c=None)
+    assert other_row != dict(a=value)
+
+
+def test_failure() -> None:
+    assert (table_result := create_table(STRUCTURE_TYPE))
+
+    table = unwrap_success(table_result)
+
+    rows: List[Any] = [dict(a=1, b=1), dict(a="a", b=2), dict(a=3, b=3)]
+    assert not (result := table.extend(rows))
+    assert len(table) == 1
+
+    error = unwrap_failure(result)
+    assert isinstance(error, InvalidStructureError)
+    assert [type(inner_error) for inner_error in error.errors] == [InvalidTypeError]
+
+    assert not (table_result := create_table(STRUCTURE_TYPE, [dict(a=1)]))
+
+    error = unwrap_failure(table_result)
+    assert isinstance(error, InvalidStructureError)
+    assert [type(inner_error) for inner_error in error.errors] == [MissingValueError]
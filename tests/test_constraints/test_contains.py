@@ -102,3 +102,23 @@ def test_returns_false_when_value_is_not_container(values: List[Any]) -> None:
 
     constraint = unwrap_success(result)
     assert constraint != NotContainer()
+
+
+# noinspection PyTypeChecker
+# noinspection PyArgumentList
+@given(values=st.lists(st.integers(), min_size=8, unique=True))
+def test_returns_true_with_many_values(values: List[int]) -> None:
+    assert (result := contains(*values))
+
+    constraint = unwrap_success(result)
+    assert constraint == list(reversed(values))
+    assert constraint == tuple(values) + ([],)
+    assert constraint != values[1:] + [[]]
+
+
+def test_returns_false_when_value_is_string() -> None:
+    assert (result := contains("a", "b", "c", "d"))
+
+    constraint = unwrap_success(result)
+    assert constraint == "abcd"
+    assert constraint != ["abcd"]
@@ -79,3 +79,21 @@ def test_returns_false(data: st.DataObject, value: Any) -> None:
 
     constraint = unwrap_success(result)
     assert constraint != value
+
+
+# noinspection PyTypeChecker
+# noinspection PyArgumentList
+@given(values=st.lists(st.integers(), min_size=MINIMUM_NUMBER_OF_VALUES))
+def test_returns_false_when_value_is_not_hashable(values: List[int]) -> None:
+    assert (result := is_one_of(*values))
+
+    constraint = unwrap_success(result)
+    assert constraint != list(values)
+
+
+def test_returns_true_when_values_are_not_hashable() -> None:
+    assert (result := is_one_of([1], {2: 3}))
+
+    constraint = unwrap_success(result)
+    assert constraint == {2: 3}
+    assert constraint != [2]
@@ -207,3 +207,37 @@ def test_returns_false_when_value_is_not_container(values: List[Any]) -> None:
 
     constraint = unwrap_success(result)
     assert constraint != NotContainer(values)
+
+
+# noinspection PyTypeChecker
+@given(values=st.lists(st.lists(st.integers())))
+def test_returns_true_with_unhashable_values(values: List[List[int]]) -> None:
+    other = values.copy()
+    random.shuffle(other)
+
+    assert (constraint_result := is_permutation_of(values))
+
+    constraint = unwrap_success(constraint_result)
+    assert constraint == other
+
+
+# noinspection PyTypeChecker
+@given(values=st.lists(st.lists(st.integers()), min_size=1), value=st.lists(st.integers()))
+def test_returns_false_with_unhashable_values(values: List[List[int]], value: List[int]) -> None:
+    assume(value not in values)
+
+    other = values.copy()
+    other[0] = value
+
+    assert (constraint_result := is_permutation_of(values))
+
+    constraint = unwrap_success(constraint_result)
+    assert constraint != other
+
+
+def test_returns_true_with_partially_ordered_values() -> None:
+    assert (constraint_result := is_permutation_of([{1}, {2}, {1, 2}]))
+
+    constraint = unwrap_success(constraint_result)
+    assert constraint == [{2}, {1, 2}, {1}]
+    assert constraint != [{2}, {1, 2}, {2}]
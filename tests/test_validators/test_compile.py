@@ -0,0 +1,126 @@
+import enum
+
+from typing import (
+    Any,
+    List,
+    Final,
+)
+
+from resultful import (
+    success,
+    failure,
+    unwrap_success,
+    unwrap_failure,
+    Result,
+)
+
+from hypothesis import (
+    given,
+    strategies as st,
+)
+
+from testplates import (
+    create,
+    field,
+    compile_validator,
+    passthrough_validator,
+    type_validator,
+    boolean_validator,
+    integer_validator,
+    string_validator,
+    bytes_validator,
+    enum_validator,
+    sequence_validator,
+    mapping_validator,
+    union_validator,
+    Validator,
+    TestplatesError,
+)
+
+from tests.strategies import (
+    st_anything_comparable,
+)
+
+
+class Color(enum.Enum):
+
+    RED = enum.auto()
+    GREEN = enum.auto()
+
+
+STRUCTURE_TYPE: Final = create(
+    "Structure",
+    a=field(integer_validator(minimum=0)),
+    b=field(string_validator(), optional=True),
+)
+
+VALIDATORS: Final[List[Result[Validator, TestplatesError]]] = [
+    passthrough_validator(),
+    type_validator(int, str),
+    boolean_validator(),
+    integer_validator(),
+    integer_validator(minimum=-5, exclusive_maximum=10),
+    integer_validator(exclusive_minimum=-5, maximum=10, allow_bool=True),
+    string_validator(minimum_size=1, maximum_size=4, pattern="[a-z]+"),
+    bytes_validator(maximum_size=3, pattern=b"[a-z]"),
+    enum_validator(Color),
+    enum_validator(Color, accept_values=True),
+    sequence_validator(integer_validator(minimum=0, maximum=255), maximum_size=4),
+    sequence_validator(minimum_size=1, unique_items=True),
+    sequence_validator(integer_validator(maximum=5), unique_items=True, collect_all=True),
+    mapping_validator(STRUCTURE_TYPE),
+    mapping_validator(STRUCTURE_TYPE, collect_all=True),
+    union_validator({"a": integer_validator(maximum=5), "b": string_validator()}),
+    union_validator({"a": integer_validator(maximum=5), "b": string_validator()}, untagged=True),
+]
+
+
+def st_data() -> st.SearchStrategy[Any]:
+    return st.one_of(
+        st_anything_comparable(),
+        st.integers(min_value=-20, max_value=20),
+        st.text(max_size=8),
+        st.binary(max_size=8),
+        st.lists(st.integers(min_value=-5, max_value=300), max_size=6),
+        st.tuples(st.sampled_from(["a", "b", "c"]), st.integers()),
+        st.dictionaries(st.sampled_from(["a", "b", "c"]), st.integers(), max_size=3),
+        st.sampled_from(Color),
+    )
+
+
+def test_failure_is_passed_through() -> None:
+    error = TestplatesError()
+
+    assert not (result := compile_validator(failure(error)))
+    assert unwrap_failure(result) is error
+
+
+def test_unknown_validator_is_returned_as_is() -> None:
+    def validator(data: Any, /) -> Result[None, TestplatesError]:
+        return success(None)
+
+    assert (result := compile_validator(success(validator)))
+    assert unwrap_success(result) is validator
+
+
+# noinspection PyTypeChecker
+@given(data=st_data())
+def test_compiled_validator_matches_validator(data: Any) -> None:
+    for validator_result in VALIDATORS:
+        assert validator_result
+        assert (compiled_result := compile_validator(validator_result))
+
+        validator = unwrap_success(validator_result)
+        compiled_validator = unwrap_success(compiled_result)
+        result = validator(data)
+        compiled = compiled_validator(data)
+
+        assert bool(result) == bool(compiled), (validator, data)
+
+        if not result:
+            assert not compiled
+
+            error = unwrap_failure(result)
+            compiled_error = unwrap_failure(compiled)
+            assert type(error) is type(compiled_error)
+            assert error.message == compiled_error.message
@@ -26,9 +26,12 @@ from testplates import (
     enum_validator,
     passthrough_validator,
     integer_validator,
+    to_enum_member,
     Validator,
     TestplatesError,
     InvalidTypeError,
+    InvalidEnumValueError,
+    InvalidEnumValidatorError,
     MemberValidationError,
 )
 
@@ -150,3 +153,77 @@ def test_enum_instance_otherness_sanity() -> None:
     assert isinstance(error, InvalidTypeError)
     assert error.data == DifferentExample.VALUE
     assert error.allowed_types == (Example,)
+
+
+# noinspection PyTypeChecker
+@given(members=st.dictionaries(st.text(min_size=1), st_uint8(), min_size=1))
+def test_success_with_value(members: Dict[str, Any]) -> None:
+    enum_type = create_enum_type(members)
+    member: Enum = sample(enum_type)
+    assert (validator_result := enum_validator(enum_type, accept_values=True))
+
+    validator = unwrap_success(validator_result)
+    assert validator(member)
+    assert validator(member.value)
+
+    assert (to_member_result := to_enum_member(validator, member.value))
+    assert unwrap_success(to_member_result) is enum_type(member.value)
+
+
+# noinspection PyTypeChecker
+@given(members=st.dictionaries(st.text(min_size=1), st_uint8(), min_size=1))
+def test_failure_when_value_is_invalid(members: Dict[str, Any]) -> None:
+    enum_type = create_enum_type(members)
+    assert (validator_result := enum_validator(enum_type, accept_values=True))
+
+    validator = unwrap_success(validator_result)
+
+    for data in (256, [1], "a"):
+        assert not (validation_result := validator(data))
+
+        error = unwrap_failure(validation_result)
+        assert isinstance(error, InvalidEnumValueError)
+        assert error.data == data
+        assert error.enum_type is enum_type
+
+
+def test_success_with_unhashable_value() -> None:
+    class Example(Enum):
+        FIRST = [1]
+        SECOND = 2
+
+    assert (validator_result := enum_validator(Example, accept_values=True))
+
+    validator = unwrap_success(validator_result)
+    assert validator([1])
+    assert validator(2)
+    assert not validator([2])
+
+    assert unwrap_success(to_enum_member(validator, [1])) is Example.FIRST
+    assert unwrap_success(to_enum_member(validator, Example.SECOND)) is Example.SECOND
+
+
+def test_to_member_when_values_are_not_accepted() -> None:
+    class Example(Enum):
+        VALUE = 0
+
+    assert (validator_result := enum_validator(Example))
+
+    validator = unwrap_success(validator_result)
+    assert unwrap_success(to_enum_member(validator, Example.VALUE)) is Example.VALUE
+    assert not (to_member_result := to_enum_member(validator, 0))
+
+    error = unwrap_failure(to_member_result)
+    assert isinstance(error, InvalidTypeError)
+
+
+def test_to_member_when_validator_is_not_enum_validator() -> None:
+    class Example(Enum):
+        VALUE = 0
+
+    validator = unwrap_success(passthrough_validator())
+    assert not (to_member_result := to_enum_member(validator, Example.VALUE))
+
+    error = unwrap_failure(to_member_result)
+    assert isinstance(error, InvalidEnumValidatorError)
+    assert error.validator is validator
@@ -766,3 +766,13 @@ def test_failure_when_exclusive_minimum_and_exclusive_maximum_match_single_value
     assert error.minimum.is_inclusive is False
     assert error.maximum.value == exclusive_maximum
     assert error.maximum.is_inclusive is False
+
+
+@given(data=st.integers(), other_data=st.integers())
+def test_success_result_is_shared(data: int, other_data: int) -> None:
+    assert (validator_result := integer_validator())
+
+    validator = unwrap_success(validator_result)
+    assert (validation_result := validator(data))
+    assert (other_validation_result := validator(other_data))
+    assert validation_result is other_validation_result
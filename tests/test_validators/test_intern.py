@@ -0,0 +1,150 @@
+import gc
+import enum
+
+from typing import (
+    Callable,
+    List,
+    Final,
+)
+
+from resultful import (
+    success,
+    unwrap_success,
+    Result,
+)
+
+from testplates import (
+    create,
+    field,
+    intern_validator,
+    passthrough_validator,
+    type_validator,
+    boolean_validator,
+    integer_validator,
+    string_validator,
+    bytes_validator,
+    enum_validator,
+    sequence_validator,
+    mapping_validator,
+    union_validator,
+    Validator,
+    TestplatesError,
+)
+
+from testplates.impl.validators import (
+    ValidatorRegistry,
+)
+
+
+class Color(enum.Enum):
+
+    RED = enum.auto()
+    GREEN = enum.auto()
+
+
+STRUCTURE_TYPE: Final = create(
+    "Structure",
+    a=field(integer_validator(minimum=0)),
+)
+
+FACTORIES: Final[List[Callable[[], Result[Validator, TestplatesError]]]] = [
+    lambda: passthrough_validator(),
+    lambda: type_validator(int, str),
+    lambda: boolean_validator(),
+    lambda: integer_validator(minimum=-5, exclusive_maximum=10),
+    lambda: string_validator(minimum_size=1, pattern="[a-z]+"),
+    lambda: bytes_validator(maximum_size=3, pattern=b"[a-z]"),
+    lambda: enum_validator(Color),
+    lambda: sequence_validator(integer_validator(maximum=255), unique_items=True),
+    lambda: mapping_validator(STRUCTURE_TYPE),
+    lambda: union_validator({"a": integer_validator(), "b": string_validator()}),
+]
+
+
+def test_equal_validators() -> None:
+    for factory in FACTORIES:
+        first = unwrap_success(factory())
+        second = unwrap_success(factory())
+
+        assert first is not second or first is unwrap_success(passthrough_validator())
+        assert first == second
+        assert hash(first) == hash(second)
+
+
+def test_different_validators() -> None:
+    validators = [unwrap_success(factory()) for factory in FACTORIES]
+
+    assert len(set(validators)) == len(validators)
+    assert unwrap_success(integer_validator(minimum=0)) != unwrap_success(
+        integer_validator(exclusive_minimum=0)
+    )
+    assert unwrap_success(string_validator(pattern="a")) != unwrap_success(
+        string_validator(pattern="b")
+    )
+    assert unwrap_success(string_validator()) != unwrap_success(bytes_validator())
+
+
+def test_intern_validator() -> None:
+    for factory in FACTORIES:
+        assert (first := intern_validator(factory()))
+        assert (second := intern_validator(factory()))
+
+        assert unwrap_success(first) is unwrap_success(second)
+
+
+def test_intern_validator_failure() -> None:
+    assert not (result := type_validator(1))  # type: ignore
+
+    assert intern_validator(result) is result
+
+
+def test_registry_does_not_keep_validators_alive() -> None:
+    registry = ValidatorRegistry()
+    assert (result := integer_validator(minimum=0))
+
+    validator = unwrap_success(result)
+
+    assert registry.intern(validator) is validator
+    assert len(registry) == 1
+
+    del validator, result
+    gc.collect()
+
+    assert len(registry) == 0
+
+
+def test_registry_returns_plain_functions_as_is() -> None:
+    registry = ValidatorRegistry()
+
+    def validator(data: object, /) -> Result[None, TestplatesError]:
+        return unwrap_success(passthrough_validator())(data)
+
+    assert registry.intern(validator) is validator
+    assert len(registry) == 0
+
+
+def test_unhashable_choice_validators() -> None:
+    class UnhashableValidator:
+
+        __hash__ = None  # type: ignore
+
+        def __call__(self, data: object, /) -> Result[None, TestplatesError]:
+            return unwrap_success(passthrough_validator())(data)
+
+    choice = UnhashableValidator()
+
+    assert (union_result := union_validator({"a": success(choice)}))
+    assert (other_union_result := union_validator({"a": success(choice)}))
+    assert (sequence_result := sequence_validator(union_result))
+    assert (other_sequence_result := sequence_validator(other_union_result))
+
+    union = unwrap_success(union_result)
+    sequence = unwrap_success(sequence_result)
+
+    assert union == union
+    assert union == unwrap_success(other_union_result)
+    assert union != unwrap_success(union_validator({"a": success(UnhashableValidator())}))
+    assert sequence == unwrap_success(other_sequence_result)
+
+    assert unwrap_success(intern_validator(union_result)) is union
+    assert unwrap_success(intern_validator(sequence_result)) is sequence
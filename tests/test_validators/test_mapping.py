@@ -1,3 +1,7 @@
+from types import (
+    MappingProxyType,
+)
+
 from typing import (
     Any,
     Mapping,
@@ -21,12 +25,17 @@ from testplates import (
     create,
     mapping_validator,
     passthrough_validator,
+    integer_validator,
+    sequence_validator,
     Field,
     TestplatesError,
     InvalidTypeError,
     RequiredKeyMissingError,
     UnknownFieldError,
     FieldValidationError,
+    ItemValidationError,
+    MultipleValidationError,
+    InvalidErrorLimitError,
 )
 
 from tests.strategies import (
@@ -139,3 +148,108 @@ def test_failure_when_data_field_validation_fails(key: str, value: int, message:
     assert error.data == {key: value}
     assert error.field == field_object
     assert error.error == field_error
+
+
+def test_success_with_mapping_proxy() -> None:
+    structure_type = create(STRUCTURE_NAME, a=field(integer_validator()), b=field(optional=True))
+    assert (validator_result := mapping_validator(structure_type))
+
+    validator = unwrap_success(validator_result)
+    assert validator(MappingProxyType({"a": 1}))
+    assert validator(MappingProxyType({"a": 1, "b": "b"}))
+    assert not validator(MappingProxyType({"b": "b"}))
+    assert not validator(MappingProxyType({"a": 1, "c": "c"}))
+
+
+def test_failure_when_first_required_key_is_missing() -> None:
+    structure_type = create(
+        STRUCTURE_NAME, a=field(), b=field(optional=True), c=field(), d=field(), e=field()
+    )
+    assert (validator_result := mapping_validator(structure_type))
+
+    validator = unwrap_success(validator_result)
+    assert not (validation_result := validator({"a": 1, "e": 5}))
+
+    error = unwrap_failure(validation_result)
+    assert isinstance(error, RequiredKeyMissingError)
+    assert error.key == "c"
+
+
+def test_failure_when_data_has_unknown_field_and_field_validation_fails() -> None:
+    structure_type = create(STRUCTURE_NAME, a=field(integer_validator()))
+    assert (validator_result := mapping_validator(structure_type))
+
+    validator = unwrap_success(validator_result)
+    assert not (validation_result := validator({"a": "a", "b": 1, "c": 2}))
+
+    error = unwrap_failure(validation_result)
+    assert isinstance(error, UnknownFieldError)
+    assert error.key == "b"
+
+
+def test_failure_when_all_errors_are_collected() -> None:
+    item_type = create("Item", price=field(integer_validator(minimum=0)))
+    item_validator = mapping_validator(item_type, collect_all=True)
+    structure_type = create(
+        STRUCTURE_NAME,
+        a=field(integer_validator()),
+        b=field(),
+        orders=field(sequence_validator(item_validator, collect_all=True)),
+    )
+    assert (validator_result := mapping_validator(structure_type, collect_all=True))
+
+    validator = unwrap_success(validator_result)
+    data = {"a": "a", "c": 1, "orders": [{"price": 1}, {"price": -1}, {"price": 2, "x": 0}]}
+    assert not (validation_result := validator(data))
+
+    error = unwrap_failure(validation_result)
+    assert isinstance(error, MultipleValidationError)
+    assert error.data == data
+
+    missing_error, unknown_error, field_error, orders_error = error.errors
+    assert isinstance(missing_error, RequiredKeyMissingError)
+    assert missing_error.key == "b"
+    assert isinstance(unknown_error, UnknownFieldError)
+    assert unknown_error.key == "c"
+    assert isinstance(field_error, FieldValidationError)
+    assert field_error.field.name == "a"
+    assert isinstance(orders_error, FieldValidationError)
+    assert isinstance(orders_error.error, MultipleValidationError)
+
+    first_item_error, second_item_error = orders_error.error.errors
+    assert isinstance(first_item_error, ItemValidationError)
+    assert first_item_error.index == 1
+    assert isinstance(first_item_error.error, MultipleValidationError)
+    assert isinstance(first_item_error.error.errors[0], FieldValidationError)
+    assert isinstance(second_item_error, ItemValidationError)
+    assert second_item_error.index == 2
+    assert isinstance(second_item_error.error, MultipleValidationError)
+    assert isinstance(second_item_error.error.errors[0], UnknownFieldError)
+
+
+def test_failure_when_errors_limit_is_reached() -> None:
+    structure_type = create(STRUCTURE_NAME, a=field(), b=field(), c=field())
+    assert (validator_result := mapping_validator(structure_type, collect_all=True, max_errors=2))
+
+    validator = unwrap_success(validator_result)
+    assert validator({"a": 1, "b": 2, "c": 3})
+    assert not (validation_result := validator({}))
+
+    error = unwrap_failure(validation_result)
+    assert isinstance(error, MultipleValidationError)
+    assert len(error.errors) == 2
+    assert [
+        missing_error.key
+        for missing_error in error.errors
+        if isinstance(missing_error, RequiredKeyMissingError)
+    ] == ["a", "b"]
+
+
+def test_failure_when_errors_limit_is_invalid() -> None:
+    structure_type = create(STRUCTURE_NAME)
+
+    assert not (validator_result := mapping_validator(structure_type, max_errors=0))
+
+    error = unwrap_failure(validator_result)
+    assert isinstance(error, InvalidErrorLimitError)
+    assert error.limit == 0
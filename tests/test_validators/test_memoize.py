@@ -0,0 +1,205 @@
+import enum
+
+from typing import (
+    Any,
+    List,
+)
+
+from resultful import (
+    success,
+    unwrap_success,
+    unwrap_failure,
+    Result,
+)
+
+from hypothesis import (
+    given,
+    strategies as st,
+)
+
+from testplates import (
+    memoize_validator,
+    cache_info,
+    integer_validator,
+    string_validator,
+    enum_validator,
+    TestplatesError,
+    InvalidTypeError,
+    InvalidMinimumValueError,
+    InvalidCacheSizeError,
+    InvalidEvictionPolicyError,
+    CacheInfo,
+)
+
+from testplates.impl.validators import (
+    MemoizedValidator,
+)
+
+from tests.strategies import (
+    st_anything_comparable,
+)
+
+
+class Color(enum.Enum):
+
+    RED = enum.auto()
+    GREEN = enum.auto()
+
+
+class CountingValidator:
+
+    __slots__ = ("data",)
+
+    def __init__(self) -> None:
+        self.data: List[Any] = []
+
+    def __call__(self, data: Any, /) -> Result[None, TestplatesError]:
+        self.data.append(data)
+
+        return success(None)
+
+
+def test_repr() -> None:
+    fmt = "testplates.memoize_validator({validator}, maxsize=8, policy='fifo')"
+
+    assert (validator_result := string_validator())
+    assert (result := memoize_validator(validator_result, maxsize=8, policy="fifo"))
+
+    validator = unwrap_success(validator_result)
+    assert repr(unwrap_success(result)) == fmt.format(validator=repr(validator))
+
+
+# noinspection PyTypeChecker
+@given(data=st.one_of(st_anything_comparable(), st.integers(min_value=-5, max_value=5)))
+def test_same_outcome(data: Any) -> None:
+    assert (validator_result := integer_validator(minimum=0))
+    assert (result := memoize_validator(validator_result))
+
+    validator = unwrap_success(validator_result)
+    memoized = unwrap_success(result)
+
+    for _ in range(2):
+        if expected := validator(data):
+            assert memoized(data)
+        else:
+            assert not (memoized_result := memoized(data))
+
+            error = unwrap_failure(memoized_result)
+            assert type(error) is type(unwrap_failure(expected))
+            assert error.message == unwrap_failure(expected).message
+
+
+def test_outcome_is_cached() -> None:
+    assert (result := memoize_validator(integer_validator(minimum=0)))
+
+    memoized = unwrap_success(result)
+
+    assert memoized(1)
+    assert memoized(1)
+    assert not (minimum_result := memoized(-1))
+    assert not (bool_result := memoized(True))
+    assert not (type_result := memoized("1"))
+    assert isinstance(unwrap_failure(minimum_result), InvalidMinimumValueError)
+    assert isinstance(unwrap_failure(bool_result), TestplatesError)
+    assert isinstance(unwrap_failure(type_result), InvalidTypeError)
+    assert not memoized(-1)
+
+    assert cache_info(memoized) == CacheInfo(hits=2, misses=4, maxsize=1024, size=4)
+
+
+def test_outcome_is_cached_by_type() -> None:
+    counting = CountingValidator()
+    assert (result := memoize_validator(success(counting)))
+
+    memoized = unwrap_success(result)
+
+    for data in (1, True, 1, True, "a", b"a", "a", Color.RED, Color.RED):
+        assert memoized(data)
+
+    assert counting.data == [1, True, "a", b"a", Color.RED]
+    assert (info := cache_info(memoized)) is not None
+    assert info.hits == 4
+
+
+def test_unhashable_values_are_not_cached() -> None:
+    counting = CountingValidator()
+    assert (result := memoize_validator(success(counting)))
+
+    memoized = unwrap_success(result)
+
+    for data in ([1], [1], 1.5, 1.5):
+        assert memoized(data)
+
+    assert counting.data == [[1], [1], 1.5, 1.5]
+    assert (info := cache_info(memoized)) is not None
+    assert info.size == 0
+
+
+def test_cache_info_of_validator_that_is_not_memoized() -> None:
+    assert (result := integer_validator())
+
+    assert cache_info(unwrap_success(result)) is None
+
+
+def test_lru_policy() -> None:
+    counting = CountingValidator()
+    assert (result := memoize_validator(success(counting), maxsize=2, policy="lru"))
+
+    memoized = unwrap_success(result)
+
+    for data in (1, 2, 1, 3, 1, 2):
+        assert memoized(data)
+
+    assert counting.data == [1, 2, 3, 2]
+
+
+def test_fifo_policy() -> None:
+    counting = CountingValidator()
+    assert (result := memoize_validator(success(counting), maxsize=2, policy="fifo"))
+
+    memoized = unwrap_success(result)
+
+    for data in (1, 2, 1, 3, 1, 2):
+        assert memoized(data)
+
+    assert counting.data == [1, 2, 3, 1, 2]
+
+
+def test_clear() -> None:
+    assert (result := memoize_validator(enum_validator(Color)))
+
+    memoized = unwrap_success(result)
+    assert isinstance(memoized, MemoizedValidator)
+
+    assert memoized(Color.RED)
+    assert memoized(Color.RED)
+
+    memoized.clear()
+
+    assert memoized.size == 0
+    assert memoized.hits == 0
+    assert memoized.misses == 0
+
+
+def test_failure_is_propagated() -> None:
+    assert not (result := integer_validator(minimum=1, maximum=0))
+
+    assert memoize_validator(result) is result
+
+
+# noinspection PyTypeChecker
+@given(maxsize=st.one_of(st.integers(max_value=0), st.booleans(), st.floats()))
+def test_failure_when_cache_size_is_invalid(maxsize: Any) -> None:
+    assert not (result := memoize_validator(string_validator(), maxsize=maxsize))
+
+    error = unwrap_failure(result)
+    assert isinstance(error, InvalidCacheSizeError)
+    assert error.size is maxsize
+
+
+def test_failure_when_eviction_policy_is_invalid() -> None:
+    assert not (result := memoize_validator(string_validator(), policy="lfu"))  # type: ignore
+
+    error = unwrap_failure(result)
+    assert isinstance(error, InvalidEvictionPolicyError)
+    assert error.policy == "lfu"
@@ -0,0 +1,223 @@
+from typing import (
+    Any,
+    Final,
+)
+
+from resultful import (
+    success,
+    failure,
+    unwrap_success,
+    unwrap_failure,
+    Result,
+)
+
+from testplates import (
+    create,
+    field,
+    check_data,
+    check_paths,
+    compile_validator,
+    integer_validator,
+    string_validator,
+    sequence_validator,
+    mapping_validator,
+    union_validator,
+    ErrorRecord,
+    TestplatesError,
+    InvalidTypeError,
+    InvalidMaximumValueError,
+    InvalidMinimumSizeError,
+    FieldValidationError,
+    ItemValidationError,
+    ChoiceValidationError,
+    NoMatchingChoiceError,
+    MultipleValidationError,
+    PathValidationError,
+    RequiredKeyMissingError,
+    UnknownFieldError,
+    MISSING,
+)
+
+ITEM_TYPE: Final = create("Item", price=field(integer_validator(maximum=100)))
+ORDER_TYPE: Final = create("Order", items=field(sequence_validator(mapping_validator(ITEM_TYPE))))
+
+
+def test_success() -> None:
+    assert (validator_result := mapping_validator(ORDER_TYPE))
+
+    validator = unwrap_success(validator_result)
+
+    assert check_data(validator, dict(items=[dict(price=1), dict(price=100)])) is None
+
+
+def test_failure() -> None:
+    assert (validator_result := string_validator(minimum_size=3))
+
+    validator = unwrap_success(validator_result)
+
+    assert (record := check_data(validator, "ab")) is not None
+    assert isinstance(record, ErrorRecord)
+    assert record.error_type is InvalidMinimumSizeError
+    assert record.path == ()
+
+    error = record.to_error()
+    assert isinstance(error, InvalidMinimumSizeError)
+    assert error.data == "ab"
+    assert not (validation_result := validator("ab"))
+    assert error.message == unwrap_failure(validation_result).message
+
+
+def test_failure_with_nested_data() -> None:
+    assert (validator_result := mapping_validator(ORDER_TYPE))
+
+    validator = unwrap_success(validator_result)
+    data = dict(items=[dict(price=1), dict(price=101)])
+
+    assert (record := check_data(validator, data)) is not None
+    assert record.error_type is FieldValidationError
+    assert record.path == ("items", 1, "price")
+
+    error = record.to_error()
+    assert isinstance(error, FieldValidationError)
+    assert error.data is data
+    assert isinstance(item_error := error.error, ItemValidationError)
+    assert item_error.index == 1
+    assert isinstance(field_error := item_error.error, FieldValidationError)
+    assert isinstance(value_error := field_error.error, InvalidMaximumValueError)
+    assert value_error.data == 101
+    assert not (validation_result := validator(data))
+    assert error.message == unwrap_failure(validation_result).message
+
+
+def test_failure_with_union() -> None:
+    choices = {"a": integer_validator(), "b": string_validator()}
+    assert (tagged_result := union_validator(choices))
+    assert (untagged_result := union_validator(choices, untagged=True))
+
+    tagged = unwrap_success(tagged_result)
+    untagged = unwrap_success(untagged_result)
+
+    assert (record := check_data(tagged, ("b", 1))) is not None
+    assert record.path == ("b",)
+    assert isinstance(error := record.to_error(), ChoiceValidationError)
+    assert isinstance(error.error, InvalidTypeError)
+
+    assert (record := check_data(untagged, 1.0)) is not None
+    assert isinstance(error := record.to_error(), NoMatchingChoiceError)
+    assert list(error.errors) == ["a", "b"]
+    assert all(isinstance(item, InvalidTypeError) for item in error.errors.values())
+
+
+def test_failure_with_collected_errors() -> None:
+    item_validator = integer_validator(maximum=5)
+    assert (validator_result := sequence_validator(item_validator, collect_all=True))
+
+    validator = unwrap_success(validator_result)
+
+    assert (record := check_data(validator, [6, 0, "a"])) is not None
+    assert isinstance(error := record.to_error(), MultipleValidationError)
+    assert [item_error.index for item_error in error.errors] == [0, 2]  # type: ignore
+
+
+def test_failure_with_custom_validator() -> None:
+    custom_error = TestplatesError("custom error")
+
+    def validator(data: Any, /) -> Result[None, TestplatesError]:
+        return failure(custom_error)
+
+    assert (record := check_data(validator, 0)) is not None
+    assert record.error_type is TestplatesError
+    assert record.to_error() is custom_error
+
+    assert (sequence_result := sequence_validator(success(validator)))
+
+    sequence = unwrap_success(sequence_result)
+
+    assert (record := check_data(sequence, [0])) is not None
+    assert record.path == (0,)
+    assert isinstance(error := record.to_error(), ItemValidationError)
+    assert error.error is custom_error
+
+
+def test_paths_success() -> None:
+    assert (validator_result := mapping_validator(ORDER_TYPE))
+
+    validator = unwrap_success(validator_result)
+
+    assert check_paths(validator, dict(items=[dict(price=1)])) == []
+
+
+def test_paths_failure() -> None:
+    assert (validator_result := mapping_validator(ORDER_TYPE))
+
+    validator = unwrap_success(validator_result)
+    data = dict(items=[dict(price=1), dict(price=101)])
+
+    (error,) = check_paths(validator, data)
+    assert isinstance(error, PathValidationError)
+    assert error.path == ("items", 1, "price")
+    assert isinstance(error.error, InvalidMaximumValueError)
+    assert error.error.data == 101
+    assert error.message == f"Validation failure at path ('items', 1, 'price'): {error.error!r}"
+
+
+def test_paths_failure_with_collected_errors() -> None:
+    item_type = create("Item", price=field(integer_validator(maximum=100)), name=field())
+    items_validator = sequence_validator(mapping_validator(item_type, collect_all=True))
+    order_type = create("Order", items=field(items_validator))
+    assert (validator_result := mapping_validator(order_type))
+
+    validator = unwrap_success(validator_result)
+    data = dict(items=[dict(price=1, name="a"), dict(price=101), dict(price=102, name="c")])
+
+    errors = check_paths(validator, data)
+    assert [error.path for error in errors] == [("items", 1, "name"), ("items", 1, "price")]
+    assert isinstance(missing_error := errors[0].error, RequiredKeyMissingError)
+    assert missing_error.key == "name"
+    assert missing_error.data is MISSING
+    assert isinstance(errors[1].error, InvalidMaximumValueError)
+
+    assert (collecting_result := sequence_validator(items_validator, collect_all=True))
+
+    collecting_validator = unwrap_success(collecting_result)
+
+    errors = check_paths(collecting_validator, [[], data["items"], [dict(price=0)]])
+    assert [error.path for error in errors] == [(1, 1, "name"), (1, 1, "price"), (2, 0, "name")]
+
+
+def test_paths_failure_with_unknown_field() -> None:
+    assert (validator_result := mapping_validator(ITEM_TYPE))
+
+    validator = unwrap_success(validator_result)
+    data = dict(price=1, name="a")
+
+    (error,) = check_paths(validator, data)
+    assert error.path == ("name",)
+    assert isinstance(unknown_error := error.error, UnknownFieldError)
+    assert unknown_error.key == "name"
+    assert unknown_error.data == "a"
+
+    assert (record := check_data(validator, data)) is not None
+    assert record.path == ("name",)
+    assert isinstance(full_error := record.to_error(), UnknownFieldError)
+    assert full_error.data is data
+
+
+def test_paths_failure_with_compiled_validator() -> None:
+    items_validator = compile_validator(sequence_validator(integer_validator(maximum=5)))
+    structure_type = create("Structure", xs=field(items_validator))
+    assert (validator_result := mapping_validator(structure_type))
+
+    validator = unwrap_success(validator_result)
+    data = dict(xs=[1, 9])
+
+    (error,) = check_paths(validator, data)
+    assert error.path == ("xs", 1)
+    assert isinstance(error.error, InvalidMaximumValueError)
+    assert error.error.data == 9
+
+    assert (record := check_data(validator, data)) is not None
+    assert record.path == ("xs", 1)
+    assert isinstance(field_error := record.to_error(), FieldValidationError)
+    assert isinstance(item_error := field_error.error, ItemValidationError)
+    assert isinstance(item_error.error, InvalidMaximumValueError)
@@ -1,4 +1,5 @@
 import sys
+import array
 
 from typing import (
     Any,
@@ -25,6 +26,8 @@ from hypothesis import (
 
 from testplates import (
     sequence_validator,
+    integer_validator,
+    string_validator,
     TestplatesError,
     InvalidTypeError,
     InvalidSizeError,
@@ -34,6 +37,8 @@ from testplates import (
     SingleMatchBoundariesError,
     UniquenessError,
     ItemValidationError,
+    MultipleValidationError,
+    InvalidErrorLimitError,
 )
 
 from tests.utils import sample
@@ -376,3 +381,275 @@ def test_failure_when_data_item_validation_fails(value: Any, message: str) -> No
     assert error.data == [value]
     assert error.item == value
     assert error.error == item_error
+
+
+def validate_items(item_validator: Any, data: Sequence[Any]) -> Result[None, TestplatesError]:
+    for item in data:
+        if not (result := item_validator(item)):
+            return failure(ItemValidationError(data, item, unwrap_failure(result)))
+
+    return success(None)
+
+
+# noinspection PyTypeChecker
+@given(items=st.lists(st.integers(min_value=-5, max_value=300)), allow_bool=st.booleans())
+def test_integer_items(items: List[int], allow_bool: bool) -> None:
+    assert (item_result := integer_validator(minimum=0, maximum=255, allow_bool=allow_bool))
+    assert (validator_result := sequence_validator(item_result))
+
+    item_validator = unwrap_success(item_result)
+    validator = unwrap_success(validator_result)
+
+    for data in (
+        items,
+        items + [True],
+        items + [1.0],
+        array.array("q", items),
+        array.array("d", items),
+        memoryview(array.array("q", items)),
+    ):
+        expected = validate_items(item_validator, data)
+
+        if expected:
+            assert validator(data)
+        else:
+            assert not (validation_result := validator(data))
+
+            error = unwrap_failure(validation_result)
+            expected_error = unwrap_failure(expected)
+            assert isinstance(error, ItemValidationError)
+            assert isinstance(expected_error, ItemValidationError)
+            assert error.item == expected_error.item
+            assert type(error.error) is type(expected_error.error)
+
+
+# noinspection PyTypeChecker
+@given(items=st.lists(st.one_of(st.text(max_size=5), st.binary(max_size=5))))
+def test_string_items(items: List[Any]) -> None:
+    assert (item_result := string_validator(minimum_size=1, maximum_size=4))
+    assert (validator_result := sequence_validator(item_result))
+
+    item_validator = unwrap_success(item_result)
+    validator = unwrap_success(validator_result)
+
+    expected = validate_items(item_validator, items)
+
+    if expected:
+        assert validator(items)
+    else:
+        assert not (validation_result := validator(items))
+
+        error = unwrap_failure(validation_result)
+        expected_error = unwrap_failure(expected)
+        assert isinstance(error, ItemValidationError)
+        assert isinstance(expected_error, ItemValidationError)
+        assert error.item == expected_error.item
+        assert type(error.error) is type(expected_error.error)
+
+
+def test_failure_when_size_is_checked_before_items() -> None:
+    def item_validator(this_value: Any, /) -> Result[None, TestplatesError]:
+        raise AssertionError(this_value)
+
+    assert (validator_result := sequence_validator(success(item_validator), maximum_size=2))
+
+    validator = unwrap_success(validator_result)
+    assert not (validation_result := validator([1, 2, 3]))
+
+    error = unwrap_failure(validation_result)
+    assert isinstance(error, InvalidMaximumSizeError)
+
+
+def test_failure_when_item_is_invalid_after_duplicate() -> None:
+    assert (item_result := integer_validator(maximum=5))
+    assert (validator_result := sequence_validator(item_result, unique_items=True))
+
+    validator = unwrap_success(validator_result)
+    assert not (validation_result := validator([1, 1, 2, 6]))
+
+    error = unwrap_failure(validation_result)
+    assert isinstance(error, ItemValidationError)
+    assert error.item == 6
+
+
+# noinspection PyTypeChecker
+@given(data=st.lists(st_hashable(), min_size=1, unique=True))
+def test_failure_when_value_is_not_unique_and_items_are_validated(data: List[Hashable]) -> None:
+    data.append(sample(data))
+
+    def item_validator(this_value: Any, /) -> Result[None, TestplatesError]:
+        return success(None)
+
+    assert (validator_result := sequence_validator(success(item_validator), unique_items=True))
+
+    validator = unwrap_success(validator_result)
+    assert not (validation_result := validator(data))
+
+    error = unwrap_failure(validation_result)
+    assert isinstance(error, UniquenessError)
+    assert error.data == data
+
+
+def st_nested() -> st.SearchStrategy[Any]:
+    return st.recursive(
+        st.one_of(
+            st.none(), st.booleans(), st.integers(min_value=0, max_value=3), st.text(max_size=1)
+        ),
+        lambda children: st.one_of(
+            st.lists(children, max_size=3),
+            st.tuples(children, children),
+            st.dictionaries(st.text(max_size=1), children, max_size=3),
+            st.sets(st.integers(min_value=0, max_value=3), max_size=2),
+        ),
+        max_leaves=6,
+    )
+
+
+# noinspection PyTypeChecker
+@given(data=st.lists(st_nested(), max_size=6))
+def test_unique_unhashable_items(data: List[Any]) -> None:
+    expected = all(first != second for index, first in enumerate(data) for second in data[:index])
+
+    assert (validator_result := sequence_validator(unique_items=True))
+
+    validator = unwrap_success(validator_result)
+    validation_result = validator(data)
+
+    assert bool(validation_result) is expected
+
+    if not expected:
+        error = unwrap_failure(validation_result)
+        assert isinstance(error, UniquenessError)
+
+
+class Unorderable:
+
+    __slots__ = ("value",)
+
+    __hash__ = None  # type: ignore
+
+    def __init__(self, value: int) -> None:
+        self.value = value
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, Unorderable) and self.value == other.value
+
+
+def test_unique_unorderable_items() -> None:
+    assert (validator_result := sequence_validator(unique_items=True))
+
+    validator = unwrap_success(validator_result)
+    item = Unorderable(1)
+    nested_item = [Unorderable(1)]
+
+    assert validator([Unorderable(1), Unorderable(2), [Unorderable(1)]])
+    assert validator([[1, 2], [2, 1], [3]])
+    assert not validator([nested_item, Unorderable(2), Unorderable(3), nested_item])
+    assert not validator([item, Unorderable(2), item])
+    assert not validator([Unorderable(1), Unorderable(2), Unorderable(1)])
+    assert not validator([{"a": [1]}, {"a": [1.0]}])
+    assert not validator([[1], [True]])
+
+
+def test_failure_when_all_errors_are_collected() -> None:
+    assert (item_result := integer_validator(maximum=5))
+    assert (
+        validator_result := sequence_validator(item_result, unique_items=True, collect_all=True)
+    )
+
+    validator = unwrap_success(validator_result)
+    assert validator([1, 2, 3])
+    assert not (validation_result := validator([1, 7, 1, "a", 9]))
+
+    error = unwrap_failure(validation_result)
+    assert isinstance(error, MultipleValidationError)
+    assert error.data == [1, 7, 1, "a", 9]
+    assert [type(item_error) for item_error in error.errors] == [
+        ItemValidationError,
+        ItemValidationError,
+        ItemValidationError,
+        UniquenessError,
+    ]
+    assert [getattr(item_error, "index", None) for item_error in error.errors] == [1, 3, 4, None]
+
+
+# noinspection PyTypeChecker
+@given(items=st.lists(st.one_of(st.integers(min_value=0, max_value=7), st.text(max_size=1))))
+def test_first_collected_error_matches_error(items: List[Any]) -> None:
+    item_result = integer_validator(maximum=5)
+    assert (validator_result := sequence_validator(item_result, unique_items=True))
+    assert (
+        collecting_result := sequence_validator(item_result, unique_items=True, collect_all=True)
+    )
+
+    validator = unwrap_success(validator_result)
+    collecting_validator = unwrap_success(collecting_result)
+
+    if validator(items):
+        assert collecting_validator(items)
+    else:
+        assert not (validation_result := validator(items))
+        assert not (collecting_validation_result := collecting_validator(items))
+
+        error = unwrap_failure(validation_result)
+        collected_error = unwrap_failure(collecting_validation_result)
+        assert isinstance(collected_error, MultipleValidationError)
+        assert repr(error) == repr(collected_error.errors[0])
+
+
+def test_failure_when_errors_limit_is_reached() -> None:
+    assert (item_result := integer_validator(maximum=5))
+    assert (validator_result := sequence_validator(item_result, collect_all=True, max_errors=2))
+
+    validator = unwrap_success(validator_result)
+    assert not (validation_result := validator([6, 0, 7, 8, 9]))
+
+    error = unwrap_failure(validation_result)
+    assert isinstance(error, MultipleValidationError)
+    assert len(error.errors) == 2
+    assert [
+        item_error.index
+        for item_error in error.errors
+        if isinstance(item_error, ItemValidationError)
+    ] == [0, 2]
+
+
+# noinspection PyTypeChecker
+@given(max_errors=st.one_of(st.integers(max_value=0), st.booleans(), st.floats()))
+def test_failure_when_errors_limit_is_invalid(max_errors: Any) -> None:
+    assert not (validator_result := sequence_validator(collect_all=True, max_errors=max_errors))
+
+    error = unwrap_failure(validator_result)
+    assert isinstance(error, InvalidErrorLimitError)
+    assert error.limit is max_errors
+
+
+def test_failure_message_with_large_data() -> None:
+    data = list(range(1_000_000))
+
+    assert (validator_result := sequence_validator(maximum_size=10))
+
+    validator = unwrap_success(validator_result)
+    assert not (validation_result := validator(data))
+
+    error = unwrap_failure(validation_result)
+    assert isinstance(error, InvalidMaximumSizeError)
+    assert error.data is data
+    assert error.message.startswith("Invalid size 1000000 of data [0, 1, 2,")
+    assert error.message.endswith(", ...] (maximum allowed size: maximum=10)")
+    assert len(error.message) < 1000
+    assert str(error) == error.message
+    assert repr(error) == f"InvalidMaximumSizeError({error.message!r})"
+
+
+def test_failure_message_with_nested_error() -> None:
+    assert (item_result := integer_validator(maximum=5))
+    assert (validator_result := sequence_validator(item_result))
+
+    validator = unwrap_success(validator_result)
+    assert not (validation_result := validator([1, 7]))
+
+    error = unwrap_failure(validation_result)
+    assert isinstance(error, ItemValidationError)
+    assert error.message == f"Item 7 validation failure in [1, 7]: {error.error!r}"
+    assert error.error.message == "Invalid value 7 (maximum allowed value: maximum=5)"
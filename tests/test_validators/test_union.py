@@ -1,5 +1,6 @@
 from typing import (
     Any,
+    List,
     Dict,
     NoReturn,
 )
@@ -22,12 +23,15 @@ from hypothesis import (
 from testplates import (
     union_validator,
     passthrough_validator,
+    integer_validator,
+    string_validator,
     Validator,
     TestplatesError,
     InvalidKeyError,
     InvalidTypeError,
     InvalidDataFormatError,
     ChoiceValidationError,
+    NoMatchingChoiceError,
 )
 
 from tests.utils import (
@@ -164,3 +168,85 @@ def test_failure_when_data_field_validation_fails(
     assert isinstance(error, ChoiceValidationError)
     assert error.data == (key, value)
     assert error.error == choice_error
+
+
+# noinspection PyTypeChecker
+@given(choices=st_choices(min_size=1), value=st_anything_comparable())
+def test_success_with_sequence(choices: Dict[str, AlwaysSuccess[Validator]], value: Any) -> None:
+    key = sample(choices)
+    choices[key] = passthrough_validator()
+    assert (validator_result := union_validator(choices, accept_sequences=True))
+
+    validator = unwrap_success(validator_result)
+    assert validator([key, value])
+    assert validator((key, value))
+    assert not validator([key, value, value])
+
+
+def test_failure_when_sequence_is_string() -> None:
+    assert (validator_result := union_validator({"a": string_validator()}, accept_sequences=True))
+
+    validator = unwrap_success(validator_result)
+    assert not (validation_result := validator("ab"))
+
+    error = unwrap_failure(validation_result)
+    assert isinstance(error, InvalidTypeError)
+    assert error.data == "ab"
+
+
+def test_failure_when_key_is_not_hashable() -> None:
+    assert (validator_result := union_validator({"a": string_validator()}))
+
+    validator = unwrap_success(validator_result)
+    key: List[Any] = []
+    assert not (validation_result := validator((key, "a")))
+
+    error = unwrap_failure(validation_result)
+    assert isinstance(error, InvalidKeyError)
+    assert error.data[0] is key
+    assert error.message == f"Invalid key {key!r} found in data {error.data!r}"
+
+
+def test_untagged() -> None:
+    choices = {"integer": integer_validator(), "string": string_validator()}
+    assert (validator_result := union_validator(choices, untagged=True))
+
+    validator = unwrap_success(validator_result)
+    assert validator(1)
+    assert validator("a")
+    assert not (validation_result := validator(b"a"))
+
+    error = unwrap_failure(validation_result)
+    assert isinstance(error, NoMatchingChoiceError)
+    assert error.data == b"a"
+    assert list(error.errors) == ["integer", "string"]
+    assert all(
+        isinstance(choice_error, InvalidTypeError) for choice_error in error.errors.values()
+    )
+
+
+def test_untagged_order_is_learned() -> None:
+    calls = []
+
+    def choice(name: str, accepted: type) -> Result[Validator, TestplatesError]:
+        def validator(data: Any, /) -> Result[None, TestplatesError]:
+            calls.append(name)
+
+            if isinstance(data, accepted):
+                return success(None)
+
+            return failure(TestplatesError(name))
+
+        return success(validator)
+
+    choices = {"integer": choice("integer", int), "string": choice("string", str)}
+    assert (validator_result := union_validator(choices, untagged=True))
+
+    validator = unwrap_success(validator_result)
+    assert validator("a")
+    assert calls == ["integer", "string"]
+
+    calls.clear()
+    assert validator("a")
+    assert validator(1)
+    assert calls == ["string", "string", "integer"]